@@ -0,0 +1,50 @@
+"""Time automatic placement of a synthetic netlist.
+
+Run with ``uv run python benchmarks/bench_autoplace.py [--components N]``.
+"""
+
+import argparse
+import random
+import time
+
+import earthground.components as cmp
+from earthground.autoplace import auto_place
+from earthground.schematic import Design
+
+
+def _design(count: int) -> Design:
+    rng = random.Random(1)
+    design = Design("BENCH")
+    parts = [
+        design.add_component(
+            cmp.Resistor(100) if index % 2 else cmp.Capacitor("1u", 10)
+        )
+        for index in range(count)
+    ]
+    for index, part in enumerate(parts):
+        neighbour = parts[(index + 1) % count]
+        if rng.random() > 0.7:
+            neighbour = rng.choice(parts)
+        design.join_net(part.pins[2], f"N{index}")
+        if neighbour.pins[1] not in design.pin_to_net:
+            design.join_net(neighbour.pins[1], f"N{index}")
+    return design
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=5000)
+    args = parser.parse_args()
+
+    design = _design(args.components)
+    start = time.perf_counter()
+    result = auto_place(design)
+    elapsed = time.perf_counter() - start
+    print(
+        f"placed {len(result.placements)} components in {elapsed:.2f} s; "
+        f"HPWL {result.initial_wirelength:.1f} -> {result.wirelength:.1f} mm"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare peak RSS of whole-string and streamed ``.kicad_pcb`` writes.
+
+Run with ``uv run python benchmarks/bench_board_write.py [--components N]``.
+Each write runs in a fresh interpreter so the peaks do not mix.
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pykicad import write_to_file
+
+import earthground.exporters.kicad as kicad
+import earthground.exporters.kicad_board_text as kicad_board_text
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_kicad_export import _design  # noqa: E402
+
+
+def _peak_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(mode: str, components: int) -> None:
+    design = _design(components)
+    exporter = kicad.KicadExporter(design)
+    exporter.convert_to_kicad(design)
+    before = _peak_rss_mib()
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "bench.kicad_pcb"
+        start = time.perf_counter()
+        if mode == "string":
+            write_to_file(exporter.board, path)
+        else:
+            kicad_board_text.write_board(path, exporter.board)
+        elapsed = time.perf_counter() - start
+        size = path.stat().st_size / 2**20
+    after = _peak_rss_mib()
+    print(
+        f"{mode:>6}: {size:.0f} MiB file in {elapsed:.1f} s; peak RSS "
+        f"{before:.0f} MiB after building, {after:.0f} MiB after writing "
+        f"(+{after - before:.0f} MiB)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=20000)
+    parser.add_argument("--mode", choices=("string", "stream"))
+    args = parser.parse_args()
+
+    if args.mode:
+        _run(args.mode, args.components)
+        return
+    for mode in ("string", "stream"):
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--components",
+                str(args.components),
+                "--mode",
+                mode,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Time the routed-connectivity check on a synthetic, fully routed board.
+
+Run with ``uv run python benchmarks/bench_connectivity.py [--components N]``.
+"""
+
+import argparse
+import time
+
+import earthground.components as cmp
+import earthground.layout as layout_lib
+from earthground.schematic import Design
+
+
+def _design(count: int, segments: int) -> Design:
+    design = Design("BENCH")
+    columns = int(count**0.5) or 1
+    parts = []
+    for index in range(count):
+        part = design.add_component(cmp.Resistor(100))
+        refdes = f"R{index + 1}"
+        design.layout.placement[refdes] = layout_lib.Placement(
+            layout_lib.Position((index % columns) * 4, (index // columns) * 3, 0)
+        )
+        parts.append((refdes, part))
+    tracks = []
+    for index, ((first_id, first), (second_id, second)) in enumerate(
+        zip(parts, parts[1:])
+    ):
+        if index % columns == columns - 1:
+            continue
+        net = f"N{index}"
+        design.connect([first.pins[2], second.pins[1]], net)
+        start = _pad_center(design, first_id, 2)
+        end = _pad_center(design, second_id, 1)
+        # Break each connection into short collinear pieces to reach the
+        # requested segment count.
+        for step in range(segments):
+            a, b = step / segments, (step + 1) / segments
+            tracks.append(
+                layout_lib.TrackSegment(
+                    layout_lib.LayoutPoint(start.x + (end.x - start.x) * a, start.y),
+                    layout_lib.LayoutPoint(start.x + (end.x - start.x) * b, start.y),
+                    0.2,
+                    "F.Cu",
+                    net,
+                )
+            )
+    design.layout.tracks = tracks
+    return design
+
+
+def _pad_center(design, refdes, number):
+    component = design.components[refdes]
+    placement = design.layout.placement[refdes]
+    return layout_lib.transform_bbox(
+        component.footprint.get_pad_bbox(number), placement.position
+    ).center()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=5000)
+    parser.add_argument("--segments-per-net", type=int, default=8)
+    args = parser.parse_args()
+
+    design = _design(args.components, args.segments_per_net)
+    start = time.perf_counter()
+    report = design.connectivity_report()
+    elapsed = time.perf_counter() - start
+    print(
+        f"checked {len(design.layout.tracks)} segments and "
+        f"{args.components * 2} pads in {elapsed:.2f} s; "
+        f"{len(report.unrouted)} unrouted, {len(report.shorts)} shorts"
+    )
+
+
+if __name__ == "__main__":
+    main()
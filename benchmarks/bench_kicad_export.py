@@ -0,0 +1,79 @@
+"""Time KiCad footprint rendering per worker count and full vs incremental saves.
+
+Run with ``uv run python benchmarks/bench_kicad_export.py [--components N]
+[--workers W ...]``. Worker counts above the machine's CPU count only add
+process overhead, so compare them on a host with at least that many cores.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import earthground.components as cmp
+import earthground.exporters.kicad as kicad
+import earthground.layout as layout_lib
+from earthground.schematic import Design
+
+
+def _design(count: int, last_value: str = "100") -> Design:
+    design = Design("BENCH")
+    columns = int(count**0.5) or 1
+    previous = None
+    for index in range(count):
+        value = last_value if index == count - 1 else "100"
+        part = design.add_component(cmp.Resistor(value))
+        design.layout.placement[f"R{index + 1}"] = layout_lib.Placement(
+            layout_lib.Position((index % columns) * 4, (index // columns) * 3, 0)
+        )
+        if previous is not None:
+            design.connect([previous.pins[2], part.pins[1]], f"N{index}")
+        previous = part
+    return design
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=3000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    design = _design(args.components)
+    print(f"{os.cpu_count()} CPU(s) available")
+    for workers in args.workers:
+        exporter = kicad.KicadExporter(design, workers=workers)
+        jobs = exporter.footprint_jobs(design)
+        start = time.perf_counter()
+        rendered = kicad.render_footprints(jobs, exporter.templates, workers=workers)
+        render = time.perf_counter() - start
+        with (
+            tempfile.TemporaryDirectory() as folder,
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            start = time.perf_counter()
+            kicad.KicadExporter(design, workers=workers).save(folder)
+            save = time.perf_counter() - start
+        print(
+            f"{workers} worker(s): {len(rendered)} footprints rendered in "
+            f"{render:.2f} s, full save {save:.2f} s"
+        )
+
+    with (
+        tempfile.TemporaryDirectory() as folder,
+        contextlib.redirect_stdout(io.StringIO()),
+    ):
+        start = time.perf_counter()
+        kicad.KicadExporter(design).save(folder)
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        kicad.KicadExporter(_design(args.components, "220")).save(
+            folder, incremental=True
+        )
+        incremental = time.perf_counter() - start
+    print(f"full save {full:.2f} s, incremental save of one change {incremental:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Time a panel export against exporting the same board once per copy.
+
+Run with ``uv run python benchmarks/bench_kicad_panel.py [--components N]
+[--columns C] [--rows R]``.
+"""
+
+import argparse
+import contextlib
+import io
+import pathlib
+import tempfile
+import time
+
+import earthground.exporters.kicad as kicad
+from benchmarks.bench_kicad_export import _design
+from earthground.exporters.kicad_panel import KicadPanelExporter, panel_grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=6)
+    args = parser.parse_args()
+
+    copies = panel_grid(args.columns, args.rows, 200, 200)
+    with (
+        tempfile.TemporaryDirectory() as folder,
+        contextlib.redirect_stdout(io.StringIO()),
+    ):
+        start = time.perf_counter()
+        kicad.KicadExporter(_design(args.components)).save(folder)
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        path = KicadPanelExporter(_design(args.components), copies).save(folder)
+        panel = time.perf_counter() - start
+        size = pathlib.Path(path).stat().st_size
+    print(
+        f"{len(copies)} copies of {args.components} footprints: panel {panel:.2f} s "
+        f"({size / 2**20:.1f} MiB), one board {single:.2f} s, "
+        f"{len(copies)} boards ~{single * len(copies):.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
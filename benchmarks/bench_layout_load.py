@@ -0,0 +1,93 @@
+"""Time layout sidecar loading for a synthetic routed board.
+
+Run with ``uv run python benchmarks/bench_layout_load.py [--tracks N]``.
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+import yaml
+
+import earthground.components as cmp
+import earthground.layout as layout_lib
+from earthground.models.layout_models import LayoutFileModel
+from earthground.schematic import Design
+
+
+def _write_sidecar(path: pathlib.Path, track_count: int) -> None:
+    document = {
+        "schema_version": 1,
+        "placements": {
+            f"R{index}": {"x": index * 2.0, "y": 0.0, "rotation": 0.0}
+            for index in range(1, 1001)
+        },
+        "tracks": [
+            {
+                "type": "segment",
+                "net": f"N{index % 500}",
+                "layer": "F.Cu" if index % 2 else "B.Cu",
+                "width": 0.2,
+                "start": {"x": index * 0.1, "y": 1.0},
+                "end": {"x": index * 0.1 + 0.5, "y": 2.0},
+            }
+            for index in range(track_count)
+        ],
+        "vias": [
+            {
+                "net": f"N{index}",
+                "position": {"x": index * 1.0, "y": 5.0},
+                "diameter": 0.6,
+                "drill": 0.3,
+            }
+            for index in range(500)
+        ],
+    }
+    path.write_text(yaml.safe_dump(document, sort_keys=False), encoding="utf-8")
+
+
+def _timed(label: str, function) -> float:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=40_000)
+    args = parser.parse_args()
+
+    design = Design("BENCH")
+    for _ in range(1000):
+        design.add_component(cmp.Resistor(100))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "layout.yaml"
+        _write_sidecar(path, args.tracks)
+        print(f"{args.tracks} tracks, {path.stat().st_size / 1e6:.1f} MB sidecar")
+
+        def pure_python():
+            with open(path, encoding="utf-8") as f:
+                LayoutFileModel.model_validate(yaml.safe_load(f))
+
+        _timed("yaml.safe_load + validation", pure_python)
+        _timed(
+            "load_layout_from_yaml",
+            lambda: design.layout.load_layout_from_yaml(path),
+        )
+        _timed(
+            "load_layout_from_yaml (cold cache)",
+            lambda: design.layout.load_layout_from_yaml(path, use_cache=True),
+        )
+        _timed(
+            "load_layout_from_yaml (warm cache)",
+            lambda: design.layout.load_layout_from_yaml(path, use_cache=True),
+        )
+        print(f"cache mirror: {layout_lib.layout_cache_path(path).name}")
+
+
+if __name__ == "__main__":
+    main()
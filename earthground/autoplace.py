@@ -0,0 +1,423 @@
+"""Automatic placement for components without an explicit layout position."""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import earthground.components as cmp
+import earthground.layout as layout_lib
+from earthground.analysis import DesignAnalysis
+from earthground.footprint_types import BoundingBox
+from earthground.wirelength import DEFAULT_MAX_NET_DEGREE, half_perimeter
+
+if TYPE_CHECKING:
+    import earthground.schematic as sch_lib
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CLEARANCE = 0.5
+_SWAP_CANDIDATES = 8
+
+
+@dataclass(frozen=True)
+class AutoPlacementResult:
+    placements: dict[str, layout_lib.Placement]
+    fixed: tuple[str, ...]
+    initial_wirelength: float
+    wirelength: float
+
+
+@dataclass
+class _Item:
+    refdes: str
+    bbox: BoundingBox
+    fixed: bool
+
+
+def footprint_bbox(component: cmp.Component) -> BoundingBox:
+    """Footprint-local courtyard box, or a module's block outline."""
+    if isinstance(component, cmp.ModuleComponent):
+        return module_bbox(component.parent)
+    return layout_lib.courtyard_bbox(component)
+
+
+def module_bbox(design: "sch_lib.Design") -> BoundingBox:
+    """Bounding box of a module's physical parts in the module's own frame."""
+    boxes = [
+        layout_lib.transform_bbox(
+            footprint_bbox(item.component),
+            item.layout.component,
+            item.layout.layer,
+        )
+        for item in design.layout.flattened().placements.values()
+        if not item.component.virtual
+    ]
+    if not boxes:
+        return layout_lib.DEFAULT_FOOTPRINT_BBOX
+    return BoundingBox(
+        min(box.x1 for box in boxes),
+        min(box.y1 for box in boxes),
+        max(box.x2 for box in boxes),
+        max(box.y2 for box in boxes),
+    )
+
+
+def _top_level_owners(design: "sch_lib.Design") -> dict[cmp.Component, str]:
+    owners = {}
+    for cid, component in design.components.items():
+        if isinstance(component, cmp.ModuleComponent):
+            for child in component.parent.iter_components():
+                owners[child] = cid
+        elif not component.virtual:
+            owners[component] = cid
+    return owners
+
+
+def _net_members(
+    design: "sch_lib.Design", index: dict[str, int], max_net_degree: int
+) -> list[list[int]]:
+    owners = _top_level_owners(design)
+    nets = []
+    for net in DesignAnalysis(design).nets.values():
+        members = {
+            index[owners[pin.parent]]
+            for pin in net.connections
+            if pin.parent in owners and owners[pin.parent] in index
+        }
+        # Power and ground nets span the board and are served by planes; they
+        # carry no useful placement signal and dominate the cost if included.
+        if 2 <= len(members) <= max_net_degree:
+            nets.append(sorted(members))
+    return nets
+
+
+class _Grid:
+    """Uniform-grid index of rectangles for overlap queries."""
+
+    def __init__(self, cell: float):
+        self.cell = cell
+        self.cells: dict[tuple[int, int], list[BoundingBox]] = {}
+
+    def _keys(self, box: BoundingBox) -> Iterable[tuple[int, int]]:
+        cell = self.cell
+        for gx in range(math.floor(box.x1 / cell), math.floor(box.x2 / cell) + 1):
+            for gy in range(math.floor(box.y1 / cell), math.floor(box.y2 / cell) + 1):
+                yield gx, gy
+
+    def add(self, box: BoundingBox) -> None:
+        for key in self._keys(box):
+            self.cells.setdefault(key, []).append(box)
+
+    def first_overlap(self, box: BoundingBox) -> Optional[BoundingBox]:
+        for key in self._keys(box):
+            for other in self.cells.get(key, ()):
+                if (
+                    box.x1 < other.x2
+                    and other.x1 < box.x2
+                    and box.y1 < other.y2
+                    and other.y1 < box.y2
+                ):
+                    return other
+        return None
+
+
+class AutoPlacer:
+    """
+    Shelf-pack unplaced parts, then refine wirelength by swapping equal-size parts.
+
+    Explicit placements are fixed obstacles and anchor the net bounding boxes.
+    Modules are placed as rigid blocks; only the top-level placement map of
+    ``design`` is written, matching what the layout sidecar can express.
+    """
+
+    def __init__(
+        self,
+        design: "sch_lib.Design",
+        *,
+        clearance: float = DEFAULT_CLEARANCE,
+        max_net_degree: int = DEFAULT_MAX_NET_DEGREE,
+        passes: int = 4,
+    ):
+        self.design = design
+        self.clearance = clearance
+        self.passes = passes
+        layout = design.layout
+        self.items: list[_Item] = []
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        for cid in sorted(design.components):
+            component = design.components[cid]
+            if component.virtual and not isinstance(component, cmp.ModuleComponent):
+                continue
+            bbox = footprint_bbox(component)
+            fixed = cid in layout.placement
+            if fixed:
+                placement = layout.placement[cid]
+                center = layout_lib.transform_bbox(
+                    bbox, placement.position, placement.layer
+                ).center()
+            else:
+                center = bbox.center()
+            self.items.append(_Item(cid, bbox, fixed))
+            self.xs.append(center.x)
+            self.ys.append(center.y)
+        index = {item.refdes: position for position, item in enumerate(self.items)}
+        self.nets = _net_members(design, index, max_net_degree)
+        self.item_nets: list[list[int]] = [[] for _ in self.items]
+        for net_index, members in enumerate(self.nets):
+            for member in members:
+                self.item_nets[member].append(net_index)
+
+    def net_wirelength(self, net_index: int) -> float:
+        members = self.nets[net_index]
+        return half_perimeter(
+            [self.xs[member] for member in members],
+            [self.ys[member] for member in members],
+        )
+
+    def wirelength(self) -> float:
+        return sum(self.net_wirelength(index) for index in range(len(self.nets)))
+
+    def _cluster_order(self, movable: list[int]) -> list[int]:
+        """Order movable parts so connected parts land on neighbouring shelves."""
+        remaining = set(movable)
+        order = []
+        seeds = sorted(movable, key=lambda item: -len(self.item_nets[item]))
+        for seed in seeds:
+            if seed not in remaining:
+                continue
+            remaining.discard(seed)
+            queue = deque([seed])
+            while queue:
+                current = queue.popleft()
+                order.append(current)
+                for net_index in self.item_nets[current]:
+                    for member in self.nets[net_index]:
+                        if member in remaining:
+                            remaining.discard(member)
+                            queue.append(member)
+        return order
+
+    def _pack(self, movable: list[int]) -> None:
+        clearance = self.clearance
+        obstacles = [
+            layout_lib.transform_bbox(
+                item.bbox,
+                self.design.layout.placement[item.refdes].position,
+                self.design.layout.placement[item.refdes].layer,
+            )
+            for item in self.items
+            if item.fixed
+        ]
+        sizes = [
+            (
+                self.items[item].bbox.width() + clearance,
+                self.items[item].bbox.height() + clearance,
+            )
+            for item in movable
+        ]
+        outline = self.design.layout.outline
+        if outline.width() > 0 and outline.height() > 0:
+            left, top, right = outline.x1, outline.y1, outline.x2
+        else:
+            area = sum(width * height for width, height in sizes)
+            row = max([math.sqrt(area * 1.5)] + [width for width, _ in sizes])
+            if obstacles:
+                left = max(box.x2 for box in obstacles) + clearance
+                top = min(box.y1 for box in obstacles)
+            else:
+                left, top = 0.0, 0.0
+            right = left + row
+
+        mean_size = (
+            sum(width + height for width, height in sizes) / (2 * len(sizes))
+            if sizes
+            else 1.0
+        )
+        grid = _Grid(max(mean_size * 4, 1.0))
+        for box in obstacles:
+            grid.add(
+                BoundingBox(
+                    box.x1 - clearance / 2,
+                    box.y1 - clearance / 2,
+                    box.x2 + clearance / 2,
+                    box.y2 + clearance / 2,
+                )
+            )
+
+        x, y, shelf, floor = left, top, 0.0, math.inf
+        for item, (width, height) in zip(movable, sizes):
+            while True:
+                if x + width > right and x > left:
+                    # An empty shelf can only be blocked by obstacles, so
+                    # continue below the highest of them.
+                    y = y + shelf if shelf else max(floor, y + height)
+                    x, shelf, floor = left, 0.0, math.inf
+                slot = BoundingBox(x, y, x + width, y + height)
+                blocker = grid.first_overlap(slot)
+                if blocker is None:
+                    break
+                x = blocker.x2
+                floor = min(floor, blocker.y2)
+            shelf = max(shelf, height)
+            self.xs[item] = x + width / 2
+            self.ys[item] = y + height / 2
+            x += width
+
+        if (
+            outline.width() > 0
+            and outline.height() > 0
+            and y + shelf > outline.y2
+            and movable
+        ):
+            log.warning(
+                "Automatic placement of %s overflows the board outline by %.2f mm",
+                self.design.name,
+                y + shelf - outline.y2,
+            )
+
+    def _refine(self, movable: list[int]) -> None:
+        groups: dict[tuple[float, float], list[int]] = {}
+        for item in movable:
+            bbox = self.items[item].bbox
+            groups.setdefault(
+                (round(bbox.width(), 3), round(bbox.height(), 3)), []
+            ).append(item)
+        swappable = [group for group in groups.values() if len(group) > 1]
+        if not swappable:
+            return
+
+        net_cost = [self.net_wirelength(index) for index in range(len(self.nets))]
+        xs, ys = self.xs, self.ys
+        for _ in range(self.passes):
+            improved = 0
+            for group in swappable:
+                cell = (
+                    max(
+                        self.items[group[0]].bbox.width(),
+                        self.items[group[0]].bbox.height(),
+                    )
+                    + self.clearance
+                )
+                buckets: dict[tuple[int, int], list[int]] = {}
+                for item in group:
+                    key = (math.floor(xs[item] / cell), math.floor(ys[item] / cell))
+                    buckets.setdefault(key, []).append(item)
+
+                for item in group:
+                    target = self._target(item)
+                    if target is None:
+                        continue
+                    tx, ty = target
+                    gx, gy = math.floor(tx / cell), math.floor(ty / cell)
+                    candidates = [
+                        other
+                        for dx in (-1, 0, 1)
+                        for dy in (-1, 0, 1)
+                        for other in buckets.get((gx + dx, gy + dy), ())
+                        if other != item
+                    ]
+                    if len(candidates) > _SWAP_CANDIDATES:
+                        candidates.sort(
+                            key=lambda other: abs(xs[other] - tx) + abs(ys[other] - ty)
+                        )
+                        del candidates[_SWAP_CANDIDATES:]
+                    best, best_delta = None, -1e-9
+                    for other in candidates:
+                        delta = self._swap_delta(item, other, net_cost)
+                        if delta < best_delta:
+                            best, best_delta = other, delta
+                    if best is None:
+                        continue
+                    old_key = (math.floor(xs[item] / cell), math.floor(ys[item] / cell))
+                    new_key = (math.floor(xs[best] / cell), math.floor(ys[best] / cell))
+                    xs[item], xs[best] = xs[best], xs[item]
+                    ys[item], ys[best] = ys[best], ys[item]
+                    for net_index in set(self.item_nets[item]) | set(
+                        self.item_nets[best]
+                    ):
+                        net_cost[net_index] = self.net_wirelength(net_index)
+                    if old_key != new_key:
+                        buckets[old_key].remove(item)
+                        buckets[old_key].append(best)
+                        buckets[new_key].remove(best)
+                        buckets[new_key].append(item)
+                    improved += 1
+            if not improved:
+                break
+
+    def _target(self, item: int) -> Optional[tuple[float, float]]:
+        """Median of the net bounding-box edges formed by the other members."""
+        bounds_x, bounds_y = [], []
+        for net_index in self.item_nets[item]:
+            others = [member for member in self.nets[net_index] if member != item]
+            xs = [self.xs[member] for member in others]
+            ys = [self.ys[member] for member in others]
+            bounds_x.extend((min(xs), max(xs)))
+            bounds_y.extend((min(ys), max(ys)))
+        if not bounds_x:
+            return None
+        bounds_x.sort()
+        bounds_y.sort()
+        middle = len(bounds_x) // 2
+        return bounds_x[middle], bounds_y[middle]
+
+    def _swap_delta(self, first: int, second: int, net_cost: list[float]) -> float:
+        affected = set(self.item_nets[first]) | set(self.item_nets[second])
+        if not affected:
+            return 0.0
+        before = sum(net_cost[index] for index in affected)
+        xs, ys = self.xs, self.ys
+        xs[first], xs[second] = xs[second], xs[first]
+        ys[first], ys[second] = ys[second], ys[first]
+        after = sum(self.net_wirelength(index) for index in affected)
+        xs[first], xs[second] = xs[second], xs[first]
+        ys[first], ys[second] = ys[second], ys[first]
+        return after - before
+
+    def run(self) -> AutoPlacementResult:
+        movable = [index for index, item in enumerate(self.items) if not item.fixed]
+        self._pack(self._cluster_order(movable))
+        initial = self.wirelength()
+        self._refine(movable)
+        placements = {}
+        for index in movable:
+            item = self.items[index]
+            center = item.bbox.center()
+            placements[item.refdes] = layout_lib.Placement(
+                layout_lib.Position(
+                    round(self.xs[index] - center.x, 3),
+                    round(self.ys[index] - center.y, 3),
+                    0.0,
+                )
+            )
+        return AutoPlacementResult(
+            placements=placements,
+            fixed=tuple(item.refdes for item in self.items if item.fixed),
+            initial_wirelength=initial,
+            wirelength=self.wirelength(),
+        )
+
+
+def auto_place(
+    design: "sch_lib.Design",
+    *,
+    clearance: float = DEFAULT_CLEARANCE,
+    max_net_degree: int = DEFAULT_MAX_NET_DEGREE,
+    passes: int = 4,
+    apply: bool = True,
+) -> AutoPlacementResult:
+    """Place every top-level component of ``design`` that has no placement."""
+    result = AutoPlacer(
+        design,
+        clearance=clearance,
+        max_net_degree=max_net_degree,
+        passes=passes,
+    ).run()
+    if apply:
+        design.layout.placement.update(result.placements)
+    return result
@@ -16,8 +16,19 @@ from earthground.cli.compile_project import (
 OUTPUT_DIRECTORY = "generated_outputs"
 
 
-def export_kicad_project(design_file: pathlib.Path | str) -> pathlib.Path:
-    """Compile a Python design file and export it as a KiCad PCB."""
+def export_kicad_project(
+    design_file: pathlib.Path | str,
+    *,
+    incremental: bool = False,
+    workers: int = 1,
+) -> pathlib.Path:
+    """
+    Compile a Python design file and export it as a KiCad PCB.
+
+    With ``incremental``, an existing board keeps its routing and only the
+    footprints whose design inputs changed are rewritten. ``workers`` renders
+    footprints on that many processes.
+    """
     loaded = compile_design_file(design_file, initialize_config=True)
     design = loaded.design
 
@@ -25,10 +36,11 @@ def export_kicad_project(design_file: pathlib.Path | str) -> pathlib.Path:
     output_path = output_directory / f"{design.name}.kicad_pcb"
     output_directory.mkdir(parents=True, exist_ok=True)
 
-    exporter = KicadExporter(design)
+    exporter = KicadExporter(design, workers=workers)
     exporter.save(
         output_folder=output_directory,
         overwrite=output_path.exists(),
+        incremental=incremental,
     )
     return output_path
 
@@ -39,12 +51,25 @@ def configure_kicad_export_parser(parser) -> None:
         "design_file",
         help="Python file containing an Earthground design",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Rewrite only changed footprints of an existing board, keeping routing",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to render footprints",
+    )
 
 
 def run_parsed_args(args) -> int:
     """Run the KiCad export command for already-parsed CLI arguments."""
     try:
-        export_kicad_project(args.design_file)
+        export_kicad_project(
+            args.design_file, incremental=args.incremental, workers=args.workers
+        )
     except CompileProjectError as exc:
         print(f"earthground export kicad: error: {exc}", file=sys.stderr)
         return 2
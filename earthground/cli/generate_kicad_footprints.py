@@ -10,15 +10,21 @@ from typing import Optional, Sequence
 
 from earthground.kicad.catalog import (
     ENVIRONMENT_OUTPUT,
+    FootprintEntry,
     KicadCatalogError,
     catalog_is_fresh,
     find_footprint_path,
     generate_catalog,
-    read_footprint_description,
     resolve_context,
     resolve_footprint_roots,
     scan_footprints,
 )
+from earthground.kicad.footprint_cache import default_cache_path
+from earthground.kicad.footprint_index import (
+    FOOTPRINT_INDEX_FILENAME,
+    FootprintIndex,
+    open_index,
+)
 
 
 def _add_project_options(parser: argparse.ArgumentParser) -> None:
@@ -103,6 +109,37 @@ def configure_catalog_parser(parser: argparse.ArgumentParser) -> None:
         help="Footprint name when the library is supplied separately",
     )
 
+    search_parser = subparsers.add_parser(
+        "search", help="Rank installed footprints by name, description and tags"
+    )
+    search_parser.set_defaults(catalog_handler=_run_search)
+    _add_project_options(search_parser)
+    search_parser.add_argument(
+        "--footprint-root",
+        action="append",
+        type=pathlib.Path,
+        default=[],
+        help="Additional footprint root; may be repeated",
+    )
+    search_parser.add_argument("--library", help="Only search this library")
+    search_parser.add_argument(
+        "--pads", type=int, help="Only match footprints with this many pads"
+    )
+    search_parser.add_argument(
+        "--limit", type=int, default=20, help="Maximum number of matches"
+    )
+    search_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-read changed footprint files before searching",
+    )
+    search_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Return machine-readable JSON",
+    )
+    search_parser.add_argument("query", nargs="+", help="Words to search for")
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -130,15 +167,22 @@ def _print_context(context, fresh: Optional[bool] = None) -> None:
     print(f"KiCad version: {context.installation.version}")
     print(f"Catalog output: {context.output}")
     print(f"Footprints: {len(context.entries)}")
+    source = " (shared catalog cache)" if context.shared_scan else ""
+    print(f"Footprint scan: {context.scan_seconds * 1000:.1f} ms{source}")
     for root in context.roots:
         print(f"Footprint root: {root}")
     if fresh is not None:
         print(f"Catalog status: {'current' if fresh else 'missing or stale'}")
 
 
+def _footprint_index(project_root: Optional[pathlib.Path]) -> FootprintIndex:
+    return open_index(default_cache_path(project_root, FOOTPRINT_INDEX_FILENAME))
+
+
 def _run_generate(args: argparse.Namespace) -> int:
     context = _context_from_args(args, initialize=True)
     changed = generate_catalog(context, force=args.force)
+    _footprint_index(context.project.root).refresh(context.entries)
     _print_context(context, fresh=True)
     print("Catalog generated." if changed else "Catalog already current.")
     return 0
@@ -179,24 +223,28 @@ def _run_get(args: argparse.Namespace) -> int:
         executable=args.kicad_executable,
         initialize=False,
     )
+    index = _footprint_index(args.project_root)
     if args.library_or_reference is None:
-        return _print_footprint_listing(roots, None, args.json)
+        return _print_footprint_listing(roots, None, args.json, index)
 
     if args.footprint is None and ":" not in args.library_or_reference:
         return _print_footprint_listing(
-            roots, args.library_or_reference.removesuffix(".pretty"), args.json
+            roots, args.library_or_reference.removesuffix(".pretty"), args.json, index
         )
 
     library, footprint_name = _parse_footprint_reference(
         args.library_or_reference, args.footprint
     )
     path = find_footprint_path(roots, library, footprint_name)
-    description = read_footprint_description(path)
+    indexed = index.lookup(FootprintEntry(library, footprint_name, path))
+    description = indexed.description
     result = {
         "reference": f"{library}:{footprint_name}",
         "library": library,
         "footprint": footprint_name,
         "description": description,
+        "tags": indexed.tags,
+        "pad_count": indexed.pad_count,
         "path": str(path),
     }
     if args.json:
@@ -208,22 +256,67 @@ def _run_get(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_search(args: argparse.Namespace) -> int:
+    index = _footprint_index(args.project_root)
+    if args.refresh or not len(index):
+        roots = resolve_footprint_roots(
+            additional_roots=args.footprint_root,
+            project_root=args.project_root,
+            config_path=args.config,
+            executable=args.kicad_executable,
+            initialize=False,
+        )
+        index.refresh(scan_footprints(roots))
+    matches = index.search(
+        " ".join(args.query),
+        library=(
+            args.library.removesuffix(".pretty") if args.library is not None else None
+        ),
+        pad_count=args.pads,
+        limit=args.limit,
+    )
+    if args.json:
+        print(
+            json.dumps(
+                [
+                    {
+                        "reference": f"{match.footprint.library}:"
+                        f"{match.footprint.name}",
+                        "library": match.footprint.library,
+                        "footprint": match.footprint.name,
+                        "description": match.footprint.description,
+                        "tags": match.footprint.tags,
+                        "pad_count": match.footprint.pad_count,
+                        "score": round(match.score, 3),
+                    }
+                    for match in matches
+                ],
+                indent=2,
+                sort_keys=True,
+            )
+        )
+        return 0
+    for match in matches:
+        footprint = match.footprint
+        print(f"{footprint.library}:{footprint.name} ({footprint.pad_count} pads)")
+        print(f"    Description: {footprint.description or '(none provided)'}")
+    if not matches:
+        print("No matching footprints.")
+    return 0 if matches else 1
+
+
 def _print_footprint_listing(
-    roots: Sequence[pathlib.Path], selected_library: Optional[str], as_json: bool
+    roots: Sequence[pathlib.Path],
+    selected_library: Optional[str],
+    as_json: bool,
+    index: FootprintIndex,
 ) -> int:
-    entries = scan_footprints(roots)
+    index.refresh(scan_footprints(roots))
     libraries: dict[str, list[dict[str, Optional[str]]]] = {}
-    for entry in entries:
-        if selected_library is None or entry.library == selected_library:
-            path = entry.path or find_footprint_path(
-                roots, entry.library, entry.footprint_name
-            )
-            libraries.setdefault(entry.library, []).append(
-                {
-                    "name": entry.footprint_name,
-                    "description": read_footprint_description(path),
-                }
-            )
+    for footprint in index.footprints(selected_library):
+        libraries.setdefault(footprint.library, []).append(
+            {"name": footprint.name, "description": footprint.description}
+        )
 
     if selected_library is not None and selected_library not in libraries:
         raise KicadCatalogError(
@@ -3,18 +3,16 @@
 from __future__ import annotations
 
 import copy
-import os
 import pathlib
-import stat
 import sys
-import tempfile
 from typing import Optional, Sequence
 
-from pykicad import FootprintBuilder, Pcb, PcbBuilder, read_from_file, write_to_string
+from pykicad import FootprintBuilder, Pcb, PcbBuilder, read_from_file
 import pykicad.models.pcb as pcb
 
 import earthground.components as cmp
 import earthground.exporters.kicad as kicad_exporter
+import earthground.exporters.kicad_board_text as kicad_board_text
 import earthground.layout as layout_lib
 import earthground.schematic as sch_lib
 from earthground.cli.compile_project import (
@@ -181,28 +179,6 @@ def _replacement_footprint(
     return new_footprint
 
 
-def _write_atomically(path: pathlib.Path, content: str) -> None:
-    source_mode = stat.S_IMODE(path.stat().st_mode)
-    temp_path = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            newline="",
-            dir=path.parent,
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as output:
-            temp_path = pathlib.Path(output.name)
-            output.write(content)
-        os.chmod(temp_path, source_mode)
-        os.replace(temp_path, path)
-    finally:
-        if temp_path is not None and temp_path.exists():
-            temp_path.unlink()
-
-
 def update_footprints(design: sch_lib.Design, pcb_path: str | pathlib.Path) -> int:
     """Replace every PCB footprint from ``design`` using PyKiCad."""
     path = pathlib.Path(pcb_path).expanduser().resolve()
@@ -251,7 +227,7 @@ def update_footprints(design: sch_lib.Design, pcb_path: str | pathlib.Path) -> i
             )
 
     board.footprint = replacements
-    _write_atomically(path, write_to_string(board))
+    kicad_board_text.write_board(path, board)
     return len(replacements)
 
 
@@ -208,6 +208,18 @@ class Component:
     def is_in_design(self):
         return self._placed
 
+    @property
+    def footprint(self) -> ft.BaseFootprint:
+        return self._footprint
+
+    @footprint.setter
+    def footprint(self, value: ft.BaseFootprint) -> None:
+        self._footprint = value
+        # Unplaced parts are laid out in strips sized by footprint width.
+        layout = getattr(getattr(self, "parent", None), "layout", None)
+        if layout is not None:
+            layout.invalidate()
+
     def place(self, parent: "sch.Design"):
         self.parent = parent
         self._placed = True
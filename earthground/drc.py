@@ -0,0 +1,605 @@
+"""Physical design-rule checks on the flattened board layout."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+import earthground.layout as layout_lib
+from earthground.footprint_types import BoundingBox
+
+if TYPE_CHECKING:
+    from earthground.schematic import Design
+
+
+@dataclass(frozen=True)
+class PlacedCourtyard:
+    refdes: str
+    layer: layout_lib.Layer
+    bbox: BoundingBox
+
+
+@dataclass(frozen=True)
+class PlacementOverlap:
+    first: str
+    second: str
+    layer: layout_lib.Layer
+    overlap: BoundingBox
+
+    def __str__(self):
+        return (
+            f"Footprints overlap on {self.layer.name}: {self.first} and "
+            f"{self.second} ({self.overlap.width():.3f} x "
+            f"{self.overlap.height():.3f} mm)"
+        )
+
+
+def placed_courtyards(
+    design: "Design", *, include_fallback: bool = False
+) -> tuple[PlacedCourtyard, ...]:
+    """Board-coordinate courtyard boxes for every physical placed component."""
+    courtyards = []
+    for refdes, item in design.layout.flattened().placements.items():
+        if item.component.virtual:
+            continue
+        if (
+            not include_fallback
+            and item.provenance is layout_lib.PlacementProvenance.FALLBACK
+        ):
+            continue
+        courtyards.append(
+            PlacedCourtyard(
+                refdes,
+                item.layout.layer,
+                layout_lib.transform_bbox(
+                    layout_lib.courtyard_bbox(item.component),
+                    item.layout.component,
+                    item.layout.layer,
+                ),
+            )
+        )
+    return tuple(courtyards)
+
+
+def _sweep(
+    courtyards: list[PlacedCourtyard], clearance: float
+) -> list[PlacementOverlap]:
+    half = clearance / 2
+    boxes = [
+        BoundingBox(
+            item.bbox.x1 - half,
+            item.bbox.y1 - half,
+            item.bbox.x2 + half,
+            item.bbox.y2 + half,
+        )
+        for item in courtyards
+    ]
+    overlaps = []
+    ending: list[tuple[float, int]] = []
+    active: set[int] = set()
+    for index in sorted(range(len(boxes)), key=lambda item: boxes[item].x1):
+        box = boxes[index]
+        while ending and ending[0][0] <= box.x1:
+            active.discard(heapq.heappop(ending)[1])
+        for other_index in active:
+            other = boxes[other_index]
+            if box.y1 < other.y2 and other.y1 < box.y2:
+                first, second = sorted(
+                    (courtyards[index].refdes, courtyards[other_index].refdes)
+                )
+                overlaps.append(
+                    PlacementOverlap(
+                        first,
+                        second,
+                        courtyards[index].layer,
+                        BoundingBox(
+                            max(box.x1, other.x1),
+                            max(box.y1, other.y1),
+                            min(box.x2, other.x2),
+                            min(box.y2, other.y2),
+                        ),
+                    )
+                )
+        active.add(index)
+        heapq.heappush(ending, (box.x2, index))
+    return overlaps
+
+
+def find_placement_overlaps(
+    design: "Design",
+    *,
+    clearance: float = 0.0,
+    include_fallback: bool = False,
+) -> tuple[PlacementOverlap, ...]:
+    """
+    Report pairs of footprints whose courtyards collide on the same board side.
+
+    A sweep over courtyard left edges keeps only boxes whose x-extent is still
+    open, so the cost is O(n log n) plus the number of x-overlapping neighbours.
+    Fallback placements are skipped unless ``include_fallback`` is set.
+    """
+    by_layer: dict[layout_lib.Layer, list[PlacedCourtyard]] = {}
+    for courtyard in placed_courtyards(design, include_fallback=include_fallback):
+        by_layer.setdefault(courtyard.layer, []).append(courtyard)
+    overlaps = [
+        overlap
+        for courtyards in by_layer.values()
+        for overlap in _sweep(courtyards, clearance)
+    ]
+    return tuple(
+        sorted(overlaps, key=lambda item: (item.first, item.second, item.layer.name))
+    )
+
+
+@dataclass(frozen=True)
+class UnroutedConnection:
+    net_name: str
+    first: str
+    second: str
+    length: float
+
+    def __str__(self):
+        return (
+            f"Unrouted {self.net_name}: {self.first} to {self.second} "
+            f"({self.length:.3f} mm)"
+        )
+
+
+@dataclass(frozen=True)
+class CopperShort:
+    nets: tuple[str, str]
+    location: layout_lib.LayoutPoint
+    layer: str
+
+    def __str__(self):
+        return (
+            f"Short between {self.nets[0]} and {self.nets[1]} at "
+            f"({self.location.x:.3f}, {self.location.y:.3f}) on {self.layer}"
+        )
+
+
+@dataclass(frozen=True)
+class ConnectivityReport:
+    unrouted: tuple[UnroutedConnection, ...]
+    shorts: tuple[CopperShort, ...]
+
+    @property
+    def blocking(self):
+        return self.shorts + self.unrouted
+
+    @property
+    def is_valid(self):
+        return not self.blocking
+
+
+ALL_COPPER_LAYERS = "*.Cu"
+_CONTACT_TOLERANCE = 1e-6
+
+
+class _Copper(NamedTuple):
+    label: str
+    net_name: Optional[str]
+    # None means every copper layer, as for vias and plated through holes.
+    layers: Optional[frozenset[str]]
+    box: BoundingBox
+    # Centreline and half width of tracks and vias; pads are just ``box``.
+    segment: Optional[tuple[float, float, float, float, float]]
+    # Board corners of a pad turned off the board axes, where ``box`` is only
+    # a bound; None when ``box`` is the pad itself.
+    outline: Optional[tuple[tuple[float, float], ...]] = None
+
+
+def _flip_copper_layer(layer: str) -> str:
+    return {"F.Cu": "B.Cu", "B.Cu": "F.Cu"}.get(layer, layer)
+
+
+def _pad_net_name(component, number) -> Optional[str]:
+    pin = layout_lib.pad_pin(component, number)
+    if pin is None or component.parent is None:
+        return None
+    net = component.parent.pin_to_net.get(pin)
+    return net.name if net else None
+
+
+def _segment_copper(label, net_name, layer, x1, y1, x2, y2, radius) -> _Copper:
+    return _Copper(
+        label,
+        net_name,
+        None if layer is None else frozenset((layer,)),
+        BoundingBox(
+            min(x1, x2) - radius,
+            min(y1, y2) - radius,
+            max(x1, x2) + radius,
+            max(y1, y2) + radius,
+        ),
+        (x1, y1, x2, y2, radius),
+    )
+
+
+def _board_copper(design: "Design") -> tuple[list[_Copper], list[int]]:
+    """Copper items of the exported board and the indices of its pads."""
+    items: list[_Copper] = []
+    pads: list[int] = []
+    for refdes, item in design.layout.flattened().placements.items():
+        component = item.component
+        if component.virtual or component.footprint is None:
+            continue
+        footprint = component.footprint
+        position = item.layout.component
+        bottom = item.layout.layer is layout_lib.Layer.BOTTOM
+        for number in footprint.pads:
+            layers = footprint.get_pad_copper_layers(number)
+            if not layers:
+                # Paste or mask only pads carry no copper.
+                continue
+            corners = layout_lib.transform_corners(
+                footprint.get_pad_bbox(number), position, item.layout.layer
+            )
+            pads.append(len(items))
+            items.append(
+                _Copper(
+                    f"{refdes}.{number}",
+                    _pad_net_name(component, number),
+                    (
+                        None
+                        if ALL_COPPER_LAYERS in layers
+                        else frozenset(
+                            _flip_copper_layer(layer) if bottom else layer
+                            for layer in layers
+                        )
+                    ),
+                    BoundingBox(
+                        min(x for x, _ in corners),
+                        min(y for _, y in corners),
+                        max(x for x, _ in corners),
+                        max(y for _, y in corners),
+                    ),
+                    None,
+                    None if position.angle % 90 == 0 else corners,
+                )
+            )
+    for via in design.layout.vias:
+        x, y = via.location[0], via.location[1]
+        items.append(
+            _segment_copper(
+                f"via ({x:.3f}, {y:.3f})",
+                via.net_name,
+                None,
+                x,
+                y,
+                x,
+                y,
+                via.hole_size / 2,
+            )
+        )
+    for track in design.layout.tracks:
+        points = [track.start, track.end]
+        if isinstance(track, layout_lib.TrackArc):
+            # Arcs are checked as their two chords through the midpoint.
+            points.insert(1, track.mid)
+        for start, end in zip(points, points[1:]):
+            items.append(
+                _segment_copper(
+                    f"track ({start.x:.3f}, {start.y:.3f})",
+                    track.net_name,
+                    track.layer,
+                    start.x,
+                    start.y,
+                    end.x,
+                    end.y,
+                    track.width / 2,
+                )
+            )
+    return items, pads
+
+
+def _point_segment_distance(px, py, x1, y1, x2, y2) -> float:
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else ((px - x1) * dx + (py - y1) * dy) / length
+    t = min(1.0, max(0.0, t))
+    return math.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
+def _cross(ax, ay, bx, by, cx, cy) -> float:
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _segments_cross(ax, ay, bx, by, cx, cy, dx, dy) -> bool:
+    d1 = _cross(cx, cy, dx, dy, ax, ay)
+    d2 = _cross(cx, cy, dx, dy, bx, by)
+    d3 = _cross(ax, ay, bx, by, cx, cy)
+    d4 = _cross(ax, ay, bx, by, dx, dy)
+    return ((d1 > 0) != (d2 > 0)) and ((d3 > 0) != (d4 > 0)) and d1 * d2 * d3 * d4 != 0
+
+
+def _segment_distance(first, second) -> float:
+    ax, ay, bx, by = first
+    cx, cy, dx, dy = second
+    if _segments_cross(ax, ay, bx, by, cx, cy, dx, dy):
+        return 0.0
+    return min(
+        _point_segment_distance(ax, ay, cx, cy, dx, dy),
+        _point_segment_distance(bx, by, cx, cy, dx, dy),
+        _point_segment_distance(cx, cy, ax, ay, bx, by),
+        _point_segment_distance(dx, dy, ax, ay, bx, by),
+    )
+
+
+def _pad_outline(item: _Copper) -> tuple[tuple[float, float], ...]:
+    if item.outline is not None:
+        return item.outline
+    box = item.box
+    return ((box.x1, box.y1), (box.x2, box.y1), (box.x2, box.y2), (box.x1, box.y2))
+
+
+def _edges(outline):
+    return zip(outline, outline[1:] + outline[:1])
+
+
+def _inside_convex(px, py, outline) -> bool:
+    sides = [_cross(ax, ay, bx, by, px, py) for (ax, ay), (bx, by) in _edges(outline)]
+    return all(side >= 0 for side in sides) or all(side <= 0 for side in sides)
+
+
+def _segment_outline_distance(segment, outline) -> float:
+    x1, y1, x2, y2 = segment
+    if _inside_convex(x1, y1, outline) or _inside_convex(x2, y2, outline):
+        return 0.0
+    return min(_segment_distance(segment, (*a, *b)) for a, b in _edges(outline))
+
+
+def _outlines_overlap(first, second) -> bool:
+    """Separating-axis test of two convex outlines, touching counting as overlap."""
+    for outline in (first, second):
+        for (ax, ay), (bx, by) in _edges(outline):
+            nx, ny = ay - by, bx - ax
+            tolerance = _CONTACT_TOLERANCE * math.hypot(nx, ny)
+            projected = [nx * x + ny * y for x, y in first]
+            other = [nx * x + ny * y for x, y in second]
+            if (
+                max(projected) < min(other) - tolerance
+                or max(other) < min(projected) - tolerance
+            ):
+                return False
+    return True
+
+
+def _touches(first: _Copper, second: _Copper) -> bool:
+    if first.segment is None and second.segment is None:
+        if first.outline is None and second.outline is None:
+            return True  # Both boxes are exact pads, and they already overlap.
+        return _outlines_overlap(_pad_outline(first), _pad_outline(second))
+    if first.segment is None:
+        first, second = second, first
+    if second.segment is None:
+        distance = _segment_outline_distance(first.segment[:4], _pad_outline(second))
+        return distance <= first.segment[4] + _CONTACT_TOLERANCE
+    distance = _segment_distance(first.segment[:4], second.segment[:4])
+    return distance <= first.segment[4] + second.segment[4] + _CONTACT_TOLERANCE
+
+
+def _shared_layer(first: _Copper, second: _Copper) -> Optional[str]:
+    if first.layers is None and second.layers is None:
+        return ALL_COPPER_LAYERS
+    if first.layers is None:
+        shared = second.layers
+    elif second.layers is None:
+        shared = first.layers
+    else:
+        shared = first.layers & second.layers
+    return min(shared) if shared else None
+
+
+def _point_in_polygon(x, y, outline) -> bool:
+    inside = False
+    previous = outline[-1]
+    for point in outline:
+        if (point.y > y) != (previous.y > y) and x < (previous.x - point.x) * (
+            y - point.y
+        ) / (previous.y - point.y) + point.x:
+            inside = not inside
+        previous = point
+    return inside
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[second] = first
+
+
+class _CopperGrid:
+    """Uniform-grid hash of copper boxes for contact queries."""
+
+    def __init__(self, items: list[_Copper]):
+        sizes = sorted(max(item.box.width(), item.box.height()) for item in items) or [
+            1.0
+        ]
+        self.cell = max(sizes[len(sizes) // 2] * 2, 0.1)
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        for index, item in enumerate(items):
+            for key in self.keys(item.box):
+                self.cells.setdefault(key, []).append(index)
+
+    def key(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell), math.floor(y / self.cell)
+
+    def keys(self, box: BoundingBox):
+        gx1, gy1 = self.key(box.x1, box.y1)
+        gx2, gy2 = self.key(box.x2, box.y2)
+        for gx in range(gx1, gx2 + 1):
+            for gy in range(gy1, gy2 + 1):
+                yield gx, gy
+
+
+def _connect_copper(
+    items: list[_Copper], grid: _CopperGrid, sets: _UnionFind
+) -> dict[tuple[str, str], CopperShort]:
+    shorts: dict[tuple[str, str], CopperShort] = {}
+    for key, members in grid.cells.items():
+        for position, index in enumerate(members):
+            item = items[index]
+            box = item.box
+            for other_index in members[position + 1 :]:
+                other = items[other_index]
+                other_box = other.box
+                x1, y1 = max(box.x1, other_box.x1), max(box.y1, other_box.y1)
+                x2, y2 = min(box.x2, other_box.x2), min(box.y2, other_box.y2)
+                # A pair spanning several cells is tested only in the cell that
+                # holds the lower corner of the overlap.
+                if x1 > x2 or y1 > y2 or grid.key(x1, y1) != key:
+                    continue
+                different = (
+                    item.net_name is not None
+                    and other.net_name is not None
+                    and item.net_name != other.net_name
+                )
+                if not different and sets.find(index) == sets.find(other_index):
+                    continue
+                layer = _shared_layer(item, other)
+                if layer is None or not _touches(item, other):
+                    continue
+                sets.union(index, other_index)
+                if different:
+                    nets = tuple(sorted((item.net_name, other.net_name)))
+                    shorts.setdefault(
+                        nets,
+                        CopperShort(
+                            nets,
+                            layout_lib.LayoutPoint((x1 + x2) / 2, (y1 + y2) / 2),
+                            layer,
+                        ),
+                    )
+    return shorts
+
+
+def _connect_planes(
+    design: "Design", items: list[_Copper], grid: _CopperGrid, sets: _UnionFind
+) -> None:
+    # Filled copper is cleared around other nets, so planes only ever join
+    # copper of their own net.
+    layer_count = design.layout.layer_count
+    for pour in design.layout.pours:
+        layer = (
+            "F.Cu"
+            if pour.layer == 1
+            else "B.Cu" if pour.layer == layer_count else f"In{pour.layer - 1}.Cu"
+        )
+        members = [
+            index
+            for index, item in enumerate(items)
+            if item.net_name == pour.net_name
+            and (item.layers is None or layer in item.layers)
+        ]
+        for index in members[1:]:
+            sets.union(members[0], index)
+    for zone in design.layout.zones:
+        outline = zone.outline
+        bounds = BoundingBox(
+            min(point.x for point in outline),
+            min(point.y for point in outline),
+            max(point.x for point in outline),
+            max(point.y for point in outline),
+        )
+        candidates = {
+            index for key in grid.keys(bounds) for index in grid.cells.get(key, ())
+        }
+        inside = []
+        for index in sorted(candidates):
+            item = items[index]
+            if item.net_name != zone.net_name:
+                continue
+            points = (
+                [item.box.center()]
+                if item.segment is None
+                else [item.segment[:2], item.segment[2:4]]
+            )
+            if any(_point_in_polygon(x, y, outline) for x, y in points):
+                inside.append(index)
+        # Each layer of a zone is its own fill; only copper on that layer joins.
+        for layer in zone.layers:
+            members = [
+                index
+                for index in inside
+                if items[index].layers is None or layer in items[index].layers
+            ]
+            for index in members[1:]:
+                sets.union(members[0], index)
+
+
+def _ratsnest(
+    net_name: str, pads: list[tuple[str, float, float, int]]
+) -> list[UnroutedConnection]:
+    """Minimum spanning tree over pads where already-connected pads cost 0."""
+    count = len(pads)
+    best = [math.inf] * count
+    link = [-1] * count
+    remaining = set(range(1, count))
+    current = 0
+    connections = []
+    while remaining:
+        _, x, y, root = pads[current]
+        for index in remaining:
+            other = pads[index]
+            distance = (
+                0.0 if other[3] == root else math.hypot(other[1] - x, other[2] - y)
+            )
+            if distance < best[index]:
+                best[index] = distance
+                link[index] = current
+        current = min(remaining, key=best.__getitem__)
+        remaining.discard(current)
+        if best[current] > 0:
+            first, second = sorted((pads[link[current]][0], pads[current][0]))
+            connections.append(
+                UnroutedConnection(net_name, first, second, best[current])
+            )
+    return connections
+
+
+def check_connectivity(design: "Design") -> ConnectivityReport:
+    """
+    Check that the layout's copper joins every net's pads without shorts.
+
+    Pads at their placed board positions, vias and track segments are hashed
+    into a uniform grid; only items sharing a cell are tested for contact and
+    joined with union-find. Contacts between copper of different nets are
+    reported as shorts, and pads of one net left in separate copper islands
+    are reported as the ratsnest connections still needed to join them.
+    """
+    items, pads = _board_copper(design)
+    grid = _CopperGrid(items)
+    sets = _UnionFind(len(items))
+    shorts = _connect_copper(items, grid, sets)
+    _connect_planes(design, items, grid, sets)
+
+    by_net: dict[str, list[tuple[str, float, float, int]]] = {}
+    for index in pads:
+        item = items[index]
+        if item.net_name is not None:
+            center = item.box.center()
+            by_net.setdefault(item.net_name, []).append(
+                (item.label, center.x, center.y, sets.find(index))
+            )
+    unrouted = []
+    for net_name in sorted(by_net):
+        net_pads = by_net[net_name]
+        if len({pad[3] for pad in net_pads}) > 1:
+            unrouted.extend(_ratsnest(net_name, net_pads))
+    return ConnectivityReport(
+        tuple(unrouted), tuple(shorts[nets] for nets in sorted(shorts))
+    )
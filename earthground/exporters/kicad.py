@@ -1,7 +1,12 @@
+import hashlib
 import logging
 import pathlib
 import uuid
-from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import dataclasses
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Sequence
 
 import pygerber.aperture as ap_lib
 from pykicad import (
@@ -11,12 +16,12 @@ from pykicad import (
     PcbBuilder,
     read_from_file,
     text_effects,
-    write_to_file,
 )
 from pykicad.models.base import Point
 import pykicad.models.pcb as pcb
 
 import earthground.components as cmp
+import earthground.exporters.kicad_board_text as kicad_board_text
 import earthground.layout as layout_lib
 import earthground.schematic as sch_lib
 import earthground.signal_integrity as signal_integrity
@@ -98,6 +103,250 @@ def _hide_text_on_layer(footprint: pcb.Footprint, suffix: str) -> None:
             _set_text_hidden(item, True)
 
 
+class _NativePad(NamedTuple):
+    number: str
+    shape: str
+    size: pcb.Size
+    location: tuple[float, float]
+    hole: Optional[float]
+    net: Optional[pcb.NetRef]
+
+
+@dataclass(frozen=True)
+class FootprintJob:
+    """
+    Plain-data inputs for one board footprint.
+
+    A job holds no references back into the design, so it can be sent to a
+    worker process. KiCad footprints refer to their template by ``template``
+    key instead of carrying the parsed model.
+    """
+
+    reference: str
+    name: str
+    value: str
+    description: Optional[str]
+    position: pcb.Position
+    id_position: pcb.Position
+    id_orientation: layout_lib.Orientation
+    layer: layout_lib.Layer
+    properties: tuple[tuple[str, str], ...]
+    add_silkscreen_text: bool = True
+    add_fab_text: bool = True
+    template: Optional[int] = None
+    pad_nets: tuple[tuple[str, pcb.NetRef], ...] = ()
+    pads: tuple[_NativePad, ...] = ()
+    silk: tuple[tuple[tuple[float, float], ...], ...] = ()
+
+    def digest(self, template: str = "") -> str:
+        """Content hash of the job, naming its KiCad template by ``template``."""
+        content = repr(dataclasses.replace(self, template=None))
+        return hashlib.sha256(f"{template}\0{content}".encode()).hexdigest()
+
+
+def build_footprint(
+    job: FootprintJob, template: Optional[pcb.Footprint] = None
+) -> pcb.Footprint:
+    """Instantiate the board footprint for ``job`` from an optional template."""
+    reference_justify = _reference_justify(job.id_orientation, job.layer)
+    position = job.position
+
+    if template is not None:
+        footprint_builder = FootprintBuilder(template).instantiate(
+            reference=job.reference,
+            at=pcb.Position(x=position.x, y=position.y, angle=-position.angle),
+            side=_board_side(job.layer),
+            reference_at=job.id_position.model_copy(),
+            reference_layer="F.SilkS",
+            reference_effects=text_effects(justify=reference_justify),
+        )
+        footprint = footprint_builder.model
+        if job.description:
+            footprint.description = job.description
+
+        # KiCad board instances store pad orientation in board coordinates,
+        # while pad positions remain footprint-local. FootprintBuilder.place()
+        # handles side mirroring but does not compose the placement rotation.
+        footprint_angle = footprint.at.angle if footprint.at is not None else 0.0
+        pad_nets = dict(job.pad_nets)
+        for pad in footprint.pads:
+            if pad.at is not None:
+                pad.at.angle += footprint_angle
+            if pad.pad_type != "np_thru_hole" and pad.number in pad_nets:
+                pad.net = pad_nets[pad.number].model_copy()
+
+    else:
+        footprint_builder = FootprintBuilder.create(
+            job.name,
+            description=job.description,
+        )
+        footprint_builder.set_reference(
+            job.reference,
+            at=job.id_position.model_copy(),
+            layer="F.SilkS",
+            effects=text_effects(justify=reference_justify),
+        )
+        footprint_builder.set_property(
+            "Value",
+            job.value,
+            at=pcb.Position(x=0, y=0),
+            layer="F.Fab",
+            hide=not job.add_fab_text,
+        )
+
+        for pad in job.pads:
+            pad_layer_prefix = "*" if pad.hole else "F"
+            pad_layers = [f"{pad_layer_prefix}.Cu", f"{pad_layer_prefix}.Mask"]
+            if not pad.hole:
+                pad_layers.append(f"{pad_layer_prefix}.Paste")
+            footprint_builder.add_pad(
+                pad.number,
+                pad_type="thru_hole" if pad.hole else "smd",
+                shape=pad.shape,
+                at=pcb.Position(
+                    x=pad.location[0],
+                    y=pad.location[1],
+                    angle=position.angle,
+                ),
+                size=pad.size.model_copy(),
+                drill=pcb.PadDrill(diameter=pad.hole) if pad.hole else None,
+                layers=pad_layers,
+                net=pad.net.model_copy() if pad.net is not None else None,
+            )
+
+        for polysilk in job.silk:
+            for previous, current in zip(polysilk, polysilk[1:]):
+                footprint_builder.add_line(
+                    Point(x=previous[0], y=previous[1]),
+                    Point(x=current[0], y=current[1]),
+                    layer="F.SilkS",
+                )
+
+    reference = footprint_builder.reference
+    if reference is not None:
+        _set_text_hidden(reference, not job.add_silkscreen_text)
+    if not job.add_silkscreen_text:
+        _hide_text_on_layer(footprint_builder.model, ".SilkS")
+    if not job.add_fab_text:
+        _hide_text_on_layer(footprint_builder.model, ".Fab")
+
+    for name, value in job.properties:
+        footprint_builder.set_property(
+            name,
+            value,
+            at=pcb.Position(x=0, y=0),
+            layer=f"{'B' if _is_bottom_layer(job.layer) else 'F'}.Fab",
+            hide=True,
+        )
+    if template is None:
+        footprint_builder.place(
+            pcb.Position(x=position.x, y=position.y, angle=-position.angle),
+            side=_board_side(job.layer),
+        )
+    return footprint_builder.model
+
+
+_WORKER_TEMPLATES: Dict[int, pcb.Footprint] = {}
+
+
+def _install_templates(templates: Dict[int, pcb.Footprint]) -> None:
+    _WORKER_TEMPLATES.clear()
+    _WORKER_TEMPLATES.update(templates)
+
+
+def render_footprint(
+    job: FootprintJob, template: Optional[pcb.Footprint] = None
+) -> str:
+    """Board item text of the footprint for ``job``."""
+    return kicad_board_text.footprint_item(build_footprint(job, template))
+
+
+def _render_worker_footprint(job: FootprintJob) -> str:
+    return render_footprint(job, _WORKER_TEMPLATES.get(job.template))
+
+
+def render_footprints(
+    jobs: Sequence[FootprintJob],
+    templates: Dict[int, pcb.Footprint],
+    *,
+    workers: int = 1,
+) -> list[str]:
+    """
+    Render board item text for ``jobs`` in order.
+
+    With more than one worker the jobs are split across processes. Each worker
+    receives the template table once at startup and returns finished text, so
+    only the small jobs and plain strings cross the process boundary.
+    """
+    if workers <= 1 or len(jobs) < 2:
+        return [render_footprint(job, templates.get(job.template)) for job in jobs]
+    with ProcessPoolExecutor(
+        workers,
+        initializer=_install_templates,
+        initargs=(templates,),
+    ) as executor:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        return list(executor.map(_render_worker_footprint, jobs, chunksize=chunksize))
+
+
+class IncrementalExport(NamedTuple):
+    regenerated: tuple[str, ...]
+    removed: tuple[str, ...]
+    added_nets: tuple[str, ...]
+    footprints: int
+
+
+# Board setup items that precede the net table and footprints.
+_BOARD_HEADER_TAGS = frozenset(
+    {
+        "version",
+        "generator",
+        "generator_version",
+        "general",
+        "paper",
+        "title_block",
+        "layers",
+        "setup",
+        "property",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ExportTables:
+    """
+    Net references and copper layer names of a board, fixed for one export.
+
+    Pads, tracks, zones and vias look their net up here instead of scanning
+    the board's net list for every item.
+    """
+
+    net_refs: Mapping[str, pcb.NetRef]
+    copper_layers: frozenset[str]
+
+    @classmethod
+    def build(cls, builder: PcbBuilder, net_names: Iterable[str]) -> "ExportTables":
+        """Register ``net_names`` on the board, appending codes for new nets."""
+        board = builder.model
+        refs = {}
+        if builder.uses_named_nets:
+            refs = {name: pcb.NetRef(name=name) for name in net_names}
+        else:
+            existing = {net.name: net for net in board.net}
+            code = max((net.code or 0 for net in board.net), default=0)
+            for name in net_names:
+                net = existing.get(name)
+                if net is None:
+                    code += 1
+                    net = existing[name] = pcb.Net(code=code, name=name)
+                    board.net.append(net)
+                refs[name] = pcb.NetRef(code=net.code, name=net.name)
+        return cls(
+            MappingProxyType(refs),
+            frozenset(layer.name for layer in builder.copper_layers),
+        )
+
+
 class KicadExporter:
     def __init__(
         self,
@@ -106,8 +355,10 @@ class KicadExporter:
         add_silkscreen_text: bool = True,
         add_fab_text: bool = True,
         strict_placement: bool = False,
+        workers: int = 1,
     ):
         self.schematic = schematic
+        self.workers = workers
         self.add_silkscreen_text = add_silkscreen_text
         self.add_fab_text = add_fab_text
         self.strict_placement = strict_placement
@@ -126,6 +377,9 @@ class KicadExporter:
                 copper_layer_count=self.schematic.layout.layer_count,
             )
         self.board = self.builder.model
+        self.templates: Dict[int, pcb.Footprint] = {}
+        self.footprint_digests: Dict[str, str] = {}
+        self._tables: Optional[ExportTables] = None
 
     def _collect_all_nets(self, schematic: sch_lib.Design) -> Dict[str, cmp.Net]:
         all_nets = dict(schematic.nets)
@@ -133,7 +387,33 @@ class KicadExporter:
             all_nets.update(self._collect_all_nets(module))
         return all_nets
 
-    def convert_to_kicad(self, schematic: sch_lib.Design):
+    def _net_names(self, schematic: sch_lib.Design) -> list[str]:
+        # Design nets first so codes follow the design's net order, then any
+        # net only named by layout copper.
+        layout = schematic.layout
+        names = dict.fromkeys(self._collect_all_nets(schematic))
+        for item in (*layout.tracks, *layout.pours, *layout.zones, *layout.vias):
+            names.setdefault(item.net_name)
+        return list(names)
+
+    @property
+    def tables(self) -> ExportTables:
+        """Net and layer tables of the current export, built on first use."""
+        if self._tables is None:
+            self._tables = ExportTables.build(
+                self.builder, self._net_names(self.schematic)
+            )
+        return self._tables
+
+    def footprint_jobs(self, schematic: sch_lib.Design) -> list[FootprintJob]:
+        """
+        Resolve every placed component of ``schematic`` into a footprint job.
+
+        All design nets are registered first so net codes follow the design's
+        net order. The KiCad templates the jobs refer to are collected in
+        ``self.templates`` and each job's content digest in
+        ``self.footprint_digests``.
+        """
         resolved_layout = schematic.layout.flatten_with_provenance()
         if self.strict_placement:
             fallback = [
@@ -146,18 +426,16 @@ class KicadExporter:
                     "Strict KiCad export requires explicit placement for: "
                     + ", ".join(fallback)
                 )
-        flattened_layout = {
-            refdes: (item.layout, item.component)
-            for refdes, item in resolved_layout.items()
-        }
 
-        for net in self._collect_all_nets(schematic).values():
-            self.builder.ensure_net(net.name)
+        self._tables = ExportTables.build(self.builder, self._net_names(schematic))
 
-        for cid, (component_layout, component) in flattened_layout.items():
+        jobs = []
+        template_digests: Dict[int, str] = {}
+        for cid, item in resolved_layout.items():
+            component_layout, component = item.layout, item.component
             if component.virtual:
                 continue
-            footprint = self.parse_footprint(
+            job = self.footprint_job(
                 cid,
                 component,
                 _to_kicad_position(component_layout.component),
@@ -168,8 +446,26 @@ class KicadExporter:
                 add_silkscreen_text=self.add_silkscreen_text,
                 add_fab_text=self.add_fab_text,
             )
-            self.builder.add_footprint(footprint)
+            if job.template is not None and job.template not in template_digests:
+                self.templates[job.template] = component.footprint.footprint
+                template_digests[job.template] = hashlib.sha256(
+                    component.footprint.sexp.encode()
+                ).hexdigest()
+            self.footprint_digests[job.reference] = job.digest(
+                template_digests.get(job.template, "")
+            )
+            jobs.append(job)
+        return jobs
+
+    def convert_to_kicad(self, schematic: sch_lib.Design):
+        for job in self.footprint_jobs(schematic):
+            self.builder.add_footprint(
+                build_footprint(job, self.templates.get(job.template))
+            )
+        self.add_layout_copper(schematic)
 
+    def add_layout_copper(self, schematic: sch_lib.Design):
+        """Add the layout's tracks, pours, zones and vias to the board."""
         for track in schematic.layout.tracks:
             self.add_track(track)
 
@@ -205,166 +501,108 @@ class KicadExporter:
                 ),
                 component.refdes,
             )
-        component_position = component_position or pcb.Position(x=0, y=0, angle=0)
-        id_position = id_position or pcb.Position(x=0, y=0, angle=0)
+        job = self.footprint_job(
+            cid,
+            component,
+            component_position,
+            id_position,
+            schematic,
+            id_orientation,
+            layer,
+            add_silkscreen_text=add_silkscreen_text,
+            add_fab_text=add_fab_text,
+        )
+        template = (
+            component.footprint.footprint
+            if isinstance(component.footprint, KicadFootprint)
+            else None
+        )
+        return build_footprint(job, template)
+
+    def footprint_job(
+        self,
+        cid: str,
+        component: cmp.Component,
+        component_position: Optional[pcb.Position] = None,
+        id_position: Optional[pcb.Position] = None,
+        schematic: Optional[sch_lib.Design] = None,
+        id_orientation: layout_lib.Orientation = layout_lib.Orientation.CENTER,
+        layer: layout_lib.Layer = layout_lib.Layer.TOP,
+        add_silkscreen_text: bool = True,
+        add_fab_text: bool = True,
+    ) -> FootprintJob:
+        """Resolve nets and properties of ``component`` into a picklable job."""
         schematic = schematic or component.parent
         if schematic is None:
             raise ValueError("schematic is required to parse a footprint")
-
         self._validate_component(component)
-        reference_justify = _reference_justify(id_orientation, layer)
 
+        pad_nets = []
+        native_pads = []
+        silk = ()
+        template = None
         if isinstance(component.footprint, KicadFootprint):
-            footprint_builder = FootprintBuilder(
-                component.footprint.footprint
-            ).instantiate(
-                reference=str(cid),
-                at=pcb.Position(
-                    x=component_position.x,
-                    y=component_position.y,
-                    angle=-component_position.angle,
-                ),
-                side=_board_side(layer),
-                reference_at=id_position,
-                reference_layer="F.SilkS",
-                reference_effects=text_effects(justify=reference_justify),
-            )
-            footprint = footprint_builder.model
-            if component.mpn:
-                footprint.description = component.mpn
-
-            # KiCad board instances store pad orientation in board coordinates,
-            # while pad positions remain footprint-local. FootprintBuilder.place()
-            # handles side mirroring but does not compose the placement rotation.
-            footprint_angle = footprint.at.angle if footprint.at is not None else 0.0
-            for pad in footprint.pads:
-                if pad.at is not None:
-                    pad.at.angle += footprint_angle
-
-            for pad in footprint.pads:
+            template = id(component.footprint.footprint)
+            for pad in component.footprint.footprint.pads:
                 if pad.pad_type == "np_thru_hole":
                     continue
-                try:
-                    index = int(pad.number)
-                except (ValueError, TypeError):
-                    index = pad.number
-                try:
-                    pin = component.pins[index]
-                except (KeyError, TypeError, ValueError):
-                    # PinContainer.by_index raises ValueError for an unknown
-                    # index. Pads with no matching pin are normal KiCad
-                    # geometry, including unnumbered paste apertures and
-                    # mechanical or shield pads; preserve them without a net.
-                    continue
-                net = schematic.pin_to_net.get(pin)
+                # Pads with no matching pin are normal KiCad geometry, including
+                # unnumbered paste apertures and mechanical or shield pads;
+                # preserve them without a net.
+                pin = layout_lib.pad_pin(component, pad.number)
+                net = schematic.pin_to_net.get(pin) if pin is not None else None
                 if net:
-                    pad.net = self.builder.ensure_net(net.name)
-
+                    pad_nets.append((pad.number, self._net_ref(net.name)))
         else:
-            footprint_builder = FootprintBuilder.create(
-                component.name,
-                description=component.mpn or None,
-            )
-            footprint_builder.set_reference(
-                str(cid),
-                at=id_position,
-                layer="F.SilkS",
-                effects=text_effects(justify=reference_justify),
-            )
-            footprint_builder.set_property(
-                "Value",
-                component.footprint.name,
-                at=pcb.Position(x=0, y=0),
-                layer="F.Fab",
-                hide=not add_fab_text,
-            )
-
             for index, pad in component.footprint.pads.items():
                 shape, size = aperture_to_shape_size(pad.aperture)
-                pin = component.pins[index]
-                net = schematic.pin_to_net.get(pin)
-                net_ref = self.builder.ensure_net(net.name) if net else None
-                hole = getattr(pad.aperture, "hole", None)
-                pad_layer_prefix = "*" if hole else "F"
-                pad_layers = [f"{pad_layer_prefix}.Cu", f"{pad_layer_prefix}.Mask"]
-                if not hole:
-                    pad_layers.append(f"{pad_layer_prefix}.Paste")
-                footprint_builder.add_pad(
-                    str(index),
-                    pad_type="thru_hole" if hole else "smd",
-                    shape=shape,
-                    at=pcb.Position(
-                        x=pad.location[0],
-                        y=pad.location[1],
-                        angle=component_position.angle,
-                    ),
-                    size=size,
-                    drill=pcb.PadDrill(diameter=hole) if hole else None,
-                    layers=pad_layers,
-                    net=net_ref,
-                )
-
-            for polysilk in component.footprint.silk:
-                for index in range(len(polysilk) - 1):
-                    previous, current = polysilk[index : index + 2]
-                    footprint_builder.add_line(
-                        Point(x=previous[0], y=previous[1]),
-                        Point(x=current[0], y=current[1]),
-                        layer="F.SilkS",
+                net = schematic.pin_to_net.get(component.pins[index])
+                native_pads.append(
+                    _NativePad(
+                        str(index),
+                        shape,
+                        size,
+                        (pad.location[0], pad.location[1]),
+                        getattr(pad.aperture, "hole", None),
+                        self._net_ref(net.name) if net else None,
                     )
+                )
+            silk = tuple(
+                tuple((point[0], point[1]) for point in polysilk)
+                for polysilk in component.footprint.silk
+            )
 
-        reference = footprint_builder.reference
-        if reference is not None:
-            _set_text_hidden(reference, not add_silkscreen_text)
-        if not add_silkscreen_text:
-            _hide_text_on_layer(footprint_builder.model, ".SilkS")
-        if not add_fab_text:
-            _hide_text_on_layer(footprint_builder.model, ".Fab")
-
-        footprint_builder.set_property(
-            "MPN",
-            component.mpn or "",
-            at=pcb.Position(x=0, y=0),
-            layer=f"{'B' if _is_bottom_layer(layer) else 'F'}.Fab",
-            hide=True,
-        )
-        footprint_builder.set_property(
-            "Manufacturer",
-            component.manufacturer or "",
-            at=pcb.Position(x=0, y=0),
-            layer=f"{'B' if _is_bottom_layer(layer) else 'F'}.Fab",
-            hide=True,
-        )
-        metadata = {
+        properties = {
+            "MPN": component.mpn,
+            "Manufacturer": component.manufacturer,
             "Datasheet": component.datasheet,
             "Datasheet Revision": component.datasheet_revision,
             "Datasheet SHA256": component.datasheet_sha256,
             "Lifecycle": component.lifecycle.value,
         }
-        metadata.update(
+        properties.update(
             {
                 f"Distributor:{name.lower()}": identifier
                 for name, identifier in sorted(component.distributor_ids.items())
             }
         )
-        for name, value in metadata.items():
-            footprint_builder.set_property(
-                name,
-                value or "",
-                at=pcb.Position(x=0, y=0),
-                layer=f"{'B' if _is_bottom_layer(layer) else 'F'}.Fab",
-                hide=True,
-            )
-        if not isinstance(component.footprint, KicadFootprint):
-            footprint_builder.place(
-                pcb.Position(
-                    x=component_position.x,
-                    y=component_position.y,
-                    angle=-component_position.angle,
-                ),
-                side=_board_side(layer),
-            )
-        return footprint_builder.model
+        return FootprintJob(
+            reference=str(cid),
+            name=component.name,
+            value=component.footprint.name,
+            description=component.mpn or None,
+            position=component_position or pcb.Position(x=0, y=0, angle=0),
+            id_position=id_position or pcb.Position(x=0, y=0, angle=0),
+            id_orientation=id_orientation,
+            layer=layer,
+            properties=tuple((name, value or "") for name, value in properties.items()),
+            add_silkscreen_text=add_silkscreen_text,
+            add_fab_text=add_fab_text,
+            template=template,
+            pad_nets=tuple(pad_nets),
+            pads=tuple(native_pads),
+            silk=silk,
+        )
 
     def _validate_component(self, component: cmp.Component):
         if not component.footprint:
@@ -412,9 +650,17 @@ class KicadExporter:
                 layer=f"{'B' if _is_bottom_layer(item.layer) else 'F'}.SilkS",
             )
 
+    def _net_ref(self, net_name: str, owner: str = "parse_footprint()") -> pcb.NetRef:
+        reference = self.tables.net_refs.get(net_name)
+        if reference is None:
+            # Only reached for nets outside the exported design and layout.
+            cmp.validate_net_name(net_name, owner=owner)
+            reference = self.builder.ensure_net(net_name)
+        return reference
+
     def add_pours(self, config: layout_lib.PourLayer):
         outline = self.schematic.layout.outline
-        net_name = cmp.validate_net_name(config.net_name, owner="add_pours()")
+        net = self._net_ref(config.net_name, owner="add_pours()")
         self.builder.add_zone(
             [
                 Point(x=outline.x1, y=outline.y1),
@@ -423,11 +669,11 @@ class KicadExporter:
                 Point(x=outline.x1, y=outline.y2),
             ],
             layer=self.builder.copper_layer(config.layer).name,
-            net=net_name,
+            net=net,
         )
 
     def _validate_copper_layer(self, layer: str) -> str:
-        available = {item.name for item in self.builder.copper_layers}
+        available = self.tables.copper_layers
         if layer not in available:
             raise ValueError(
                 f"Copper layer {layer!r} is not available; expected one of "
@@ -437,8 +683,9 @@ class KicadExporter:
 
     def add_track(self, config: layout_lib.Track):
         layer = self._validate_copper_layer(config.layer)
-        net_name = cmp.validate_net_name(config.net_name, owner="add_track()")
-        net = self.builder.net_value(net_name)
+        net = self.builder.net_value(
+            self._net_ref(config.net_name, owner="add_track()")
+        )
         identifier = str(uuid.uuid4())
         common = {
             "start": Point(x=config.start.x, y=config.start.y),
@@ -465,11 +712,10 @@ class KicadExporter:
         if len(config.layers) != 1:
             raise ValueError("Only single-layer copper zones are supported")
         layer = self._validate_copper_layer(config.layers[0])
-        net_name = cmp.validate_net_name(config.net_name, owner="add_zone()")
         zone = self.builder.add_zone(
             [Point(x=point.x, y=point.y) for point in config.outline],
             layer=layer,
-            net=net_name,
+            net=self._net_ref(config.net_name, owner="add_zone()"),
             clearance=config.clearance,
             min_thickness=config.min_thickness,
             fill=config.fill,
@@ -480,23 +726,167 @@ class KicadExporter:
         return zone
 
     def add_via(self, config: layout_lib.ViaConfig):
-        net_name = cmp.validate_net_name(config.net_name, owner="add_via()")
         self.builder.add_via(
             pcb.Position(x=config.location[0], y=config.location[1]),
             size=config.hole_size,
             drill=config.drill_size,
-            net=net_name,
+            net=self._net_ref(config.net_name, owner="add_via()"),
         )
 
-    def save(self, output_folder="./generated_outputs/", overwrite=False):
+    def section_digests(self) -> dict[str, str]:
+        """Content hashes of the board sections drawn from the layout."""
+        layout = self.schematic.layout
+        sections = {
+            "outline": layout.outline,
+            "fab": layout.flatten_fab(),
+            "silk": layout.flatten_silk(),
+            "copper": (layout.tracks, layout.vias, layout.zones, layout.pours),
+        }
+        return {
+            name: hashlib.sha256(repr(content).encode()).hexdigest()
+            for name, content in sections.items()
+        }
+
+    def update_board(self, path: pathlib.Path) -> IncrementalExport:
+        """
+        Rewrite only the footprints of an existing board whose inputs changed.
+
+        Footprints are matched by reference against the digests recorded by the
+        previous export. Every other top-level item, including unchanged
+        footprints and the tracks, vias, zones and drawings on the board, is
+        copied from the board text as written, so routing done in KiCad
+        survives. Nets new to the design are appended to the board's net table;
+        existing net codes never move.
+
+        :raises ValueError: If the layout's outline, fab or silk drawings, or
+            copper changed since the previous export, or no export of the
+            board was recorded. Those sections are not rewritten in place.
+        """
+        path = pathlib.Path(path)
+        previous = kicad_board_text.load_export_state(path)
+        sections = self.section_digests()
+        changed_sections = [
+            name
+            for name, digest in sections.items()
+            if previous.sections.get(name) != digest
+        ]
+        if changed_sections:
+            raise ValueError(
+                f"Cannot update {path} incrementally: layout "
+                + ", ".join(changed_sections)
+                + " changed since its last recorded export; run a full export"
+            )
+        board_text = kicad_board_text.split_board(path.read_text(encoding="utf-8"))
+        version = kicad_board_text.board_version(board_text)
+        if version is not None:
+            self.board.version = version
+
+        tags = [kicad_board_text.item_tag(item) for item in board_text.items]
+        self.board.net = [
+            net
+            for tag, item in zip(tags, board_text.items)
+            if tag == "net"
+            for net in [kicad_board_text.net_entry(item)]
+            if net is not None
+        ]
+        board_nets = {net.name for net in self.board.net}
+        on_board = {
+            kicad_board_text.footprint_reference(item)
+            for tag, item in zip(tags, board_text.items)
+            if tag == "footprint"
+        }
+
+        jobs = self.footprint_jobs(self.schematic)
+        changed = [
+            job
+            for job in jobs
+            if job.reference not in on_board
+            or previous.footprints.get(job.reference)
+            != self.footprint_digests[job.reference]
+        ]
+        rebuilt = dict(
+            zip(
+                (job.reference for job in changed),
+                render_footprints(changed, self.templates, workers=self.workers),
+            )
+        )
+        added_nets = [net for net in self.board.net if net.name not in board_nets]
+        wanted = {job.reference for job in jobs}
+
+        items = []
+        removed = []
+        for tag, item in zip(tags, board_text.items):
+            if tag == "footprint":
+                reference = kicad_board_text.footprint_reference(item)
+                if reference not in wanted:
+                    removed.append(reference)
+                    continue
+                item = rebuilt.pop(reference, item)
+            items.append((tag, item))
+        new_items = {
+            "net": [kicad_board_text.net_item(net) for net in added_nets],
+            "footprint": list(rebuilt.values()),
+        }
+        for tag in ("net", "footprint"):
+            anchor = max(
+                (
+                    index + 1
+                    for index, (item_tag, _) in enumerate(items)
+                    if item_tag in _BOARD_HEADER_TAGS or item_tag in ("net", tag)
+                ),
+                default=0,
+            )
+            items[anchor:anchor] = [(tag, item) for item in new_items[tag]]
+
+        kicad_board_text.write_atomically(
+            path,
+            [board_text.head, *(item for _, item in items), board_text.tail],
+        )
+        return IncrementalExport(
+            regenerated=tuple(job.reference for job in changed),
+            removed=tuple(removed),
+            added_nets=tuple(net.name for net in added_nets),
+            footprints=len(jobs),
+        )
+
+    def save(
+        self,
+        output_folder="./generated_outputs/",
+        overwrite=False,
+        incremental=False,
+    ):
         path = pathlib.Path(output_folder) / f"{self.schematic.name}.kicad_pcb"
         constraint_errors = signal_integrity.validate_design(self.schematic)
         if constraint_errors:
             raise ValueError("; ".join(constraint_errors))
-        self.convert_to_kicad(self.schematic)
-        self.draw_board_outline()
-        self.draw_fab_lines()
-        self.draw_silkscreen_lines()
-        write_to_file(self.board, path)
+        if incremental and path.is_file():
+            result = self.update_board(path)
+            message = (
+                f"Updated {len(result.regenerated)} of {result.footprints} "
+                f"footprints in board file: {path}"
+            )
+        else:
+            footprints = render_footprints(
+                self.footprint_jobs(self.schematic),
+                self.templates,
+                workers=self.workers,
+            )
+            self.add_layout_copper(self.schematic)
+            self.draw_board_outline()
+            self.draw_fab_lines()
+            self.draw_silkscreen_lines()
+            kicad_board_text.write_atomically(
+                path,
+                kicad_board_text.iter_board_text(
+                    self.board, {"footprint": [*self.board.footprint, *footprints]}
+                ),
+            )
+            message = f"{'Overwrote' if overwrite else 'Wrote'} board file: {path}"
+        kicad_board_text.save_export_state(
+            path,
+            kicad_board_text.ExportState(
+                self.footprint_digests, self.section_digests()
+            ),
+        )
         save_constraints(self.schematic, output_folder)
-        print(f"{'Overwrote' if overwrite else 'Wrote'} board file: {path}")
+        print(message)
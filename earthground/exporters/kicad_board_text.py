@@ -0,0 +1,258 @@
+"""Top-level item access to ``.kicad_pcb`` source text without a full parse."""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import re
+import tempfile
+import uuid
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional
+
+from pykicad import write_to_string
+import pykicad.models.pcb as pcb
+
+EXPORT_STATE_SCHEMA = 2
+EXPORT_STATE_SUFFIX = ".earthground-export.json"
+
+_ITEM_START = re.compile(r"^\t\(", re.MULTILINE)
+_TAG = re.compile(r"\t\(([^\s()]+)")
+_QUOTED = r'"((?:[^"\\]|\\.)*)"'
+_REFERENCE = re.compile(
+    r'\((?:property "Reference"|fp_text reference) ' + _QUOTED, re.MULTILINE
+)
+_NET = re.compile(r"\t\(net (\d+) " + _QUOTED + r"\)")
+_VERSION = re.compile(r"\t\(version (\d+)\)")
+_UUID = re.compile(r"[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}")
+_ESCAPES = {"n": "\n", "r": "\r"}
+
+# Board lists rendered a chunk at a time, with items per chunk. Everything
+# else in a board is small and rendered in one piece.
+STREAMED_FIELDS = {"footprint": 64, "graphic_item": 1024, "track": 1024, "zone": 16}
+
+
+class BoardText(NamedTuple):
+    """
+    A board split into its top-level items.
+
+    ``items`` keep their own indentation and trailing newline, so joining
+    ``head``, the items and ``tail`` reproduces the source exactly.
+    """
+
+    head: str
+    items: list[str]
+    tail: str
+
+
+def split_board(text: str) -> BoardText:
+    """
+    Split KiCad 7+ board text into top-level items.
+
+    KiCad and pykicad indent every top-level item with one tab and never embed
+    raw newlines in strings, so an item begins wherever a line starts with
+    ``\\t(``.
+    """
+    if not text.startswith("(kicad_pcb"):
+        raise ValueError("Expected KiCad PCB text starting with (kicad_pcb")
+    starts = [match.start() for match in _ITEM_START.finditer(text)]
+    end = text.rstrip().rfind("\n") + 1
+    if not starts or text[end:].strip() != ")" or starts[-1] >= end:
+        raise ValueError(
+            "Board text is not in the tab-indented layout written by KiCad 7 "
+            "or later"
+        )
+    items = [text[start:stop] for start, stop in zip(starts, starts[1:] + [end])]
+    return BoardText(text[: starts[0]], items, text[end:])
+
+
+def item_tag(item: str) -> str:
+    match = _TAG.match(item)
+    return match.group(1) if match else ""
+
+
+def _unquote(value: str) -> str:
+    return re.sub(r"\\(.)", lambda match: _ESCAPES.get(match[1], match[1]), value)
+
+
+def quote(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def footprint_reference(item: str) -> Optional[str]:
+    match = _REFERENCE.search(item)
+    return _unquote(match.group(1)) if match else None
+
+
+def replace_footprint_reference(item: str, reference: str) -> str:
+    """Return footprint ``item`` with its Reference text set to ``reference``."""
+    match = _REFERENCE.search(item)
+    if match is None:
+        raise ValueError("Footprint text has no Reference property or text")
+    start, end = match.span(1)
+    return item[: start - 1] + quote(reference) + item[end + 1 :]
+
+
+def regenerate_uuids(item: str) -> str:
+    """Give every UUID in ``item`` a fresh random value."""
+    return _UUID.sub(lambda _: str(uuid.uuid4()), item)
+
+
+def net_entry(item: str) -> Optional[pcb.Net]:
+    match = _NET.match(item)
+    if match is None:
+        return None
+    return pcb.Net(code=int(match.group(1)), name=_unquote(match.group(2)))
+
+
+def board_version(board: BoardText) -> Optional[int]:
+    for item in board.items:
+        match = _VERSION.match(item)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def footprint_item(footprint: pcb.Footprint) -> str:
+    """Render ``footprint`` as a top-level board item."""
+    return "".join(
+        "\t" + line if line.strip() else line
+        for line in write_to_string(footprint).splitlines(keepends=True)
+    )
+
+
+def net_item(net: pcb.Net) -> str:
+    return f"\t(net {net.code} {quote(net.name)})\n"
+
+
+def write_atomically(path: pathlib.Path, chunks: Iterable[str]) -> None:
+    """Write ``chunks`` to a temporary file beside ``path`` and rename it over."""
+    path = pathlib.Path(path)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            newline="",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as output:
+            temp_path = pathlib.Path(output.name)
+            output.writelines(chunks)
+        if path.exists():
+            os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path is not None and temp_path.exists():
+            temp_path.unlink()
+
+
+def iter_board_text(
+    board: pcb.Pcb, items: Optional[Mapping[str, Iterable[Any]]] = None
+) -> Iterator[str]:
+    """
+    Yield the text of ``write_to_string(board)`` piece by piece.
+
+    Footprints, drawings, tracks and zones are rendered through small
+    stand-in boards a chunk at a time, so neither the whole document nor the
+    formatter's per-character buffer for it is ever held in memory.
+
+    ``items`` replaces the contents of any of those lists with an iterable of
+    models or of already rendered top-level item text, which is written
+    verbatim in place.
+    """
+    items = items or {}
+    skeleton = split_board(
+        write_to_string(board.model_copy(update={name: [] for name in STREAMED_FIELDS}))
+    )
+    # Fields after the streamed lists, then unmodelled extras, close the board.
+    trailing_tags = {"group", "embedded_fonts", *(board.model_extra or {})}
+    trailer = next(
+        (
+            index
+            for index, item in enumerate(skeleton.items)
+            if item_tag(item) in trailing_tags
+        ),
+        len(skeleton.items),
+    )
+    yield skeleton.head
+    yield from skeleton.items[:trailer]
+
+    def stand_in(**fields) -> pcb.Pcb:
+        return pcb.Pcb(version=board.version, generator=board.generator, **fields)
+
+    preamble = len(split_board(write_to_string(stand_in())).items)
+
+    def render(name: str, chunk: list) -> list[str]:
+        if not chunk:
+            return []
+        return split_board(write_to_string(stand_in(**{name: chunk}))).items[preamble:]
+
+    for name, chunk_size in STREAMED_FIELDS.items():
+        chunk = []
+        for item in items.get(name, getattr(board, name)):
+            if isinstance(item, str):
+                yield from render(name, chunk)
+                chunk = []
+                yield item
+                continue
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield from render(name, chunk)
+                chunk = []
+        yield from render(name, chunk)
+    yield from skeleton.items[trailer:]
+    yield skeleton.tail
+
+
+def write_board(path: pathlib.Path, board: pcb.Pcb) -> None:
+    """Stream ``board`` to a temporary file and atomically replace ``path``."""
+    write_atomically(path, iter_board_text(board))
+
+
+def export_state_path(board_path: pathlib.Path) -> pathlib.Path:
+    board_path = pathlib.Path(board_path)
+    return board_path.with_name(board_path.stem + EXPORT_STATE_SUFFIX)
+
+
+class ExportState(NamedTuple):
+    """Digests recorded by the last export of a board.
+
+    ``footprints`` maps references to footprint digests; ``sections`` maps
+    the other board sections drawn from the layout to theirs.
+    """
+
+    footprints: dict[str, str]
+    sections: dict[str, str]
+
+
+def load_export_state(board_path: pathlib.Path) -> ExportState:
+    """Digests recorded by the last export of ``board_path``."""
+    path = export_state_path(board_path)
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ExportState({}, {})
+    if not isinstance(document, dict) or document.get("schema") != EXPORT_STATE_SCHEMA:
+        return ExportState({}, {})
+    footprints = document.get("footprints")
+    sections = document.get("sections")
+    return ExportState(
+        dict(footprints) if isinstance(footprints, dict) else {},
+        dict(sections) if isinstance(sections, dict) else {},
+    )
+
+
+def save_export_state(board_path: pathlib.Path, state: ExportState) -> None:
+    document = {
+        "schema": EXPORT_STATE_SCHEMA,
+        "footprints": dict(sorted(state.footprints.items())),
+        "sections": dict(sorted(state.sections.items())),
+    }
+    write_atomically(
+        export_state_path(board_path),
+        [json.dumps(document, indent=2) + "\n"],
+    )
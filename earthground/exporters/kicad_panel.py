@@ -0,0 +1,219 @@
+"""Export a panel of transformed copies of one design as a single KiCad board."""
+
+from __future__ import annotations
+
+import pathlib
+import re
+import uuid
+from typing import Iterable, Iterator, Optional, Sequence
+
+from pykicad.models.base import Point
+from pykicad.writer.formatter import format_kicad_number
+import pykicad.models.pcb as pcb
+
+import earthground.exporters.kicad_board_text as kicad_board_text
+import earthground.layout as layout_lib
+import earthground.schematic as sch_lib
+import earthground.signal_integrity as signal_integrity
+from earthground.exporters.kicad import KicadExporter
+
+# The footprint's own position is its only child at two tabs of indentation.
+_FOOTPRINT_AT = re.compile(r"^(\t\t\(at )[^\s)]+ [^\s)]+", re.MULTILINE)
+_NET_NAME = '(net "'
+_POINT_FIELDS = ("start", "mid", "end", "center")
+_POINT_LIST_FIELDS = ("points", "polygon")
+
+
+def panel_grid(
+    columns: int, rows: int, pitch_x: float, pitch_y: float
+) -> list[layout_lib.Position]:
+    """Offsets of a ``columns`` x ``rows`` array, row by row from the origin."""
+    if columns < 1 or rows < 1:
+        raise ValueError("A panel grid needs at least one column and one row")
+    return [
+        layout_lib.Position(column * pitch_x, row * pitch_y, 0)
+        for row in range(rows)
+        for column in range(columns)
+    ]
+
+
+def _transform_point(point: Point, copy: layout_lib.Position) -> Point:
+    moved = layout_lib.transform_position(
+        layout_lib.Position(point.x, point.y, 0), copy
+    )
+    return Point(x=moved.x, y=moved.y)
+
+
+def _transformed_item(item, copy: layout_lib.Position, net_prefix: str):
+    """Copy of a board drawing, track or zone moved into panel copy ``copy``."""
+    updates = {}
+    for name in _POINT_FIELDS:
+        point = getattr(item, name, None)
+        if point is not None:
+            updates[name] = _transform_point(point, copy)
+    for name in _POINT_LIST_FIELDS:
+        points = getattr(item, name, None)
+        if points:
+            updates[name] = [_transform_point(point, copy) for point in points]
+    at = getattr(item, "at", None)
+    if at is not None:
+        moved = _transform_point(at, copy)
+        angle = at.angle
+        if copy.angle:
+            angle = (angle or 0) - copy.angle
+        updates["at"] = at.model_copy(
+            update={"x": moved.x, "y": moved.y, "angle": angle}
+        )
+    net = getattr(item, "net", None)
+    if isinstance(net, str) and net:
+        updates["net"] = net_prefix + net
+    for name in ("uuid", "tstamp"):
+        if getattr(item, name, None) is not None:
+            updates[name] = str(uuid.uuid4())
+    return item.model_copy(update=updates)
+
+
+def _rotated_footprint(footprint: pcb.Footprint, angle: float) -> pcb.Footprint:
+    """``footprint`` turned by the earthground ``angle`` about its origin."""
+    if not angle:
+        return footprint
+    rotated = footprint.model_copy(deep=True)
+    # KiCad angles run opposite to earthground's, and board instances store
+    # pad orientation in board coordinates.
+    rotated.at.angle = (rotated.at.angle or 0) - angle
+    for pad in rotated.pads:
+        if pad.at is not None:
+            pad.at.angle = (pad.at.angle or 0) - angle
+    return rotated
+
+
+class KicadPanelExporter(KicadExporter):
+    """
+    Export ``copies`` of one design as a single KiCad panel board.
+
+    Each copy is an offset and rotation applied to the whole design. The design
+    is converted once; every footprint is rendered to text once per distinct
+    copy rotation, and each copy rewrites only its position, reference,
+    nets and UUIDs. Board drawings, tracks and zones are transformed per copy.
+    Reference designators and net names take the copy's ``refdes_prefix``,
+    formatted with the 1-based copy number, so copies stay electrically
+    separate. Rotations must be multiples of 90 degrees.
+    """
+
+    def __init__(
+        self,
+        schematic: sch_lib.Design,
+        copies: Sequence[layout_lib.Position],
+        refdes_prefix: str = "P{}_",
+        add_silkscreen_text: bool = True,
+        add_fab_text: bool = True,
+        strict_placement: bool = False,
+    ):
+        if not copies:
+            raise ValueError("A panel needs at least one copy")
+        for copy in copies:
+            if copy.angle % 90:
+                raise ValueError(
+                    f"Panel copy rotation must be a multiple of 90 degrees: {copy}"
+                )
+        super().__init__(
+            schematic,
+            add_silkscreen_text=add_silkscreen_text,
+            add_fab_text=add_fab_text,
+            strict_placement=strict_placement,
+        )
+        if not self.builder.uses_named_nets:
+            raise ValueError("Panel export requires a board with named nets")
+        self.copies = [layout_lib.Position(*copy) for copy in copies]
+        self.prefixes = [
+            refdes_prefix.format(number) for number in range(1, len(copies) + 1)
+        ]
+        self._converted = False
+
+    def _footprint_variants(self) -> list[tuple[pcb.Footprint, dict[float, str]]]:
+        angles = dict.fromkeys(copy.angle % 360 for copy in self.copies)
+        return [
+            (
+                footprint,
+                {
+                    angle: kicad_board_text.footprint_item(
+                        _rotated_footprint(footprint, angle)
+                    )
+                    for angle in angles
+                },
+            )
+            for footprint in self.board.footprint
+        ]
+
+    def _panel_footprints(self) -> Iterator[str]:
+        variants = self._footprint_variants()
+        for copy, prefix in zip(self.copies, self.prefixes):
+            net_prefix = _NET_NAME + prefix
+            for footprint, texts in variants:
+                x, y, _ = layout_lib.transform_position(
+                    layout_lib.Position(footprint.at.x, footprint.at.y, 0), copy
+                )
+                text = _FOOTPRINT_AT.sub(
+                    lambda match: (
+                        f"{match[1]}{format_kicad_number(x)} {format_kicad_number(y)}"
+                    ),
+                    texts[copy.angle % 360],
+                    count=1,
+                )
+                reference = kicad_board_text.footprint_reference(text)
+                if reference is not None:
+                    text = kicad_board_text.replace_footprint_reference(
+                        text, prefix + reference
+                    )
+                if prefix:
+                    text = text.replace(_NET_NAME, net_prefix)
+                yield kicad_board_text.regenerate_uuids(text)
+
+    def _panel_items(self, items: Sequence) -> Iterable:
+        for copy, prefix in zip(self.copies, self.prefixes):
+            for item in items:
+                yield _transformed_item(item, copy, prefix)
+
+    def iter_panel_text(self) -> Iterator[str]:
+        """Yield the panel board text, converting the design on first use."""
+        if not self._converted:
+            self.convert_to_kicad(self.schematic)
+            self.draw_board_outline()
+            self.draw_fab_lines()
+            self.draw_silkscreen_lines()
+            self._converted = True
+        return kicad_board_text.iter_board_text(
+            self.board,
+            {
+                "footprint": self._panel_footprints(),
+                "graphic_item": self._panel_items(self.board.graphic_item),
+                "track": self._panel_items(self.board.track),
+                "zone": self._panel_items(self.board.zone),
+            },
+        )
+
+    def save(
+        self,
+        output_folder="./generated_outputs/",
+        overwrite=False,
+        path: Optional[pathlib.Path] = None,
+    ) -> pathlib.Path:
+        """
+        Stream the panel to ``<design name>_panel.kicad_pcb`` or ``path``.
+
+        Net-class constraints are not written: panel net names carry their copy
+        prefix and would not match the design's classes.
+        """
+        path = pathlib.Path(
+            path
+            or pathlib.Path(output_folder) / f"{self.schematic.name}_panel.kicad_pcb"
+        )
+        constraint_errors = signal_integrity.validate_design(self.schematic)
+        if constraint_errors:
+            raise ValueError("; ".join(constraint_errors))
+        kicad_board_text.write_atomically(path, self.iter_panel_text())
+        print(
+            f"{'Overwrote' if overwrite else 'Wrote'} panel board file with "
+            f"{len(self.copies)} copies: {path}"
+        )
+        return path
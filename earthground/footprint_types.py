@@ -55,6 +55,19 @@ class BoundingBox(NamedTuple):
         return cls(x, y, x + width, y + height)
 
 
+def pad_half_size(pad: Pad) -> tuple[float, float]:
+    """Half width and height of the axis-aligned box around a pad aperture."""
+    if isinstance(pad.aperture, ap_lib.ApertureCircle):
+        return pad.aperture.r, pad.aperture.r
+    angle = math.radians(pad.aperture.rotation)
+    cos_angle = abs(math.cos(angle))
+    sin_angle = abs(math.sin(angle))
+    return (
+        cos_angle * pad.aperture.width / 2 + sin_angle * pad.aperture.height / 2,
+        sin_angle * pad.aperture.width / 2 + cos_angle * pad.aperture.height / 2,
+    )
+
+
 class BaseFootprint:
     def __init__(self) -> None:
         self.pads: Dict[str, Pad] = {}
@@ -69,27 +82,30 @@ class BaseFootprint:
         min_x, min_y = float("inf"), float("inf")
         max_x, max_y = float("-inf"), float("-inf")
         for pad in self.pads.values():
-            if isinstance(pad.aperture, ap_lib.ApertureCircle):
-                r = pad.aperture.r
-                hw, hh = r, r
-            elif isinstance(pad.aperture, ap_lib.ApertureRectangle):
-                angle = math.radians(pad.aperture.rotation)
-                cos_angle = abs(math.cos(angle))
-                sin_angle = abs(math.sin(angle))
-                hw = (
-                    cos_angle * pad.aperture.width / 2
-                    + sin_angle * pad.aperture.height / 2
-                )
-                hh = (
-                    sin_angle * pad.aperture.width / 2
-                    + cos_angle * pad.aperture.height / 2
-                )
+            hw, hh = pad_half_size(pad)
             min_x = min(min_x, pad.location[0] - hw)
             min_y = min(min_y, pad.location[1] - hh)
             max_x = max(max_x, pad.location[0] + hw)
             max_y = max(max_y, pad.location[1] + hh)
         return BoundingBox(min_x, min_y, max_x, max_y)
 
+    def get_pad_bbox(self, number) -> BoundingBox:
+        """Footprint-local box of one pad."""
+        pad = self.pads[number]
+        hw, hh = pad_half_size(pad)
+        x, y = pad.location[0], pad.location[1]
+        return BoundingBox(x - hw, y - hh, x + hw, y + hh)
+
+    def get_pad_copper_layers(self, number) -> tuple[str, ...]:
+        """Copper layers of a pad when placed on the top side; ``*.Cu`` is all."""
+        if getattr(self.pads[number].aperture, "hole", None):
+            return ("*.Cu",)
+        return ("F.Cu",)
+
+    def get_courtyard_bbox(self) -> BoundingBox:
+        """Keep-out box used for placement overlap checks; the pad box by default."""
+        return self.get_bbox()
+
 
 class EP(NamedTuple):
     aperture: ap_lib.ApertureRectangle
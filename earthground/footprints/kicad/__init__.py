@@ -1,4 +1,8 @@
-"""Autocompletable enums for footprints installed with the project's KiCad."""
+"""Autocompletable enums for footprints installed with the project's KiCad.
+
+Library classes are listed by a small generated index and each library's
+module is imported the first time one of its classes is used.
+"""
 
 from pathlib import Path
 
@@ -6,5 +10,17 @@ from earthground.kicad.catalog import ensure_environment_catalog
 
 ensure_environment_catalog(Path(__file__).parent)
 
-from ._generated import *  # noqa: E402,F401,F403
+from . import _generated  # noqa: E402
 from ._generated import __all__  # noqa: E402,F401
+
+
+def __getattr__(name):
+    if name not in _generated._LIBRARIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_generated, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -1,8 +1,17 @@
+import copy
+import hashlib
+import json
+import math
+import os
 import pathlib
-from typing import List, Optional, Union, overload
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Hashable, Iterable, List, NamedTuple, Optional, Union, overload
 
 import pygerber.aperture as ap_lib
-from pykicad import Footprint, read_from_string
+from pykicad import Footprint, FootprintBuilder, read_from_string
+from pykicad.models.base import Point
 import pykicad.models.pcb as pcb
 
 import earthground.footprint_types as ft
@@ -10,8 +19,14 @@ from earthground.footprint_types import BoundingBox, KicadFootprintRef
 from earthground.kicad.catalog import (
     KicadCatalogError,
     find_footprint_path,
+    find_footprint_paths,
     resolve_footprint_roots,
 )
+from earthground.kicad.footprint_cache import (
+    FootprintCache,
+    default_cache_path,
+    open_cache,
+)
 
 DEFAULT_FOOTPRINT_PATH = {
     "darwin": "/Applications/KiCad/KiCad.app/Contents/SharedSupport/footprints/",
@@ -65,15 +80,28 @@ class KicadFootprint(ft.BaseFootprint):
     while electrical pads are exposed through Earthground's footprint model.
     """
 
-    def __init__(self, library: str, footprint_name: str, sexp: str):
+    def __init__(
+        self,
+        library: str,
+        footprint_name: str,
+        sexp: str,
+        *,
+        model: Optional[Footprint] = None,
+    ):
+        """
+        :param model: Already parsed typed model of ``sexp``, as restored from
+            the persistent footprint cache. Parsed from ``sexp`` when omitted.
+        """
         super().__init__()
         self.name = footprint_name
         self.description = footprint_name
         self.sexp = sexp
-        document = read_from_string(sexp)
-        if not isinstance(document.model, Footprint):
-            raise TypeError("KiCad footprint text did not produce a Footprint")
-        self.footprint = document.model
+        if model is None:
+            document = read_from_string(sexp)
+            if not isinstance(document.model, Footprint):
+                raise TypeError("KiCad footprint text did not produce a Footprint")
+            model = document.model
+        self.footprint = model
         for pad in self.footprint.pads:
             if not pad.number or pad.pad_type == "np_thru_hole" or pad.size is None:
                 continue
@@ -96,16 +124,211 @@ class KicadFootprint(ft.BaseFootprint):
             return BoundingBox(-0.5, -0.5, 0.5, 0.5)
         return super().get_bbox()
 
+    def copy(self) -> "KicadFootprint":
+        """
+        Return a new instance sharing this footprint's parsed template.
+
+        The S-expression and typed ``footprint`` model are shared and must be
+        treated as read-only; the exporter deep-copies the model for each board
+        instance. Pad, silkscreen and via containers are copied so per-instance
+        edits do not leak between components.
+        """
+        clone = copy.copy(self)
+        clone.pads = dict(self.pads)
+        clone.silk = list(self.silk)
+        clone.vias = list(self.vias)
+        return clone
+
+    def get_pad_copper_layers(self, number) -> tuple[str, ...]:
+        """Copper layers of a pad as declared in the KiCad footprint."""
+        for pad in self.footprint.pads:
+            if pad.number != number:
+                continue
+            layers = [layer for layer in pad.layers or () if layer.endswith(".Cu")]
+            if "*.Cu" in layers or "F&B.Cu" in layers:
+                return ("*.Cu",)
+            return tuple(layers)
+        return super().get_pad_copper_layers(number)
+
+    def get_courtyard_bbox(self) -> BoundingBox:
+        """Bounding box of the footprint's courtyard, falling back to its pads."""
+        xs: list[float] = []
+        ys: list[float] = []
+        for item in FootprintBuilder(self.footprint).iter_graphics():
+            if not (item.layer or "").endswith(".CrtYd"):
+                continue
+            points = [
+                point
+                for attribute in ("start", "end", "mid")
+                if isinstance(point := getattr(item, attribute, None), Point)
+            ]
+            points.extend(getattr(item, "points", None) or ())
+            center = getattr(item, "center", None)
+            if isinstance(center, Point) and isinstance(item.end, Point):
+                radius = math.hypot(item.end.x - center.x, item.end.y - center.y)
+                xs.extend((center.x - radius, center.x + radius))
+                ys.extend((center.y - radius, center.y + radius))
+            xs.extend(point.x for point in points)
+            ys.extend(point.y for point in points)
+        if not xs:
+            return self.get_bbox()
+        return BoundingBox(min(xs), min(ys), max(xs), max(ys))
+
+
+# Parsed footprints keyed by (library, name, path) and holding the file's
+# modification time, so an edited .kicad_mod is parsed again.
+_TEMPLATES: dict[tuple[str, str, str], tuple[int, KicadFootprint]] = {}
+_TEMPLATES_LOCK = threading.Lock()
+
+
+def clear_footprint_cache() -> None:
+    """Drop every parsed footprint template held by this process."""
+    with _TEMPLATES_LOCK:
+        _TEMPLATES.clear()
+
+
+def _serialize_footprint(footprint: KicadFootprint) -> bytes:
+    document = {
+        "sexp": footprint.sexp,
+        "model": footprint.footprint.model_dump(mode="json"),
+    }
+    return zlib.compress(json.dumps(document, separators=(",", ":")).encode())
+
+
+def _deserialize_footprint(
+    library: str, footprint_name: str, payload: Optional[bytes]
+) -> Optional[KicadFootprint]:
+    if payload is None:
+        return None
+    try:
+        document = json.loads(zlib.decompress(payload))
+        return KicadFootprint(
+            library,
+            footprint_name,
+            document["sexp"],
+            model=Footprint.model_validate(document["model"]),
+        )
+    except (zlib.error, ValueError, KeyError, TypeError):
+        # Unreadable rows are re-parsed and overwritten.
+        return None
+
+
+class _TemplateSource(NamedTuple):
+    """A footprint file that was read but found in neither cache."""
+
+    library: str
+    footprint_name: str
+    path: pathlib.Path
+    stat: os.stat_result
+    text: str
+    digest: str
+
+
+def _remember_template(
+    library: str,
+    footprint_name: str,
+    path: pathlib.Path,
+    mtime_ns: int,
+    template: KicadFootprint,
+) -> KicadFootprint:
+    with _TEMPLATES_LOCK:
+        _TEMPLATES[(library, footprint_name, str(path))] = (mtime_ns, template)
+    return template
+
+
+def _find_template(
+    library: str,
+    footprint_name: str,
+    path: pathlib.Path,
+    cache: Optional[FootprintCache] = None,
+) -> Union[KicadFootprint, _TemplateSource]:
+    """Return a cached template, or the file contents that still need parsing."""
+    stat = path.stat()
+    with _TEMPLATES_LOCK:
+        cached = _TEMPLATES.get((library, footprint_name, str(path)))
+    if cached is not None and cached[0] == stat.st_mtime_ns:
+        return cached[1]
+
+    if cache is not None:
+        template = _deserialize_footprint(
+            library,
+            footprint_name,
+            cache.get(path, stat.st_size, stat.st_mtime_ns),
+        )
+        if template is not None:
+            return _remember_template(
+                library, footprint_name, path, stat.st_mtime_ns, template
+            )
+    data = path.read_bytes()
+    source = _TemplateSource(
+        library,
+        footprint_name,
+        path,
+        stat,
+        data.decode("utf-8"),
+        hashlib.sha256(data).hexdigest(),
+    )
+    if cache is not None:
+        template = _deserialize_footprint(
+            library, footprint_name, cache.get_by_digest(source.digest)
+        )
+        if template is not None:
+            return _store_template(source, template, cache)
+    return source
+
+
+def _parse_footprint(library: str, footprint_name: str, text: str) -> KicadFootprint:
+    return KicadFootprint(library, footprint_name, text)
+
+
+def _store_template(
+    source: _TemplateSource,
+    template: KicadFootprint,
+    cache: Optional[FootprintCache] = None,
+) -> KicadFootprint:
+    if cache is not None:
+        cache.put(
+            source.path,
+            source.stat.st_size,
+            source.stat.st_mtime_ns,
+            source.digest,
+            _serialize_footprint(template),
+        )
+    return _remember_template(
+        source.library,
+        source.footprint_name,
+        source.path,
+        source.stat.st_mtime_ns,
+        template,
+    )
+
+
+def _load_template(
+    library: str,
+    footprint_name: str,
+    path: pathlib.Path,
+    cache: Optional[FootprintCache] = None,
+) -> KicadFootprint:
+    found = _find_template(library, footprint_name, path, cache)
+    if isinstance(found, KicadFootprint):
+        return found
+    template = _parse_footprint(found.library, found.footprint_name, found.text)
+    return _store_template(found, template, cache)
+
 
 class KicadImporter:
     def __init__(
         self,
         additional_lib_paths: Optional[List[Union[str, pathlib.Path]]] = None,
+        cache_path: Optional[Union[str, pathlib.Path]] = None,
     ):
         """
         :param additional_lib_paths: Extra directories that contain ``*.pretty``
             footprint libraries (same layout as KiCad's ``footprints/`` root).
             These are searched before the default KiCad install path.
+        :param cache_path: SQLite file holding parsed footprints between runs.
+            Defaults to the project's ``.earthground`` directory when present,
+            otherwise the user cache directory.
         """
         if additional_lib_paths is not None and not isinstance(
             additional_lib_paths, list
@@ -115,6 +338,7 @@ class KicadImporter:
         self.lib_paths = list(
             resolve_footprint_roots(additional_lib_paths or [], initialize=False)
         )
+        self.cache = open_cache(cache_path or default_cache_path())
 
     def get_footprint_path(self, library: str, footprint_name: str) -> pathlib.Path:
         try:
@@ -144,6 +368,67 @@ class KicadImporter:
             library = library.library
         if footprint_name is None:
             raise TypeError("footprint_name is required when library is a string")
-        with open(self.get_footprint_path(library, footprint_name), "r") as file:
-            sexp = file.read()
-            return KicadFootprint(library, footprint_name, sexp)
+        path = self.get_footprint_path(library, footprint_name)
+        return _load_template(library, footprint_name, path, self.cache).copy()
+
+    def import_many(
+        self,
+        refs: Iterable[Union[KicadFootprintRef, tuple[str, str]]],
+        *,
+        max_workers: Optional[int] = None,
+        processes: bool = False,
+    ) -> dict[Hashable, KicadFootprint]:
+        """
+        Import several footprints at once, keyed by the refs passed in.
+
+        Paths are resolved from one listing per library directory. Files are
+        read and looked up in the footprint caches on a thread pool. Footprints
+        that still need parsing are parsed on the same pool, or on worker
+        processes when ``processes`` is set, since parsing holds the GIL.
+        Because every template lands in the process cache, this also works as a
+        prefetch before building a design that imports footprints one by one.
+        """
+        names: dict[Hashable, tuple[str, str]] = {}
+        for ref in refs:
+            if isinstance(ref, KicadFootprintRef):
+                names[ref] = (ref.library, ref.footprint_name)
+            else:
+                library, footprint_name = ref
+                names[ref] = (library, footprint_name)
+        try:
+            paths = find_footprint_paths(self.lib_paths, names.values())
+        except KicadCatalogError as exc:
+            raise FileNotFoundError(str(exc)) from exc
+
+        with ThreadPoolExecutor(max_workers) as threads:
+            found = dict(
+                zip(
+                    paths,
+                    threads.map(
+                        lambda item: _find_template(*item[0], item[1], self.cache),
+                        paths.items(),
+                    ),
+                )
+            )
+            pending = [
+                source
+                for source in found.values()
+                if isinstance(source, _TemplateSource)
+            ]
+            if pending:
+                arguments = zip(
+                    *(
+                        (source.library, source.footprint_name, source.text)
+                        for source in pending
+                    )
+                )
+                if processes:
+                    with ProcessPoolExecutor(max_workers) as workers:
+                        parsed = list(workers.map(_parse_footprint, *arguments))
+                else:
+                    parsed = list(threads.map(_parse_footprint, *arguments))
+                for source, template in zip(pending, parsed):
+                    found[(source.library, source.footprint_name)] = _store_template(
+                        source, template, self.cache
+                    )
+        return {ref: found[name].copy() for ref, name in names.items()}
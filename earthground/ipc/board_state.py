@@ -0,0 +1,84 @@
+"""Digest-keyed board state for detecting KiCad edits item by item."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+# Board state sections holding copper items, keyed by KiCad item id.
+COPPER_SECTIONS = ("tracks", "vias", "zones")
+
+
+@dataclass(frozen=True)
+class ItemState:
+    """A board item's change digest and its converted earthground value."""
+
+    digest: Hashable
+    value: Any
+
+
+@dataclass(frozen=True)
+class BoardState:
+    """Per-item digests of the open board.
+
+    Footprints are keyed by refdes and hold footprint positions; tracks, vias
+    and zones are keyed by KiCad item id and hold layout objects. Comparing
+    digests finds changed items without converting or serialising the
+    unchanged ones.
+    """
+
+    footprints: dict[str, ItemState]
+    tracks: dict[str, ItemState]
+    vias: dict[str, ItemState]
+    zones: dict[str, ItemState]
+
+    @property
+    def positions(self) -> dict[str, Any]:
+        return {refdes: state.value for refdes, state in self.footprints.items()}
+
+    def changes(self, previous: BoardState) -> dict[str, set[str]]:
+        """Keys added, removed or changed since ``previous``, by section."""
+        result = {}
+        for section in ("footprints", *COPPER_SECTIONS):
+            old, new = getattr(previous, section), getattr(self, section)
+            keys = old.keys() ^ new.keys()
+            keys.update(
+                key
+                for key, state in new.items()
+                if key in old and old[key].digest != state.digest
+            )
+            if keys:
+                result[section] = keys
+        return result
+
+
+@dataclass(frozen=True)
+class BoardChange:
+    """A board read that differs from the one before it.
+
+    ``previous`` is None for the first read, whose ``changes`` list every key.
+    """
+
+    state: BoardState
+    previous: Optional[BoardState]
+    changes: dict[str, set[str]]
+
+
+def next_poll_delay(delay: float, interval: float, max_interval: float) -> float:
+    """Wait before the next poll after an idle one: double, up to the cap."""
+    return min(max(delay * 2, interval), max(max_interval, interval))
+
+
+def item_states(
+    items: Iterable[tuple[str, Hashable, Any]],
+    previous: dict[str, ItemState],
+    convert: Callable[[Any], Any],
+) -> dict[str, ItemState]:
+    """States of ``(key, digest, item)``, converting only changed items."""
+    states = {}
+    for key, digest, item in items:
+        state = previous.get(key)
+        if state is None or state.digest != digest:
+            state = ItemState(digest, convert(item))
+        states[key] = state
+    return states
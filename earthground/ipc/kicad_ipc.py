@@ -10,8 +10,10 @@ Requirements:
     - pip install kicad-python
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import contextlib
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Union
 
 from kipy import KiCad
 from kipy.board import Board
@@ -24,6 +26,7 @@ from kipy.util.units import to_mm
 import earthground.components as cmp
 import earthground.layout as layout_lib
 import earthground.schematic as sch_lib
+from earthground.ipc.board_state import BoardState, ItemState, item_states
 
 
 @dataclass
@@ -48,6 +51,22 @@ class PositionUpdate:
     new: FootprintPosition
 
 
+@dataclass
+class BatchUpdate:
+    """Position changes pushed to KiCad together as one undo step."""
+
+    message: str
+    updates: List[PositionUpdate]
+
+
+@dataclass
+class _PendingBatch:
+    message: str
+    footprints: Dict[str, FootprintInstance] = field(default_factory=dict)
+    positions: Dict[str, FootprintPosition] = field(default_factory=dict)
+    updates: List[PositionUpdate] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class BoardSnapshot:
     positions: Dict[str, FootprintPosition]
@@ -56,6 +75,13 @@ class BoardSnapshot:
     zones: tuple[layout_lib.Zone, ...]
 
 
+def _copper_digest(item) -> bytes:
+    """Digest of a KiCad board item's serialized message."""
+    return hashlib.blake2b(
+        item.proto.SerializeToString(deterministic=True), digest_size=16
+    ).digest()
+
+
 class KicadIpc:
     """Interface between an earthground Design and a live KiCad PCB editor.
 
@@ -63,6 +89,10 @@ class KicadIpc:
     read and write footprint positions, keeping the earthground source
     Design in sync with the board layout.
 
+    Every position read or move fetches the board's footprints once and looks
+    parts up by refdes, so edits made in KiCad are always seen. Inside
+    :meth:`batch` one fetch serves the whole block.
+
     :param design: The earthground Design that corresponds to the open board.
     :param socket_path: Optional KiCad API socket path. If None, uses the
         default (``ipc:///tmp/kicad/api.sock`` on Unix, or the
@@ -75,6 +105,10 @@ class KicadIpc:
         ipc = KicadIpc(my_design)
         ipc.pull_positions()       # read positions from KiCad into design
         ipc.move("U1", 50.0, 25.0) # move U1 and push to KiCad
+
+        with ipc.batch():          # one KiCad commit for many moves
+            for refdes, (x, y) in placements.items():
+                ipc.move(refdes, x, y)
     """
 
     def __init__(self, design: sch_lib.Design, socket_path: Optional[str] = None):
@@ -85,7 +119,10 @@ class KicadIpc:
         self._kicad = KiCad(**kwargs)
         self._board: Board = self._kicad.get_board()
         self._refdes_to_component: Dict[str, cmp.Component] = {}
-        self._history: List[PositionUpdate] = []
+        self._history: List[Union[PositionUpdate, BatchUpdate]] = []
+        self._batch: Optional[_PendingBatch] = None
+        # Board footprints by refdes, fetched once per call or open batch.
+        self._footprints: Optional[Dict[str, FootprintInstance]] = None
         self._build_refdes_map()
 
     def _build_refdes_map(self):
@@ -97,14 +134,30 @@ class KicadIpc:
 
     def _get_kicad_footprints(self) -> List[FootprintInstance]:
         """Fetch all footprints from the KiCad board."""
-        return self._board.get_footprints()
+        return list(self._board.get_footprints())
+
+    def _footprint_index(self) -> Dict[str, FootprintInstance]:
+        """Board footprints by reference designator.
+
+        Outside :meth:`batch` every call fetches the board, so a footprint
+        edited in KiCad since the last call is never pushed back stale. Inside
+        a batch the index is fetched once and kept until the batch closes.
+        """
+        if self._batch is None or self._footprints is None:
+            footprints = self._get_kicad_footprints()
+            # Reversed so the first footprint with a duplicated refdes wins.
+            self._footprints = {
+                fp.reference_field.text.value: fp for fp in reversed(footprints)
+            }
+        return self._footprints
 
     def _find_kicad_footprint(self, refdes: str) -> Optional[FootprintInstance]:
         """Find a KiCad footprint by its reference designator."""
-        for fp in self._get_kicad_footprints():
-            if fp.reference_field.text.value == refdes:
-                return fp
-        return None
+        return self._footprint_index().get(refdes)
+
+    def _update_footprints(self, footprints: List[FootprintInstance]):
+        """Send ``footprints`` to KiCad."""
+        self._board.update_items(footprints)
 
     def _fp_position(self, fp: FootprintInstance) -> FootprintPosition:
         """Extract a FootprintPosition from a KiCad FootprintInstance."""
@@ -215,6 +268,9 @@ class KicadIpc:
     def get_position(self, refdes: str) -> FootprintPosition:
         """Read the current position of a footprint from KiCad.
 
+        The board is fetched for each call; inside :meth:`batch` the read is
+        served from the batch's footprints, including its pending moves.
+
         :param refdes: Reference designator (e.g. "U1", "R3").
         :raises KeyError: If the refdes is not found on the board.
         :return: The footprint's current position.
@@ -244,12 +300,55 @@ class KicadIpc:
             zones=tuple(self._zone(item) for item in self._board.get_zones()),
         )
 
+    def get_board_state(self, previous: Optional[BoardState] = None) -> BoardState:
+        """Read the board as per-item digests, reusing ``previous`` conversions.
+
+        Footprints are digested from their position, orientation and layer,
+        and copper items from their serialized KiCad message. Only items
+        whose digest differs from ``previous`` are converted.
+        """
+        empty: Dict[str, ItemState] = {}
+        footprints = self._get_kicad_footprints()
+        copper = {
+            "tracks": (self._board.get_tracks(), self._track),
+            "vias": (self._board.get_vias(), self._via),
+            "zones": (self._board.get_zones(), self._zone),
+        }
+        return BoardState(
+            footprints=item_states(
+                (
+                    (
+                        fp.reference_field.text.value,
+                        (
+                            fp.proto.position.x_nm,
+                            fp.proto.position.y_nm,
+                            fp.proto.orientation.value_degrees,
+                            fp.proto.layer,
+                        ),
+                        fp,
+                    )
+                    for fp in footprints
+                ),
+                previous.footprints if previous else empty,
+                self._fp_position,
+            ),
+            **{
+                section: item_states(
+                    ((item.id.value, _copper_digest(item), item) for item in items),
+                    getattr(previous, section) if previous else empty,
+                    convert,
+                )
+                for section, (items, convert) in copper.items()
+            },
+        )
+
     def move(
         self, refdes: str, x_mm: float, y_mm: float, angle_deg: Optional[float] = None
     ) -> PositionUpdate:
         """Move a footprint to an absolute position and push to KiCad.
 
-        Also stores the position on the earthground Component so the source
+        The footprint is read from the board first, so edits made in KiCad
+        are kept. Also stores the position on the earthground Component so the source
         design stays in sync.
 
         :param refdes: Reference designator of the footprint to move.
@@ -268,19 +367,13 @@ class KicadIpc:
         if angle_deg is not None:
             fp.orientation = Angle.from_degrees(angle_deg)
 
-        self._board.update_items([fp])
-
         new = FootprintPosition(
             x_mm=x_mm,
             y_mm=y_mm,
             angle_deg=angle_deg if angle_deg is not None else old.angle_deg,
             layer=old.layer,
         )
-        self._store_position(refdes, new)
-
-        update = PositionUpdate(refdes=refdes, old=old, new=new)
-        self._history.append(update)
-        return update
+        return self._apply(fp, PositionUpdate(refdes=refdes, old=old, new=new))
 
     def move_delta(
         self, refdes: str, dx_mm: float, dy_mm: float, dangle_deg: float = 0.0
@@ -303,20 +396,64 @@ class KicadIpc:
         if dangle_deg:
             fp.orientation += Angle.from_degrees(dangle_deg)
 
-        self._board.update_items([fp])
-
         new = FootprintPosition(
             x_mm=old.x_mm + dx_mm,
             y_mm=old.y_mm + dy_mm,
             angle_deg=old.angle_deg + dangle_deg,
             layer=old.layer,
         )
-        self._store_position(refdes, new)
-
-        update = PositionUpdate(refdes=refdes, old=old, new=new)
+        return self._apply(fp, PositionUpdate(refdes=refdes, old=old, new=new))
+
+    def _apply(self, fp: FootprintInstance, update: PositionUpdate) -> PositionUpdate:
+        """Push a moved footprint now, or queue it when a batch is open."""
+        if self._batch is not None:
+            self._batch.footprints[update.refdes] = fp
+            self._batch.positions[update.refdes] = update.new
+            self._batch.updates.append(update)
+            return update
+        self._update_footprints([fp])
+        self._store_position(update.refdes, update.new)
         self._history.append(update)
         return update
 
+    @contextlib.contextmanager
+    def batch(self, message: str = "Move footprints") -> Iterator[None]:
+        """Group moves into one KiCad commit and one history entry.
+
+        ``move``, ``move_delta`` and ``push_positions`` calls inside the block
+        only change the local footprints. On exit, every moved footprint is
+        sent in a single ``update_items`` call inside a KiCad commit, so the
+        arrangement is one undo step, and the moves are recorded as one
+        :class:`BatchUpdate`. The board's footprints are read once, at the
+        first lookup in the block, so KiCad edits to them made while the block
+        is open are overwritten. If the block raises, nothing is sent and
+        component positions are left untouched. Nested batches join the
+        outermost one.
+        """
+        if self._batch is not None:
+            yield
+            return
+        pending = self._batch = _PendingBatch(message)
+        self._footprints = None
+        try:
+            yield
+        finally:
+            self._batch = None
+            self._footprints = None
+        if not pending.footprints:
+            return
+        commit = self._board.begin_commit()
+        try:
+            self._update_footprints(list(pending.footprints.values()))
+        except BaseException:
+            self._board.drop_commit(commit)
+            raise
+        self._board.push_commit(commit, message)
+        for refdes, pos in pending.positions.items():
+            self._store_position(refdes, pos)
+        if pending.updates:
+            self._history.append(BatchUpdate(message, pending.updates))
+
     def pull_positions(self) -> Dict[str, FootprintPosition]:
         """Read all footprint positions from KiCad and store them on the
         corresponding earthground Components.
@@ -334,19 +471,30 @@ class KicadIpc:
     def push_positions(self, positions: Dict[str, FootprintPosition]):
         """Push a set of positions to KiCad, updating the board.
 
+        Inside :meth:`batch`, the positions join the batch's commit and its
+        history entry, as moves do.
+
         :param positions: Mapping of refdes to desired FootprintPosition.
         :raises KeyError: If any refdes is not found on the board.
         """
+        index = self._footprint_index()
         footprints_to_update = []
+        updates = []
         for refdes, pos in positions.items():
-            fp = self._find_kicad_footprint(refdes)
+            fp = index.get(refdes)
             if fp is None:
                 raise KeyError(f"Footprint '{refdes}' not found on the board")
+            updates.append(PositionUpdate(refdes, self._fp_position(fp), pos))
             fp.position = pos.to_vector2()
             fp.orientation = Angle.from_degrees(pos.angle_deg)
             footprints_to_update.append(fp)
+        if self._batch is not None:
+            for fp, update in zip(footprints_to_update, updates):
+                self._apply(fp, update)
+            return
+        self._update_footprints(footprints_to_update)
+        for refdes, pos in positions.items():
             self._store_position(refdes, pos)
-        self._board.update_items(footprints_to_update)
 
     def _store_position(self, refdes: str, pos: FootprintPosition):
         """Store a position on the earthground Component via its parameters dict."""
@@ -360,13 +508,18 @@ class KicadIpc:
             }
 
     @property
-    def history(self) -> List[PositionUpdate]:
-        """List of all position updates made through this interface."""
+    def history(self) -> List[Union[PositionUpdate, BatchUpdate]]:
+        """List of all position updates made through this interface.
+
+        Moves made inside :meth:`batch` appear as one :class:`BatchUpdate`.
+        """
         return list(self._history)
 
     def refresh_board(self):
         """Re-fetch the board from KiCad.
 
-        Call this if the board has been reloaded or changed externally.
+        Call this if the board has been closed and reopened in KiCad, so that
+        later calls address the open document.
         """
         self._board = self._kicad.get_board()
+        self._footprints = None
@@ -0,0 +1,181 @@
+"""
+asyncio interface to a running KiCad PCB editor.
+
+:class:`AsyncKicadIpc` exposes :class:`~earthground.ipc.kicad_ipc.KicadIpc`
+to coroutines. kipy's client blocks on its socket, so every call runs on one
+worker thread owned by the client: the event loop never waits on KiCad, and
+requests reach KiCad one at a time in the order they were awaited.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Optional, TypeVar
+
+import earthground.schematic as sch_lib
+from earthground.ipc.board_state import BoardChange, BoardState, next_poll_delay
+from earthground.ipc.kicad_ipc import (
+    BoardSnapshot,
+    FootprintPosition,
+    KicadIpc,
+    PositionUpdate,
+)
+
+T = TypeVar("T")
+
+_EMPTY_STATE = BoardState(footprints={}, tracks={}, vias={}, zones={})
+
+
+def _worker() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="kicad-ipc")
+
+
+class AsyncKicadIpc:
+    """Non-blocking access to a :class:`KicadIpc` from asyncio code.
+
+    Cancelling a coroutine that is waiting for its turn on the worker
+    withdraws the request; once a request has been sent, KiCad still applies
+    it, and cancellation only stops the caller from waiting for the reply.
+
+    :param ipc: The connected synchronous interface to drive.
+    :param executor: Single-thread executor to run calls on; defaults to a
+        new one. :meth:`connect` passes the worker that created ``ipc``.
+
+    Example::
+
+        from earthground.ipc.kicad_ipc_async import AsyncKicadIpc
+
+        async with await AsyncKicadIpc.connect(my_design) as ipc:
+            await ipc.move("U1", 50.0, 25.0)
+            async for change in ipc.changes(interval=1.0):
+                print(change.changes.get("footprints"))
+    """
+
+    def __init__(self, ipc: KicadIpc, executor: Optional[ThreadPoolExecutor] = None):
+        self.ipc = ipc
+        self._executor = executor or _worker()
+
+    @classmethod
+    async def connect(
+        cls,
+        design: sch_lib.Design,
+        socket_path: Optional[str] = None,
+        retries: int = 30,
+        delay: float = 2.0,
+    ) -> AsyncKicadIpc:
+        """Connect to KiCad, waiting ``delay`` seconds between ``retries``.
+
+        :raises kipy.errors.ConnectionError: If KiCad does not answer on the
+            last attempt.
+        """
+        executor = _worker()
+        loop = asyncio.get_running_loop()
+        try:
+            for attempt in range(1, retries + 1):
+                try:
+                    ipc = await loop.run_in_executor(
+                        executor, KicadIpc, design, socket_path
+                    )
+                    break
+                except Exception:
+                    if attempt == retries:
+                        raise
+                await asyncio.sleep(delay)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        return cls(ipc, executor)
+
+    async def _call(self, function: Callable[..., T], *args, **kwargs) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def get_position(self, refdes: str) -> FootprintPosition:
+        return await self._call(self.ipc.get_position, refdes)
+
+    async def get_all_positions(self) -> Dict[str, FootprintPosition]:
+        return await self._call(self.ipc.get_all_positions)
+
+    async def get_board_snapshot(self) -> BoardSnapshot:
+        return await self._call(self.ipc.get_board_snapshot)
+
+    async def get_board_state(
+        self, previous: Optional[BoardState] = None
+    ) -> BoardState:
+        return await self._call(self.ipc.get_board_state, previous)
+
+    async def move(
+        self, refdes: str, x_mm: float, y_mm: float, angle_deg: Optional[float] = None
+    ) -> PositionUpdate:
+        return await self._call(self.ipc.move, refdes, x_mm, y_mm, angle_deg)
+
+    async def move_delta(
+        self, refdes: str, dx_mm: float, dy_mm: float, dangle_deg: float = 0.0
+    ) -> PositionUpdate:
+        return await self._call(self.ipc.move_delta, refdes, dx_mm, dy_mm, dangle_deg)
+
+    async def push_positions(self, positions: Dict[str, FootprintPosition]):
+        await self._call(self.ipc.push_positions, dict(positions))
+
+    async def pull_positions(self) -> Dict[str, FootprintPosition]:
+        return await self._call(self.ipc.pull_positions)
+
+    async def refresh_board(self):
+        await self._call(self.ipc.refresh_board)
+
+    @contextlib.asynccontextmanager
+    async def batch(self, message: str = "Move footprints") -> AsyncIterator[None]:
+        """Group awaited moves into one KiCad commit, as :meth:`KicadIpc.batch`.
+
+        Moves awaited by other tasks while the block is open join the batch.
+        Leaving the block always closes the batch, even when the task is
+        cancelled: the commit is sent on success and dropped otherwise.
+        """
+        manager = self.ipc.batch(message)
+        await self._call(manager.__enter__)
+        try:
+            yield
+        except BaseException as exc:
+            await asyncio.shield(
+                self._call(manager.__exit__, type(exc), exc, exc.__traceback__)
+            )
+            raise
+        await asyncio.shield(self._call(manager.__exit__, None, None, None))
+
+    async def changes(
+        self, interval: float = 1.0, max_interval: float = 8.0
+    ) -> AsyncIterator[BoardChange]:
+        """Yield a :class:`BoardChange` for the board and for each edit to it.
+
+        The first event carries every item. The board is then read every
+        ``interval`` seconds; while nothing changes, the wait doubles up to
+        ``max_interval`` and drops back after the next change. IPC errors end
+        the stream. Cancelling the consuming task, or closing the generator,
+        stops polling at once.
+        """
+        previous = None
+        delay = interval
+        while True:
+            state = await self.get_board_state(previous)
+            changes = state.changes(previous or _EMPTY_STATE)
+            if previous is None or changes:
+                yield BoardChange(state, previous, changes)
+                delay = interval
+            else:
+                delay = next_poll_delay(delay, interval, max_interval)
+            previous = state
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Withdraw queued requests and release the worker thread."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncKicadIpc:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
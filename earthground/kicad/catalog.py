@@ -12,6 +12,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Iterable, Optional, Sequence, Union
 
@@ -22,7 +24,14 @@ CATALOG_SCHEMA = 1
 CONFIG_DIRECTORY = ".earthground"
 CONFIG_FILENAME = "config.yaml"
 METADATA_FILENAME = "kicad-catalog.json"
+INSTALLATIONS_FILENAME = "kicad-installations.json"
+# User cache subdirectory holding catalogs shared between projects.
+SHARED_CATALOG_DIRECTORY = "catalogs"
 ENVIRONMENT_OUTPUT = "environment"
+# Package beside the environment catalog index holding one module per library.
+LIBRARY_PACKAGE = "_libraries"
+# Threads listing library directories; the scan waits on the file system.
+SCAN_WORKERS = 8
 
 
 class KicadCatalogError(RuntimeError):
@@ -72,6 +81,20 @@ class CatalogContext:
     environment_output: bool
     entries: tuple[FootprintEntry, ...]
     fingerprint: str
+    # Modification times of the roots and their libraries, taken before the scan.
+    directory_mtimes: tuple[tuple[str, int], ...] = field(default=(), compare=False)
+    scan_seconds: float = field(default=0.0, compare=False)
+    # Whether the entries came from the user-level shared catalog cache.
+    shared_scan: bool = field(default=False, compare=False)
+
+
+def user_cache_directory() -> pathlib.Path:
+    """``EARTHGROUND_CACHE_DIR``, or ``earthground`` in the user cache directory."""
+    override = os.environ.get("EARTHGROUND_CACHE_DIR")
+    if override:
+        return pathlib.Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(base).expanduser() / "earthground"
 
 
 def _ancestors(start: pathlib.Path) -> Iterable[pathlib.Path]:
@@ -304,11 +327,106 @@ def _is_footprint_root(path: pathlib.Path) -> bool:
     return path.is_dir() and any(path.glob("*.pretty"))
 
 
+def _stat_signature(path: Optional[pathlib.Path]) -> Optional[list[int]]:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+# Detections for an explicit executable, keyed by _installation_key().
+_INSTALLATIONS: dict[str, KicadInstallation] = {}
+
+
+def _installation_key(
+    executable: pathlib.Path,
+    footprint_root: Optional[pathlib.Path],
+    platform_name: str,
+) -> Optional[str]:
+    signature = _stat_signature(executable)
+    if signature is None:
+        return None
+    root = str(footprint_root) if footprint_root else None
+    return json.dumps([str(executable), signature, root, platform_name])
+
+
+def _installations_path(project: ProjectPaths) -> pathlib.Path:
+    return project.config.parent / INSTALLATIONS_FILENAME
+
+
+def _load_installations(project: ProjectPaths) -> dict[str, dict]:
+    try:
+        document = json.loads(_installations_path(project).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(document, dict) or document.get("schema") != CATALOG_SCHEMA:
+        return {}
+    installations = document.get("installations")
+    return installations if isinstance(installations, dict) else {}
+
+
+def _stored_installation(
+    project: ProjectPaths, key: str
+) -> Optional[KicadInstallation]:
+    stored = _load_installations(project).get(key)
+    if not isinstance(stored, dict):
+        return None
+    try:
+        executable = pathlib.Path(stored["executable"])
+        footprint_root = pathlib.Path(stored["footprint_root"])
+        version = str(stored["version"])
+    except (KeyError, TypeError):
+        return None
+    if not footprint_root.is_dir():
+        return None
+    return KicadInstallation(executable, footprint_root, version)
+
+
+def _store_installation(
+    project: ProjectPaths, key: str, installation: KicadInstallation
+) -> None:
+    # Only projects that already have an Earthground directory get the file.
+    if not project.config.parent.is_dir():
+        return
+    executable = json.loads(key)[0]
+    installations = {
+        stored_key: value
+        for stored_key, value in _load_installations(project).items()
+        if json.loads(stored_key)[0] != executable
+    }
+    installations[key] = {
+        "executable": str(installation.executable),
+        "footprint_root": str(installation.footprint_root),
+        "version": installation.version,
+    }
+    document = {"schema": CATALOG_SCHEMA, "installations": installations}
+    try:
+        _atomic_write(
+            _installations_path(project),
+            json.dumps(document, indent=2, sort_keys=True) + "\n",
+        )
+    except KicadCatalogError:
+        # The record only saves a later kicad-cli call; detection still holds.
+        pass
+
+
 def detect_kicad_installation(
     executable: Optional[Union[str, pathlib.Path]] = None,
     footprint_root: Optional[Union[str, pathlib.Path]] = None,
     platform_name: Optional[str] = None,
+    project: Optional[ProjectPaths] = None,
 ) -> Optional[KicadInstallation]:
+    """
+    Find the KiCad installation to catalog, preferring the newest version.
+
+    Results for an explicit ``executable`` are memoized per process and, when
+    ``project`` is given, in its ``kicad-installations.json``, keyed by the
+    executable's inode, size and mtime, so ``kicad-cli`` is only run again
+    after the executable changes.
+    """
     platform_name = platform_name or sys.platform
     explicit_executable = (
         pathlib.Path(executable).expanduser().resolve() if executable else None
@@ -316,7 +434,35 @@ def detect_kicad_installation(
     explicit_root = (
         pathlib.Path(footprint_root).expanduser().resolve() if footprint_root else None
     )
+    key = (
+        _installation_key(explicit_executable, explicit_root, platform_name)
+        if explicit_executable is not None
+        else None
+    )
+    if key is None:
+        return _detect_kicad_installation(
+            explicit_executable, explicit_root, platform_name
+        )
+
+    installation = _INSTALLATIONS.get(key)
+    if installation is None and project is not None:
+        installation = _stored_installation(project, key)
+    if installation is None:
+        installation = _detect_kicad_installation(
+            explicit_executable, explicit_root, platform_name
+        )
+        if installation is not None and project is not None:
+            _store_installation(project, key, installation)
+    if installation is not None:
+        _INSTALLATIONS[key] = installation
+    return installation
 
+
+def _detect_kicad_installation(
+    explicit_executable: Optional[pathlib.Path],
+    explicit_root: Optional[pathlib.Path],
+    platform_name: str,
+) -> Optional[KicadInstallation]:
     if explicit_root is not None:
         return KicadInstallation(
             executable=explicit_executable,
@@ -442,6 +588,7 @@ def initialize_project(
         executable=executable,
         footprint_root=footprint_root,
         platform_name=platform_name,
+        project=project,
     )
     return write_config(project, installation, existing, platform_name)
 
@@ -457,33 +604,110 @@ def _deduplicate_paths(paths: Iterable[pathlib.Path]) -> tuple[pathlib.Path, ...
     return tuple(result)
 
 
-def scan_footprints(roots: Sequence[pathlib.Path]) -> tuple[FootprintEntry, ...]:
-    entries: dict[str, FootprintEntry] = {}
+def _library_directories(root: pathlib.Path) -> list[pathlib.Path]:
+    with os.scandir(root) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".pretty") and entry.is_dir()
+        ]
+    return [root / name for name in sorted(names)]
+
+
+def _scan_library(library_path: pathlib.Path) -> list[FootprintEntry]:
+    library = library_path.stem
+    try:
+        with os.scandir(library_path) as entries:
+            names = [
+                entry.name for entry in entries if entry.name.endswith(".kicad_mod")
+            ]
+    except OSError:
+        return []
+    result = []
+    for name in sorted(names):
+        footprint_path = library_path / name
+        result.append(FootprintEntry(library, footprint_path.stem, footprint_path))
+    return result
+
+
+def scan_footprints(
+    roots: Sequence[pathlib.Path], workers: int = SCAN_WORKERS
+) -> tuple[FootprintEntry, ...]:
+    """
+    Every footprint under ``roots``, one entry per ``Library:Footprint`` name.
+
+    Library directories are listed on up to ``workers`` threads, which
+    overlaps the round trips of slow or network file systems. Results are
+    merged in root and library order, so an earlier root still wins when two
+    roots provide the same footprint.
+    """
+    libraries: list[pathlib.Path] = []
     for root in roots:
         if not _is_footprint_root(root):
             raise KicadCatalogError(
                 f"KiCad footprint root does not contain *.pretty libraries: {root}"
             )
-        for library_path in sorted(root.glob("*.pretty"), key=lambda path: path.name):
-            library = library_path.stem
-            for footprint_path in sorted(
-                library_path.glob("*.kicad_mod"), key=lambda path: path.name
-            ):
-                entry = FootprintEntry(library, footprint_path.stem, footprint_path)
-                entries.setdefault(entry.canonical_name, entry)
+        libraries.extend(_library_directories(root))
+    if workers > 1 and len(libraries) > 1:
+        with ThreadPoolExecutor(min(workers, len(libraries))) as threads:
+            listings = list(threads.map(_scan_library, libraries))
+    else:
+        listings = [_scan_library(library) for library in libraries]
+    entries: dict[str, FootprintEntry] = {}
+    for listing in listings:
+        for entry in listing:
+            entries.setdefault(entry.canonical_name, entry)
     return tuple(sorted(entries.values(), key=lambda item: item.canonical_name))
 
 
-def find_footprint_path(
-    roots: Sequence[pathlib.Path], library: str, footprint_name: str
-) -> pathlib.Path:
-    """Find one footprint in precedence-ordered KiCad library roots."""
+def _directory_mtimes(roots: Sequence[pathlib.Path]) -> tuple[tuple[str, int], ...]:
+    """
+    Modification times of ``roots`` and their ``*.pretty`` libraries.
+
+    Adding, removing or renaming a library or footprint changes the mtime of
+    the directory holding it, so these few stats stand in for a full scan.
+    """
+    mtimes: list[tuple[str, int]] = []
+    for root in roots:
+        try:
+            mtimes.append((str(root), root.stat().st_mtime_ns))
+            with os.scandir(root) as entries:
+                libraries = [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".pretty") and entry.is_dir()
+                ]
+            mtimes.extend(
+                (entry.path, entry.stat().st_mtime_ns)
+                for entry in sorted(libraries, key=lambda entry: entry.name)
+            )
+        except OSError:
+            continue
+    return tuple(mtimes)
+
+
+def _file_sha256(path: pathlib.Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _footprint_relative_path(library: str, footprint_name: str) -> tuple[str, str]:
     library_path = library if library.endswith(".pretty") else f"{library}.pretty"
     footprint_path = (
         footprint_name
         if footprint_name.endswith(".kicad_mod")
         else f"{footprint_name}.kicad_mod"
     )
+    return library_path, footprint_path
+
+
+def find_footprint_path(
+    roots: Sequence[pathlib.Path], library: str, footprint_name: str
+) -> pathlib.Path:
+    """Find one footprint in precedence-ordered KiCad library roots."""
+    library_path, footprint_path = _footprint_relative_path(library, footprint_name)
     for root in roots:
         candidate = root / library_path / footprint_path
         if candidate.is_file():
@@ -494,20 +718,67 @@ def find_footprint_path(
     )
 
 
-def read_footprint_description(path: pathlib.Path) -> Optional[str]:
-    """Read a KiCad footprint's description without constructing its geometry."""
-    try:
-        with path.open(encoding="utf-8", errors="replace") as footprint:
-            header = footprint.read(65536)
-    except OSError:
-        return None
+def find_footprint_paths(
+    roots: Sequence[pathlib.Path], footprints: Iterable[tuple[str, str]]
+) -> dict[tuple[str, str], pathlib.Path]:
+    """
+    Find many footprints in precedence-ordered KiCad library roots.
+
+    Each library directory that is needed is listed once per root instead of
+    probing every footprint path, and missing footprints are reported together.
+    """
+    listings: dict[pathlib.Path, frozenset[str]] = {}
+    found: dict[tuple[str, str], pathlib.Path] = {}
+    missing = []
+    for library, footprint_name in footprints:
+        if (library, footprint_name) in found:
+            continue
+        library_path, footprint_path = _footprint_relative_path(library, footprint_name)
+        for root in roots:
+            directory = root / library_path
+            if directory not in listings:
+                try:
+                    with os.scandir(directory) as entries:
+                        listings[directory] = frozenset(
+                            entry.name for entry in entries if entry.is_file()
+                        )
+                except OSError:
+                    listings[directory] = frozenset()
+            if footprint_path in listings[directory]:
+                found[(library, footprint_name)] = directory / footprint_path
+                break
+        else:
+            missing.append(f"{library}:{footprint_name}")
+    if missing:
+        searched = ", ".join(str(root) for root in roots)
+        raise KicadCatalogError(
+            f"Footprints {', '.join(repr(name) for name in missing)} were not "
+            f"found in: {searched}"
+        )
+    return found
+
+
+def read_footprint_description(
+    path: pathlib.Path, text: Optional[str] = None
+) -> Optional[str]:
+    """
+    Read a KiCad footprint's description without constructing its geometry.
+
+    ``text`` may supply the file's contents when the caller already read them.
+    """
+    if text is None:
+        try:
+            with path.open(encoding="utf-8", errors="replace") as footprint:
+                text = footprint.read(65536)
+        except OSError:
+            return None
 
     string_value = r'"((?:\\.|[^"\\])*)"'
     for pattern in (
         rf"\(descr\s+{string_value}\s*\)",
         rf'\(property\s+"Description"\s+{string_value}',
     ):
-        match = re.search(pattern, header)
+        match = re.search(pattern, text)
         if match:
             encoded = match.group(1)
             try:
@@ -544,7 +815,7 @@ def resolve_footprint_roots(
     elif initialize:
         config = initialize_project(project, executable=executable)
     else:
-        detected = detect_kicad_installation(executable=executable)
+        detected = detect_kicad_installation(executable=executable, project=project)
         if detected is None:
             config = KicadConfig()
         else:
@@ -562,6 +833,7 @@ def resolve_footprint_roots(
         installation = detect_kicad_installation(
             executable=executable or config.executable,
             footprint_root=config.footprint_root,
+            project=project,
         )
     if installation is not None and _is_footprint_root(installation.footprint_root):
         roots.append(installation.footprint_root)
@@ -597,6 +869,102 @@ def calculate_fingerprint(
     return hashlib.sha256(encoded).hexdigest()
 
 
+def _shared_catalog_path(*parts: str) -> pathlib.Path:
+    return user_cache_directory().joinpath(SHARED_CATALOG_DIRECTORY, *parts)
+
+
+def _shared_scan_key(
+    installation: KicadInstallation,
+    roots: Sequence[pathlib.Path],
+    directory_mtimes: Sequence[tuple[str, int]],
+) -> Optional[str]:
+    """Key of a scan in the shared cache, or ``None`` if it cannot be stamped."""
+    if not directory_mtimes:
+        return None
+    payload = {
+        "schema": CATALOG_SCHEMA,
+        "earthground_version": _earthground_version(),
+        "kicad_version": installation.version,
+        "roots": [str(path) for path in roots],
+        "directory_mtimes": [list(item) for item in directory_mtimes],
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _load_shared_scan(
+    key: Optional[str],
+    installation: KicadInstallation,
+    roots: Sequence[pathlib.Path],
+) -> Optional[tuple[tuple[FootprintEntry, ...], str]]:
+    """
+    Scan results another project stored under the same directory stamps.
+
+    The entries are accepted only if they still hash to the fingerprint they
+    were stored under.
+    """
+    if key is None:
+        return None
+    try:
+        fingerprint = _shared_catalog_path("stamps", key).read_text(encoding="utf-8")
+        document = json.loads(
+            _shared_catalog_path(fingerprint.strip(), "entries.json").read_text(
+                encoding="utf-8"
+            )
+        )
+        entries = tuple(
+            FootprintEntry(library, footprint_name, pathlib.Path(path))
+            for library, footprint_name, path in document["entries"]
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    fingerprint = fingerprint.strip()
+    if calculate_fingerprint(installation, roots, entries) != fingerprint:
+        return None
+    return entries, fingerprint
+
+
+def _store_shared_scan(
+    key: Optional[str], fingerprint: str, entries: Sequence[FootprintEntry]
+) -> None:
+    if key is None:
+        return
+    document = {
+        "entries": [
+            [entry.library, entry.footprint_name, str(entry.path)] for entry in entries
+        ]
+    }
+    try:
+        _atomic_write(
+            _shared_catalog_path(fingerprint, "entries.json"),
+            json.dumps(document, separators=(",", ":")),
+        )
+        _atomic_write(_shared_catalog_path("stamps", key), fingerprint)
+    except KicadCatalogError:
+        # The shared cache only saves a later project a scan.
+        pass
+
+
+def _shared_rendering(context: CatalogContext, name: str, render):
+    """
+    ``render(context)``, reusing the copy stored under the fingerprint.
+
+    Renderings depend only on the entries and fingerprint, so any project
+    with the same fingerprint can reuse them.
+    """
+    path = _shared_catalog_path(context.fingerprint, f"{name}.json")
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    rendered = render(context)
+    try:
+        _atomic_write(path, json.dumps(rendered, separators=(",", ":")))
+    except KicadCatalogError:
+        pass
+    return rendered
+
+
 def environment_catalog_path(package_directory: pathlib.Path) -> pathlib.Path:
     return package_directory / "_generated.py"
 
@@ -615,7 +983,7 @@ def resolve_context(
         if initialize:
             initialize_project(project, executable=executable)
         else:
-            detected = detect_kicad_installation(executable=executable)
+            detected = detect_kicad_installation(executable=executable, project=project)
             config = KicadConfig(
                 executable=detected.executable if detected else None,
                 footprint_root=detected.footprint_root if detected else None,
@@ -631,6 +999,7 @@ def resolve_context(
     installation = detect_kicad_installation(
         executable=selected_executable,
         footprint_root=config.footprint_root,
+        project=project,
     )
     if installation is None or not _is_footprint_root(installation.footprint_root):
         raise KicadCatalogError(
@@ -643,7 +1012,17 @@ def resolve_context(
     roots = _deduplicate_paths(
         [*cli_roots, *config.additional_footprint_roots, installation.footprint_root]
     )
-    entries = scan_footprints(roots)
+    directory_mtimes = _directory_mtimes(roots)
+    scan_key = _shared_scan_key(installation, roots, directory_mtimes)
+    scan_started = time.perf_counter()
+    shared = _load_shared_scan(scan_key, installation, roots)
+    if shared is None:
+        entries = scan_footprints(roots)
+        fingerprint = calculate_fingerprint(installation, roots, entries)
+        _store_shared_scan(scan_key, fingerprint, entries)
+    else:
+        entries, fingerprint = shared
+    scan_seconds = time.perf_counter() - scan_started
 
     selected_output: Union[str, pathlib.Path] = (
         output if output is not None else config.catalog_output
@@ -665,7 +1044,6 @@ def resolve_context(
         if output_path.suffix != ".py":
             raise KicadCatalogError("A standalone catalog output must end in '.py'")
 
-    fingerprint = calculate_fingerprint(installation, roots, entries)
     return CatalogContext(
         project=project,
         config=config,
@@ -675,6 +1053,9 @@ def resolve_context(
         environment_output=environment_output,
         entries=entries,
         fingerprint=fingerprint,
+        directory_mtimes=directory_mtimes,
+        scan_seconds=scan_seconds,
+        shared_scan=shared is not None,
     )
 
 
@@ -704,46 +1085,147 @@ def _unique_identifier(name: str, used: dict[str, str]) -> str:
     return identifier
 
 
-def render_catalog(context: CatalogContext) -> tuple[str, list[str]]:
+def _library_classes(context: CatalogContext) -> list[tuple[str, list[str]]]:
+    """Each library's enum class name and source lines, in library order."""
     by_library: dict[str, list[FootprintEntry]] = {}
     for entry in context.entries:
         by_library.setdefault(entry.library, []).append(entry)
 
-    class_names: list[str] = []
+    classes: list[tuple[str, list[str]]] = []
     used_classes: dict[str, str] = {}
-    lines = [
-        "# Generated by Earthground. Do not edit.",
-        "from earthground.footprint_types import KicadFootprintRef",
-        "",
-        f"__catalog_fingerprint__ = {context.fingerprint!r}",
-        "",
-    ]
     for library, entries in sorted(by_library.items()):
         class_name = _unique_identifier(library, used_classes)
-        class_names.append(class_name)
-        lines.append(f"class {class_name}(KicadFootprintRef):")
+        lines = [f"class {class_name}(KicadFootprintRef):"]
         used_members: dict[str, str] = {}
         for entry in entries:
             member = _unique_identifier(entry.footprint_name, used_members)
             lines.append(
                 f"    {member} = ({entry.library!r}, {entry.footprint_name!r})"
             )
+        classes.append((class_name, lines))
+    return classes
+
+
+def render_catalog(context: CatalogContext) -> tuple[str, list[str]]:
+    """Render a standalone catalog module defining every library class."""
+    classes = _library_classes(context)
+    lines = [
+        "# Generated by Earthground. Do not edit.",
+        "from earthground.footprint_types import KicadFootprintRef",
+        "",
+        f"__catalog_fingerprint__ = {context.fingerprint!r}",
+        "",
+    ]
+    for _, class_lines in classes:
+        lines.extend(class_lines)
         lines.append("")
+    class_names = [class_name for class_name, _ in classes]
     lines.append(f"__all__ = {class_names!r}")
     lines.append("")
     return "\n".join(lines), class_names
 
 
-def render_export_stub(class_names: Sequence[str]) -> str:
+def render_library_catalog(
+    context: CatalogContext,
+) -> tuple[str, dict[str, str], dict[str, str]]:
+    """
+    Render a lazily loaded catalog split into one module per library.
+
+    Returns the index module source, the source of each library module keyed
+    by module name, and the module name of each library class. The index
+    only lists class names; a class's module is imported on first access.
+    """
+    sources: dict[str, str] = {}
+    modules: dict[str, str] = {}
+    for class_name, class_lines in _library_classes(context):
+        module = class_name.lower()
+        if module in sources:
+            digest = hashlib.sha256(class_name.encode()).hexdigest()[:8]
+            module = f"{module}_{digest}"
+        modules[class_name] = module
+        sources[module] = "\n".join(
+            [
+                "# Generated by Earthground. Do not edit.",
+                "from earthground.footprint_types import KicadFootprintRef",
+                "",
+                *class_lines,
+                "",
+            ]
+        )
+    index = "\n".join(
+        [
+            "# Generated by Earthground. Do not edit.",
+            "import importlib",
+            "",
+            f"__catalog_fingerprint__ = {context.fingerprint!r}",
+            "",
+            f"# Library class name -> module in .{LIBRARY_PACKAGE}",
+            "_LIBRARIES = {",
+            *(f"    {name!r}: {module!r}," for name, module in modules.items()),
+            "}",
+            "",
+            "__all__ = list(_LIBRARIES)",
+            "",
+            "",
+            "def __getattr__(name):",
+            "    module = _LIBRARIES.get(name)",
+            "    if module is None:",
+            '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+            "    value = getattr(",
+            f'        importlib.import_module(f"{{__package__}}.{LIBRARY_PACKAGE}.{{module}}"),',
+            "        name,",
+            "    )",
+            "    globals()[name] = value",
+            "    return value",
+            "",
+            "",
+            "def __dir__():",
+            "    return sorted({*globals(), *_LIBRARIES})",
+            "",
+        ]
+    )
+    return index, sources, modules
+
+
+def render_export_stub(modules: dict[str, str]) -> str:
     lines = ["# Generated by Earthground. Do not edit."]
-    for class_name in class_names:
-        lines.append(f"from ._generated import {class_name} as {class_name}")
+    for class_name, module in modules.items():
+        lines.append(
+            f"from .{LIBRARY_PACKAGE}.{module} import {class_name} as {class_name}"
+        )
     lines.append("")
-    lines.append(f"__all__ = {list(class_names)!r}")
+    lines.append(f"__all__ = {list(modules)!r}")
     lines.append("")
     return "\n".join(lines)
 
 
+def _write_library_modules(directory: pathlib.Path, sources: dict[str, str]) -> None:
+    """Write changed library modules and remove those no longer generated."""
+    files = {"__init__.py": "# Generated by Earthground. Do not edit.\n"}
+    files.update({f"{module}.py": source for module, source in sources.items()})
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, source in files.items():
+        path = directory / name
+        try:
+            current = path.read_text(encoding="utf-8")
+        except OSError:
+            current = None
+        if current != source:
+            _atomic_write(path, source)
+    for path in directory.glob("*.py"):
+        if path.name not in files:
+            try:
+                path.unlink()
+            except OSError as exc:
+                raise KicadCatalogError(f"Unable to remove {path}: {exc}") from exc
+
+
+def _environment_files_present(output: pathlib.Path) -> bool:
+    return (output.parent / "_generated_exports.pyi").is_file() and (
+        output.parent / LIBRARY_PACKAGE / "__init__.py"
+    ).is_file()
+
+
 def _atomic_write(path: pathlib.Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary_name: Optional[str] = None
@@ -790,7 +1272,7 @@ def catalog_is_fresh(context: CatalogContext) -> bool:
 
 
 def _metadata(context: CatalogContext) -> dict:
-    return {
+    metadata = {
         "schema": CATALOG_SCHEMA,
         "earthground_version": _earthground_version(),
         "kicad_version": context.installation.version,
@@ -804,21 +1286,83 @@ def _metadata(context: CatalogContext) -> dict:
         "fingerprint": context.fingerprint,
         "footprint_count": len(context.entries),
     }
+    # Installation detection depends on the machine when the config names
+    # neither an executable nor a footprint root, so only pinned setups are
+    # stamped for the stat-only freshness check.
+    pinned = context.config.executable or context.config.footprint_root
+    if context.directory_mtimes and pinned:
+        metadata["stamp"] = {
+            "config_sha256": _file_sha256(context.project.config),
+            "kicad_executable_stat": _stat_signature(context.installation.executable),
+            "directory_mtimes": dict(context.directory_mtimes),
+        }
+    return metadata
+
+
+def stamped_catalog_is_current(project: ProjectPaths, output: pathlib.Path) -> bool:
+    """
+    Whether ``output`` still matches the stamps recorded in the metadata.
+
+    Only the config, the KiCad executable and the footprint directories are
+    stat'ed; nothing is scanned and ``kicad-cli`` is not run. A ``False``
+    result means a full :func:`resolve_context` is needed.
+    """
+    try:
+        metadata = json.loads(project.metadata.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(metadata, dict) or not isinstance(metadata.get("stamp"), dict):
+        return False
+    stamp = metadata["stamp"]
+    if (
+        metadata.get("schema") != CATALOG_SCHEMA
+        or metadata.get("output") != str(output)
+        or metadata.get("earthground_version") != _earthground_version()
+        or stamp.get("config_sha256") != _file_sha256(project.config)
+    ):
+        return False
+    executable = metadata.get("kicad_executable")
+    if stamp.get("kicad_executable_stat") != _stat_signature(
+        pathlib.Path(executable) if executable else None
+    ):
+        return False
+    directories = stamp.get("directory_mtimes")
+    if not isinstance(directories, dict) or not directories:
+        return False
+    for path, mtime in directories.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return read_catalog_fingerprint(output) == metadata.get("fingerprint")
 
 
 def generate_catalog(context: CatalogContext, force: bool = False) -> bool:
     """Generate a catalog and return whether its Python output changed."""
-    export_stub = context.output.parent / "_generated_exports.pyi"
     changed = (
         force
         or not catalog_is_fresh(context)
-        or (context.environment_output and not export_stub.is_file())
+        or (
+            context.environment_output
+            and not _environment_files_present(context.output)
+        )
     )
     if changed:
-        source, class_names = render_catalog(context)
-        _atomic_write(context.output, source)
         if context.environment_output:
-            _atomic_write(export_stub, render_export_stub(class_names))
+            index, sources, modules = _shared_rendering(
+                context, "environment", render_library_catalog
+            )
+            _write_library_modules(context.output.parent / LIBRARY_PACKAGE, sources)
+            _atomic_write(
+                context.output.parent / "_generated_exports.pyi",
+                render_export_stub(modules),
+            )
+            # The index carries the fingerprint, so it is written last.
+            _atomic_write(context.output, index)
+        else:
+            source, _ = _shared_rendering(context, "standalone", render_catalog)
+            _atomic_write(context.output, source)
         importlib.invalidate_caches()
     metadata = json.dumps(_metadata(context), indent=2, sort_keys=True) + "\n"
     try:
@@ -830,7 +1374,23 @@ def generate_catalog(context: CatalogContext, force: bool = False) -> bool:
     return changed
 
 
-def ensure_environment_catalog(package_directory: pathlib.Path) -> CatalogContext:
+def ensure_environment_catalog(
+    package_directory: pathlib.Path,
+) -> Optional[CatalogContext]:
+    """
+    Make sure the environment catalog in ``package_directory`` is current.
+
+    Returns the resolved context after a full check, or ``None`` when the
+    stamps recorded with the last generation show nothing has changed.
+    """
+    project = get_project_paths()
+    output = environment_catalog_path(package_directory)
+    if (
+        project.config.is_file()
+        and _environment_files_present(output)
+        and stamped_catalog_is_current(project, output)
+    ):
+        return None
     context = resolve_context(package_directory=package_directory, initialize=True)
     if not context.environment_output:
         raise KicadCatalogError(
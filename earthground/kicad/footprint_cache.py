@@ -0,0 +1,142 @@
+"""Persistent cache of parsed KiCad footprints shared between runs."""
+
+from __future__ import annotations
+
+import importlib.metadata
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Optional, Union
+
+from earthground.kicad.catalog import (
+    CONFIG_DIRECTORY,
+    find_project_root,
+    user_cache_directory,
+)
+
+log = logging.getLogger(__name__)
+
+FOOTPRINT_CACHE_SCHEMA = 1
+FOOTPRINT_CACHE_FILENAME = "footprint-cache.sqlite3"
+
+
+def default_cache_path(
+    project_root: Optional[Union[str, pathlib.Path]] = None,
+    filename: str = FOOTPRINT_CACHE_FILENAME,
+) -> pathlib.Path:
+    """
+    Return the project's cache file when the project has a ``.earthground``
+    directory, otherwise the per-user cache file.
+
+    ``EARTHGROUND_CACHE_DIR`` overrides both.
+    """
+    if not os.environ.get("EARTHGROUND_CACHE_DIR"):
+        config_directory = find_project_root(explicit=project_root) / CONFIG_DIRECTORY
+        if config_directory.is_dir():
+            return config_directory / filename
+    return user_cache_directory() / filename
+
+
+def _cache_format() -> str:
+    # Serialized models are only valid for the pykicad release that wrote them.
+    try:
+        version = importlib.metadata.version("python-kicad")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"{FOOTPRINT_CACHE_SCHEMA}:{version}"
+
+
+class FootprintCache:
+    """
+    SQLite table of serialized footprints keyed by source path.
+
+    A row is reused directly while the source file's size and modification time
+    match. Otherwise the caller hashes the file and may still reuse a row with
+    the same SHA-256, which covers touched or copied files. Cache failures are
+    logged and treated as misses so a broken cache never blocks an import.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self.path = pathlib.Path(path)
+        self.format = _cache_format()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS footprints ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL, "
+                "format TEXT NOT NULL, payload BLOB NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS footprints_sha256 ON footprints (sha256)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _query(self, sql: str, parameters: tuple) -> Optional[bytes]:
+        with self._lock:
+            try:
+                row = self._connect().execute(sql, parameters).fetchone()
+            except (OSError, sqlite3.Error) as exc:
+                log.warning("Footprint cache %s is unavailable: %s", self.path, exc)
+                return None
+        return None if row is None else row[0]
+
+    def get(self, path: pathlib.Path, size: int, mtime_ns: int) -> Optional[bytes]:
+        return self._query(
+            "SELECT payload FROM footprints "
+            "WHERE path = ? AND size = ? AND mtime_ns = ? AND format = ?",
+            (str(path), size, mtime_ns, self.format),
+        )
+
+    def get_by_digest(self, sha256: str) -> Optional[bytes]:
+        return self._query(
+            "SELECT payload FROM footprints WHERE sha256 = ? AND format = ?",
+            (sha256, self.format),
+        )
+
+    def put(
+        self,
+        path: pathlib.Path,
+        size: int,
+        mtime_ns: int,
+        sha256: str,
+        payload: bytes,
+    ) -> None:
+        with self._lock:
+            try:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO footprints VALUES (?, ?, ?, ?, ?, ?)",
+                    (str(path), size, mtime_ns, sha256, self.format, payload),
+                )
+                connection.commit()
+            except (OSError, sqlite3.Error) as exc:
+                log.warning("Unable to write footprint cache %s: %s", self.path, exc)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_OPEN_CACHES: dict[pathlib.Path, FootprintCache] = {}
+_OPEN_CACHES_LOCK = threading.Lock()
+
+
+def open_cache(path: Union[str, pathlib.Path]) -> FootprintCache:
+    """Return the process-wide cache object for ``path``."""
+    path = pathlib.Path(path)
+    with _OPEN_CACHES_LOCK:
+        if path not in _OPEN_CACHES:
+            _OPEN_CACHES[path] = FootprintCache(path)
+        return _OPEN_CACHES[path]
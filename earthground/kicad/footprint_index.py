@@ -0,0 +1,380 @@
+"""Persistent index of KiCad footprint descriptions, tags and pad counts."""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import re
+import sqlite3
+import threading
+from typing import Iterable, NamedTuple, Optional, Union
+
+from earthground.kicad.catalog import (
+    FootprintEntry,
+    KicadCatalogError,
+    read_footprint_description,
+)
+
+log = logging.getLogger(__name__)
+
+FOOTPRINT_INDEX_SCHEMA = 2
+FOOTPRINT_INDEX_FILENAME = "footprint-index.sqlite3"
+
+_COLUMNS = "path, library, name, description, tags, pad_count, size, mtime_ns"
+_UPSERT = (
+    f"INSERT INTO footprints ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (path) DO UPDATE SET library = excluded.library, "
+    "name = excluded.name, description = excluded.description, "
+    "tags = excluded.tags, pad_count = excluded.pad_count, "
+    "size = excluded.size, mtime_ns = excluded.mtime_ns"
+)
+# Word matches over name, description and tags, and trigram matches over the
+# same columns for partial and misspelt names. Both are external-content
+# tables kept in step with ``footprints`` by triggers.
+_SEARCH_TABLES = {
+    "footprint_words": "unicode61",
+    "footprint_trigrams": "trigram",
+}
+# bm25 weights for the name, description and tags columns.
+_SEARCH_WEIGHTS = "10.0, 1.0, 4.0"
+_SEARCH_CANDIDATES = 500
+_WORD = re.compile(r"[^\W_]+")
+
+_STRING = r'"((?:\\.|[^"\\])*)"'
+_TAGS = re.compile(rf"\(tags\s+{_STRING}\s*\)")
+_TAGS_PROPERTY = re.compile(rf'\(property\s+"ki_keywords"\s+{_STRING}')
+_PAD = re.compile(r'\(pad\s+("(?:\\.|[^"\\])*"|[^\s()]+)')
+
+
+class IndexedFootprint(NamedTuple):
+    library: str
+    name: str
+    description: Optional[str]
+    tags: Optional[str]
+    pad_count: int
+
+
+class FootprintMatch(NamedTuple):
+    footprint: IndexedFootprint
+    score: float
+
+
+def _phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", lambda match: match[1], value)
+
+
+def summarize_footprint(
+    path: pathlib.Path,
+) -> tuple[Optional[str], Optional[str], int]:
+    """
+    Read a footprint's description, tags and number of distinct numbered pads.
+
+    Tags and pads are found by pattern over the source text; the description
+    comes from :func:`read_footprint_description`.
+    """
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None, None, 0
+    tags = _TAGS.search(text) or _TAGS_PROPERTY.search(text)
+    pads = {number.strip('"') for number in _PAD.findall(text)}
+    pads.discard("")
+    return (
+        read_footprint_description(path, text),
+        _unescape(tags.group(1)) if tags else None,
+        len(pads),
+    )
+
+
+class FootprintIndex:
+    """
+    SQLite table of footprint summaries keyed by source path.
+
+    :meth:`refresh` re-reads only files whose size or modification time
+    changed since they were indexed and drops footprints that disappeared, so
+    listings after the first are served from the table. If the index file
+    cannot be opened, an in-memory table is used for this process instead.
+
+    When SQLite provides FTS5 with the trigram tokenizer, :meth:`search` ranks
+    footprints by word and trigram matches over their names, descriptions and
+    tags.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self.path = pathlib.Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self.searchable = False
+
+    def _create(self, connection: sqlite3.Connection) -> None:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != FOOTPRINT_INDEX_SCHEMA:
+            for table in ("footprints", *_SEARCH_TABLES):
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            connection.execute(f"PRAGMA user_version = {FOOTPRINT_INDEX_SCHEMA}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS footprints ("
+            "id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE, "
+            "library TEXT NOT NULL, name TEXT NOT NULL, "
+            "description TEXT, tags TEXT, pad_count INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS footprints_reference "
+            "ON footprints (library, name)"
+        )
+        try:
+            self._create_search(connection)
+        except sqlite3.OperationalError as exc:
+            log.warning("Footprint search is unavailable in this SQLite: %s", exc)
+            self.searchable = False
+        else:
+            self.searchable = True
+        connection.commit()
+
+    def _create_search(self, connection: sqlite3.Connection) -> None:
+        old = "old.id, old.name, old.description, old.tags"
+        new = "new.id, new.name, new.description, new.tags"
+        removals, additions = [], []
+        for table, tokenizer in _SEARCH_TABLES.items():
+            connection.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+                "name, description, tags, content='footprints', "
+                f"content_rowid='id', tokenize='{tokenizer}')"
+            )
+            removals.append(
+                f"INSERT INTO {table} ({table}, rowid, name, description, tags) "
+                f"VALUES ('delete', {old});"
+            )
+            additions.append(
+                f"INSERT INTO {table} (rowid, name, description, tags) "
+                f"VALUES ({new});"
+            )
+        removed, added = " ".join(removals), " ".join(additions)
+        for trigger, event, body in (
+            ("footprints_inserted", "INSERT", added),
+            ("footprints_deleted", "DELETE", removed),
+            ("footprints_updated", "UPDATE", removed + " " + added),
+        ):
+            connection.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {trigger} AFTER {event} "
+                f"ON footprints BEGIN {body} END"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    self.path, timeout=10, check_same_thread=False
+                )
+                self._create(connection)
+            except (OSError, sqlite3.Error) as exc:
+                log.warning("Footprint index %s is unavailable: %s", self.path, exc)
+                connection = sqlite3.connect(":memory:", check_same_thread=False)
+                self._create(connection)
+            self._connection = connection
+        return self._connection
+
+    def _row(self, entry: FootprintEntry, stat: os.stat_result) -> tuple:
+        description, tags, pad_count = summarize_footprint(entry.path)
+        return (
+            str(entry.path),
+            entry.library,
+            entry.footprint_name,
+            description,
+            tags,
+            pad_count,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+    def refresh(self, entries: Iterable[FootprintEntry]) -> int:
+        """Bring the index in line with ``entries``; return how many were read."""
+        entries = [entry for entry in entries if entry.path is not None]
+        with self._lock:
+            connection = self._connect()
+            indexed = {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in connection.execute(
+                    "SELECT path, size, mtime_ns FROM footprints"
+                )
+            }
+            rows = []
+            for entry in entries:
+                try:
+                    stat = entry.path.stat()
+                except OSError:
+                    continue
+                if indexed.get(str(entry.path)) != (stat.st_size, stat.st_mtime_ns):
+                    rows.append(self._row(entry, stat))
+            current = {str(entry.path) for entry in entries}
+            removed = [(path,) for path in indexed if path not in current]
+            with connection:
+                connection.executemany("DELETE FROM footprints WHERE path = ?", removed)
+                connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return (
+                self._connect().execute("SELECT count(*) FROM footprints").fetchone()[0]
+            )
+
+    def footprints(self, library: Optional[str] = None) -> list[IndexedFootprint]:
+        """Indexed footprints ordered by library and name."""
+        query = "SELECT library, name, description, tags, pad_count FROM footprints"
+        parameters: tuple = ()
+        if library is not None:
+            query += " WHERE library = ?"
+            parameters = (library,)
+        with self._lock:
+            rows = self._connect().execute(
+                query + " ORDER BY library, name", parameters
+            )
+            return [IndexedFootprint(*row) for row in rows]
+
+    def lookup(self, entry: FootprintEntry) -> IndexedFootprint:
+        """The summary of one footprint file, indexing it first if it changed."""
+        self._refresh_one(entry)
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT library, name, description, tags, pad_count "
+                    "FROM footprints WHERE path = ?",
+                    (str(entry.path),),
+                )
+                .fetchone()
+            )
+        return IndexedFootprint(*row)
+
+    def search(
+        self,
+        query: str,
+        library: Optional[str] = None,
+        pad_count: Optional[int] = None,
+        limit: int = 20,
+    ) -> list[FootprintMatch]:
+        """
+        Footprints matching ``query``, best first.
+
+        Query words are matched as whole tokens, ranked by bm25 with names
+        weighted above tags and tags above descriptions. Words that occur in
+        no footprint as a token are matched by their three-character runs
+        instead, so ``qfn16`` still finds ``QFN-16``. A footprint's score is
+        the sum of its word and trigram ranks.
+        """
+        words = list(dict.fromkeys(word.lower() for word in _WORD.findall(query)))
+        if not words:
+            return []
+        conditions, parameters = [], []
+        if library is not None:
+            conditions.append("library = ?")
+            parameters.append(library)
+        if pad_count is not None:
+            conditions.append("pad_count = ?")
+            parameters.append(pad_count)
+        scores: dict[int, float] = {}
+        footprints: dict[int, IndexedFootprint] = {}
+        with self._lock:
+            connection = self._connect()
+            if not self.searchable:
+                raise KicadCatalogError(
+                    "Footprint search needs SQLite with FTS5 and the trigram "
+                    "tokenizer (SQLite 3.34 or newer)."
+                )
+            unknown = [
+                word
+                for word in words
+                if connection.execute(
+                    "SELECT 1 FROM footprint_words WHERE footprint_words MATCH ? "
+                    "LIMIT 1",
+                    (_phrase(word),),
+                ).fetchone()
+                is None
+            ]
+            trigrams = dict.fromkeys(
+                word[start : start + 3]
+                for word in unknown
+                for start in range(len(word) - 2)
+            )
+            for table, terms in (
+                ("footprint_words", [word for word in words if word not in unknown]),
+                ("footprint_trigrams", trigrams),
+            ):
+                if not terms:
+                    continue
+                filtered = ""
+                if conditions:
+                    # The unary plus keeps SQLite from handing the rowid list to
+                    # FTS5, which would run the match once per filtered row.
+                    filtered = (
+                        " AND +rowid IN (SELECT id FROM footprints WHERE "
+                        + " AND ".join(conditions)
+                        + ")"
+                    )
+                rows = connection.execute(
+                    "SELECT f.id, m.score, f.library, f.name, f.description, "
+                    "f.tags, f.pad_count FROM ("
+                    f"SELECT rowid, bm25({table}, {_SEARCH_WEIGHTS}) AS score "
+                    f"FROM {table} WHERE {table} MATCH ?{filtered} "
+                    "ORDER BY score LIMIT ?"
+                    ") AS m JOIN footprints AS f ON f.id = m.rowid",
+                    (
+                        " OR ".join(_phrase(term) for term in terms),
+                        *parameters,
+                        _SEARCH_CANDIDATES,
+                    ),
+                )
+                for row_id, rank, *footprint in rows:
+                    scores[row_id] = scores.get(row_id, 0.0) - rank
+                    footprints[row_id] = IndexedFootprint(*footprint)
+        ranked = sorted(
+            scores,
+            key=lambda row_id: (
+                -scores[row_id],
+                footprints[row_id].library,
+                footprints[row_id].name,
+            ),
+        )
+        return [
+            FootprintMatch(footprints[row_id], scores[row_id])
+            for row_id in ranked[:limit]
+        ]
+
+    def _refresh_one(self, entry: FootprintEntry) -> None:
+        stat = entry.path.stat()
+        with self._lock:
+            connection = self._connect()
+            indexed = connection.execute(
+                "SELECT size, mtime_ns FROM footprints WHERE path = ?",
+                (str(entry.path),),
+            ).fetchone()
+            if indexed != (stat.st_size, stat.st_mtime_ns):
+                with connection:
+                    connection.execute(_UPSERT, self._row(entry, stat))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_OPEN_INDEXES: dict[pathlib.Path, FootprintIndex] = {}
+_OPEN_INDEXES_LOCK = threading.Lock()
+
+
+def open_index(path: Union[str, pathlib.Path]) -> FootprintIndex:
+    """Return the process-wide index object for ``path``."""
+    path = pathlib.Path(path)
+    with _OPEN_INDEXES_LOCK:
+        if path not in _OPEN_INDEXES:
+            _OPEN_INDEXES[path] = FootprintIndex(path)
+        return _OPEN_INDEXES[path]
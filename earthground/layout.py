@@ -1,10 +1,13 @@
 import dataclasses
 import enum
+import hashlib
+import json
 import logging
 import math
+import os
 from collections import namedtuple
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
 
 import yaml
 
@@ -204,7 +207,7 @@ class Orientation(enum.Enum):
     CENTER = enum.auto()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Placement:
     position: Position
     id: Optional[Orientation] = None
@@ -257,9 +260,398 @@ def transform_position(position: Position, origin: Position) -> Position:
     return rotate_position(position, origin.angle).translate(origin.x, origin.y)
 
 
+DEFAULT_FOOTPRINT_BBOX = BoundingBox(-0.5, -0.5, 0.5, 0.5)
+
+
+def courtyard_bbox(component: "cmp.Component") -> BoundingBox:
+    """Footprint-local keep-out box, or a 1 mm square when no footprint is set."""
+    if component.footprint is None:
+        return DEFAULT_FOOTPRINT_BBOX
+    return component.footprint.get_courtyard_bbox()
+
+
+def pad_pin(component, number) -> Optional["cmp.Pin"]:
+    """Pin behind a footprint pad, by pad number or name."""
+    try:
+        index = int(number)
+    except (TypeError, ValueError):
+        index = number
+    try:
+        return component.pins[index]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def transform_corners(
+    bbox: BoundingBox, position: Position, layer: Layer = Layer.TOP
+) -> tuple[tuple[float, float], ...]:
+    """Board coordinates of a footprint-local box's corners once placed, in order."""
+    x1, x2 = (-bbox.x2, -bbox.x1) if layer == Layer.BOTTOM else (bbox.x1, bbox.x2)
+    corners = (
+        rotate_position(Position(x, y, 0), position.angle)
+        for x, y in ((x1, bbox.y1), (x2, bbox.y1), (x2, bbox.y2), (x1, bbox.y2))
+    )
+    return tuple((corner.x + position.x, corner.y + position.y) for corner in corners)
+
+
+def transform_bbox(
+    bbox: BoundingBox, position: Position, layer: Layer = Layer.TOP
+) -> BoundingBox:
+    """Return the board-axis-aligned box of a footprint-local box once placed."""
+    corners = transform_corners(bbox, position, layer)
+    return BoundingBox(
+        x1=min(x for x, _ in corners),
+        y1=min(y for _, y in corners),
+        x2=max(x for x, _ in corners),
+        y2=max(y for _, y in corners),
+    )
+
+
+class ModuleTransform(NamedTuple):
+    """Board transform of one module instance, with its trig evaluated once."""
+
+    x: float
+    y: float
+    angle: float
+    cos_a: float
+    sin_a: float
+    layer: Layer
+
+    @classmethod
+    def from_layout(cls, layout: ComponentLayout) -> "ModuleTransform":
+        position = layout.component
+        rotation_radians = math.radians(position.angle)
+        return cls(
+            x=position.x,
+            y=position.y,
+            angle=position.angle,
+            cos_a=math.cos(rotation_radians),
+            sin_a=math.sin(rotation_radians),
+            layer=layout.layer,
+        )
+
+    def rotate_all(self, positions: Iterable[Position]) -> list[Position]:
+        cos_a, sin_a, angle = self.cos_a, self.sin_a, self.angle
+        return [
+            Position(
+                x=p.x * cos_a - p.y * sin_a,
+                y=p.x * sin_a + p.y * cos_a,
+                angle=p.angle + angle,
+            )
+            for p in positions
+        ]
+
+    def apply_all(self, positions: Iterable[Position]) -> list[Position]:
+        cos_a, sin_a, angle = self.cos_a, self.sin_a, self.angle
+        x, y = self.x, self.y
+        return [
+            Position(
+                x=(p.x * cos_a - p.y * sin_a) + x,
+                y=(p.x * sin_a + p.y * cos_a) + y,
+                angle=p.angle + angle,
+            )
+            for p in positions
+        ]
+
+    def apply_layouts(
+        self, layouts: Iterable[ComponentLayout]
+    ) -> list[ComponentLayout]:
+        layouts = list(layouts)
+        ids = self.rotate_all(item.id for item in layouts)
+        components = self.apply_all(item.component for item in layouts)
+        return [
+            ComponentLayout(
+                id=id_position,
+                id_orientation=item.id_orientation,
+                component=component,
+                layer=combine_layer(self.layer, item.layer),
+            )
+            for item, id_position, component in zip(layouts, ids, components)
+        ]
+
+
+class FlattenedLayout(NamedTuple):
+    """Board-coordinate view of a design hierarchy, cached by ``Layout``."""
+
+    placements: Dict[str, FlattenedPlacement]
+    silk: Tuple[SilkLine, ...]
+    fab: Tuple[FabLine | FabText, ...]
+    fallback: Tuple[Tuple[str, str], ...]
+
+
+class TrackedDict(dict):
+    """Dictionary that calls ``changed`` after every write."""
+
+    def __init__(self, changed: Callable[[], None], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._changed = changed
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._changed()
+        return result
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._changed()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._changed()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._changed()
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
+class TrackedList(list):
+    """List that calls ``changed`` after every write."""
+
+    def __init__(self, changed: Callable[[], None], *args) -> None:
+        super().__init__(*args)
+        self._changed = changed
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, items) -> None:
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._changed()
+        return result
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+LAYOUT_CACHE_SCHEMA = 1
+
+
+def layout_cache_path(path: str | Path) -> Path:
+    """Return the compact JSON mirror path for a layout sidecar."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.cache.json")
+
+
+def _compact_layout(layout_file: LayoutFileModel) -> dict:
+    """Reduce a validated sidecar to plain lists that convert without validation."""
+    tracks = None
+    if layout_file.tracks is not None:
+        tracks = []
+        for track in layout_file.tracks:
+            row = [
+                track.start.x,
+                track.start.y,
+                track.end.x,
+                track.end.y,
+                track.width,
+                track.layer,
+                track.net,
+                track.locked,
+            ]
+            if isinstance(track, LayoutTrackArcModel):
+                row.extend((track.mid.x, track.mid.y))
+            elif not isinstance(track, LayoutTrackSegmentModel):  # pragma: no cover
+                raise TypeError(f"Unsupported track type: {type(track)}")
+            tracks.append(row)
+    return {
+        "placements": {
+            refdes: [placement.x, placement.y, placement.rotation, placement.layer]
+            for refdes, placement in layout_file.placements.items()
+        },
+        "tracks": tracks,
+        "vias": (
+            None
+            if layout_file.vias is None
+            else [
+                [via.position.x, via.position.y, via.net, via.diameter, via.drill]
+                for via in layout_file.vias
+            ]
+        ),
+        "zones": (
+            None
+            if layout_file.zones is None
+            else [
+                [
+                    zone.net,
+                    list(zone.layers),
+                    [[point.x, point.y] for point in zone.outline],
+                    zone.name,
+                    zone.clearance,
+                    zone.min_thickness,
+                    zone.priority,
+                    zone.fill,
+                    zone.locked,
+                ]
+                for zone in layout_file.zones
+            ]
+        ),
+    }
+
+
+def _read_layout_cache(path: Path, digest: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("schema") != LAYOUT_CACHE_SCHEMA
+        or cached.get("sha256") != digest
+    ):
+        return None
+    return cached.get("layout")
+
+
+def _write_layout_cache(path: Path, digest: str, document: dict) -> None:
+    payload = {"schema": LAYOUT_CACHE_SCHEMA, "sha256": digest, "layout": document}
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(temporary, path)
+    except OSError as exc:
+        # The mirror is an optimisation; an unwritable directory must not
+        # prevent loading the sidecar itself.
+        log.warning("Unable to write layout cache %s: %s", path, exc)
+        temporary.unlink(missing_ok=True)
+
+
+def _convert_compact_layout(document: dict) -> tuple[
+    Dict[str, Placement],
+    Optional[list[Track]],
+    Optional[list[ViaConfig]],
+    Optional[list[Zone]],
+]:
+    """Build layout objects from a compact document, without mutating a layout."""
+    placements = {
+        refdes: Placement(
+            position=Position(x=x, y=y, angle=rotation),
+            id=None,
+            layer=Layer[layer],
+        )
+        for refdes, (x, y, rotation, layer) in document["placements"].items()
+    }
+
+    tracks: list[Track] | None = None
+    if document["tracks"] is not None:
+        tracks = []
+        for track in document["tracks"]:
+            start_x, start_y, end_x, end_y, width, layer, net, locked = track[:8]
+            common = {
+                "start": LayoutPoint(start_x, start_y),
+                "end": LayoutPoint(end_x, end_y),
+                "width": width,
+                "layer": layer,
+                "net_name": net,
+                "locked": locked,
+            }
+            if len(track) == 8:
+                tracks.append(TrackSegment(**common))
+            else:
+                tracks.append(TrackArc(**common, mid=LayoutPoint(*track[8:])))
+
+    vias = None
+    if document["vias"] is not None:
+        vias = [
+            ViaConfig(
+                location=Position(x, y, 0),
+                net_name=net,
+                hole_size=diameter,
+                drill_size=drill,
+            )
+            for x, y, net, diameter, drill in document["vias"]
+        ]
+
+    zones = None
+    if document["zones"] is not None:
+        zones = [
+            Zone(
+                net_name=net,
+                layers=tuple(layers),
+                outline=tuple(LayoutPoint(x, y) for x, y in outline),
+                name=name,
+                clearance=clearance,
+                min_thickness=min_thickness,
+                priority=priority,
+                fill=fill,
+                locked=locked,
+            )
+            for (
+                net,
+                layers,
+                outline,
+                name,
+                clearance,
+                min_thickness,
+                priority,
+                fill,
+                locked,
+            ) in document["zones"]
+        ]
+    return placements, tracks, vias, zones
+
+
 class Layout:
     def __init__(self, design: "sch_lib.Design") -> None:
         self.design: sch_lib.Design = design
+        self._revision = 0
+        self._flattened: Optional[Tuple[tuple, FlattenedLayout]] = None
         self.placement: Dict[str, Placement] = {}
         self.outline: BoundingBox = BoundingBox(x1=0, y1=0, x2=0, y2=0)
         self.layer_count: int = 2
@@ -270,6 +662,43 @@ class Layout:
         self.silk: list[SilkLine] = []
         self.fab: list[FabLine | FabText] = []
 
+    @property
+    def placement(self) -> Dict[str, Placement]:
+        return self._placement
+
+    @placement.setter
+    def placement(self, value: Dict[str, Placement]) -> None:
+        self._placement = TrackedDict(self.invalidate, value)
+        self.invalidate()
+
+    @property
+    def silk(self) -> list[SilkLine]:
+        return self._silk
+
+    @silk.setter
+    def silk(self, value: Iterable[SilkLine]) -> None:
+        self._silk = TrackedList(self.invalidate, value)
+        self.invalidate()
+
+    @property
+    def fab(self) -> list[FabLine | FabText]:
+        return self._fab
+
+    @fab.setter
+    def fab(self, value: Iterable[FabLine | FabText]) -> None:
+        self._fab = TrackedList(self.invalidate, value)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Mark flattened results that include this layout stale.
+
+        Writes to ``placement``, ``silk``, ``fab``, the design's components and
+        a component's ``footprint`` call this; call it after changing a
+        footprint's geometry in place.
+        """
+        self._revision += 1
+
     @property
     def traces(self) -> list[Track]:
         """Compatibility alias for the formerly untyped trace collection."""
@@ -279,34 +708,42 @@ class Layout:
     def traces(self, value: list[Track]) -> None:
         self.tracks = value
 
-    def get_placement(
-        self, id: str, *, warn_on_fallback: bool = True
-    ) -> ComponentLayout:
+    def _fallback_layouts(self) -> Dict[str, ComponentLayout]:
+        """Lay every unplaced component out along the deterministic fallback strip."""
         floating_components = sorted(
             set(self.design.components.keys()) - set(self.placement.keys())
         )
-        if id not in self.placement and id not in self.design.components:
-            raise ValueError(
-                f"Cannot get placement for {id}. Component not in {self.design.name}"
-            )
-        elif id in floating_components:
-            if warn_on_fallback:
-                log.warning("Component %s is floating in %s", id, self.design.name)
-            index = floating_components.index(id)
-            x = 0
-            for f in floating_components[:index]:
-                if self.design.components[f].virtual:
-                    continue
-                footprint = self.design.components[f].footprint
-                x += (1 if footprint is None else footprint.get_bbox().width()) + 1
-            x = x % SCHEMATIC_WIDTH
+        fallback = {}
+        offset = 0
+        for cid in floating_components:
+            x = offset % SCHEMATIC_WIDTH
             y = x // SCHEMATIC_WIDTH
-            return ComponentLayout(
+            fallback[cid] = ComponentLayout(
                 id=Position(x=0, y=0, angle=0),
                 id_orientation=Orientation.CENTER,
                 component=Position(x=x, y=y, angle=0),
                 layer=Layer.TOP,
             )
+            component = self.design.components[cid]
+            if not component.virtual:
+                footprint = component.footprint
+                offset += (1 if footprint is None else footprint.get_bbox().width()) + 1
+        return fallback
+
+    def get_placement(
+        self, id: str, *, warn_on_fallback: bool = True
+    ) -> ComponentLayout:
+        if id not in self.placement and id not in self.design.components:
+            raise ValueError(
+                f"Cannot get placement for {id}. Component not in {self.design.name}"
+            )
+        elif id not in self.placement:
+            if warn_on_fallback:
+                log.warning("Component %s is floating in %s", id, self.design.name)
+            return self._fallback_layouts()[id]
+        return self._explicit_placement(id)
+
+    def _explicit_placement(self, id: str) -> ComponentLayout:
         if id not in self.design.components:
             raise ValueError(
                 f"Component {id} is not found in the design: {list(self.design.components.keys())}"
@@ -356,79 +793,39 @@ class Layout:
             layer=self.placement[id].layer,
         )
 
-    def load_layout_from_yaml(self, path: str | Path) -> Dict[str, Placement]:
-        with open(path, encoding="utf-8") as f:
-            raw_layout = yaml.safe_load(f) or {}
-        layout_file = LayoutFileModel.model_validate(raw_layout)
-
-        placements = {
-            refdes: Placement(
-                position=Position(
-                    x=placement.x,
-                    y=placement.y,
-                    angle=placement.rotation,
-                ),
-                id=None,
-                layer=Layer[placement.layer],
-            )
-            for refdes, placement in layout_file.placements.items()
-        }
+    def load_layout_from_yaml(
+        self, path: str | Path, *, use_cache: bool = False
+    ) -> Dict[str, Placement]:
+        """
+        Load a layout sidecar into this layout.
 
-        tracks: list[Track] | None = None
-        if layout_file.tracks is not None:
-            tracks = []
-            for track in layout_file.tracks:
-                common = {
-                    "start": LayoutPoint(track.start.x, track.start.y),
-                    "end": LayoutPoint(track.end.x, track.end.y),
-                    "width": track.width,
-                    "layer": track.layer,
-                    "net_name": track.net,
-                    "locked": track.locked,
-                }
-                if isinstance(track, LayoutTrackSegmentModel):
-                    tracks.append(TrackSegment(**common))
-                elif isinstance(track, LayoutTrackArcModel):
-                    tracks.append(
-                        TrackArc(
-                            **common,
-                            mid=LayoutPoint(track.mid.x, track.mid.y),
-                        )
+        With ``use_cache`` a compact JSON mirror of the validated sidecar is
+        written next to the YAML and reused while the YAML's SHA-256 is
+        unchanged, which skips YAML parsing and schema validation on repeat
+        loads. A mirror that does not convert cleanly is treated as a miss.
+        """
+        path = Path(path)
+        content = path.read_bytes()
+        sections = None
+        if use_cache:
+            digest = hashlib.sha256(content).hexdigest()
+            cache_path = layout_cache_path(path)
+            document = _read_layout_cache(cache_path, digest)
+            if document is not None:
+                try:
+                    sections = _convert_compact_layout(document)
+                except (KeyError, TypeError, ValueError) as exc:
+                    log.warning(
+                        "Ignoring unusable layout cache %s: %s", cache_path, exc
                     )
-                else:  # pragma: no cover - protected by the discriminated union
-                    raise TypeError(f"Unsupported track type: {type(track)}")
-
-        vias = None
-        if layout_file.vias is not None:
-            vias = [
-                ViaConfig(
-                    location=Position(via.position.x, via.position.y, 0),
-                    net_name=via.net,
-                    hole_size=via.diameter,
-                    drill_size=via.drill,
-                )
-                for via in layout_file.vias
-            ]
-
-        zones = None
-        if layout_file.zones is not None:
-            zones = [
-                Zone(
-                    net_name=zone.net,
-                    layers=tuple(zone.layers),
-                    outline=tuple(
-                        LayoutPoint(point.x, point.y) for point in zone.outline
-                    ),
-                    name=zone.name,
-                    clearance=zone.clearance,
-                    min_thickness=zone.min_thickness,
-                    priority=zone.priority,
-                    fill=zone.fill,
-                    locked=zone.locked,
-                )
-                for zone in layout_file.zones
-            ]
-
+        if sections is None:
+            raw_layout = yaml.load(content, Loader=_YamlLoader) or {}
+            document = _compact_layout(LayoutFileModel.model_validate(raw_layout))
+            sections = _convert_compact_layout(document)
+            if use_cache:
+                _write_layout_cache(cache_path, digest, document)
+
+        placements, tracks, vias, zones = sections
         # Mutate only after the complete document has validated and converted.
         self.placement = placements
         if tracks is not None:
@@ -462,34 +859,67 @@ class Layout:
             )
         return flattened
 
-    def flatten_with_provenance(
-        self, *, warn_on_fallback: bool = True
-    ) -> Dict[str, FlattenedPlacement]:
-        """Flatten hierarchy while retaining whether every placement was explicit."""
+    def _cache_key(self) -> tuple:
+        return tuple(
+            (id(design.layout), design.layout._revision)
+            for design in self.design.iter_designs()
+        )
 
-        flattened: Dict[str, FlattenedPlacement] = {}
+    def flattened(self) -> FlattenedLayout:
+        """
+        Return the board-coordinate layout of the whole hierarchy.
 
-        def visit(design, prefix="", parent_layout=None, parent_explicit=True):
-            for cid, component in design.components.items():
-                refdes = f"{prefix}_{cid}" if prefix else cid
-                local = design.layout.get_placement(
-                    cid, warn_on_fallback=warn_on_fallback
+        The result is cached and rebuilt only after :meth:`invalidate` runs on
+        a layout anywhere in the hierarchy: a placement, component, footprint,
+        silk or fab item was added, removed or replaced.
+        """
+        key = self._cache_key()
+        if self._flattened is None or self._flattened[0] != key:
+            self._flattened = (key, self._build_flattened())
+        return self._flattened[1]
+
+    def _build_flattened(self) -> FlattenedLayout:
+        placements: Dict[str, FlattenedPlacement] = {}
+        silk: list[SilkLine] = []
+        fab: list[FabLine | FabText] = []
+        fallback: list[Tuple[str, str]] = []
+
+        def visit(design, prefix, transform, parent_explicit):
+            layout = design.layout
+            fallback_layouts = layout._fallback_layouts()
+            fallback.extend((design.name, cid) for cid in fallback_layouts)
+            local = {
+                cid: (
+                    fallback_layouts[cid]
+                    if cid in fallback_layouts
+                    else layout._explicit_placement(cid)
                 )
-                explicit = parent_explicit and cid in design.layout.placement
-                if parent_layout is not None:
-                    local = ComponentLayout(
-                        id=rotate_position(local.id, parent_layout.component.angle),
-                        id_orientation=local.id_orientation,
-                        component=transform_position(
-                            local.component, parent_layout.component
-                        ),
-                        layer=combine_layer(parent_layout.layer, local.layer),
-                    )
+                for cid in design.components
+            }
+            if transform is None:
+                resolved = list(local.values())
+                silk.extend(layout.silk)
+                fab.extend(layout.fab)
+            else:
+                resolved = transform.apply_layouts(local.values())
+                silk.extend(_transform_silk(layout.silk, transform))
+                fab.extend(_transform_fab(layout.fab, transform))
+
+            for (cid, component), component_layout in zip(
+                design.components.items(), resolved
+            ):
+                refdes = f"{prefix}_{cid}" if prefix else cid
+                explicit = parent_explicit and cid in layout.placement
                 if isinstance(component, cmp.ModuleComponent):
-                    visit(component.parent, refdes, local, explicit)
+                    visit(
+                        component.parent,
+                        refdes,
+                        ModuleTransform.from_layout(component_layout),
+                        explicit,
+                    )
                 elif isinstance(component, cmp.Component):
-                    flattened[refdes] = FlattenedPlacement(
-                        local,
+                    placements[refdes] = FlattenedPlacement(
+                        component_layout,
                         component,
                         (
                             PlacementProvenance.EXPLICIT
@@ -500,54 +930,53 @@ class Layout:
                 else:
                     raise ValueError(f"Invalid component type: {type(component)}")
 
-        visit(self.design)
-        return flattened
+        visit(self.design, "", None, True)
+        return FlattenedLayout(placements, tuple(silk), tuple(fab), tuple(fallback))
+
+    def flatten_with_provenance(
+        self, *, warn_on_fallback: bool = True
+    ) -> Dict[str, FlattenedPlacement]:
+        """Flatten hierarchy while retaining whether every placement was explicit."""
+        flattened = self.flattened()
+        if warn_on_fallback:
+            for design_name, cid in flattened.fallback:
+                log.warning("Component %s is floating in %s", cid, design_name)
+        return dict(flattened.placements)
 
     def flatten_silk(self) -> list[SilkLine]:
-        flattened = list(self.silk)
-        for cid, component in self.design.components.items():
-            if not isinstance(component, cmp.ModuleComponent):
-                continue
-            module_layout = self.get_placement(cid)
-            module_position = module_layout.component
-            for item in component.parent.layout.flatten_silk():
-                flattened.append(
-                    SilkLine(
-                        start=transform_position(item.start, module_position),
-                        end=transform_position(item.end, module_position),
-                        layer=combine_layer(module_layout.layer, item.layer),
-                    )
-                )
-        return flattened
+        return list(self.flattened().silk)
 
     def flatten_fab(self) -> list[FabLine | FabText]:
-        flattened: list[FabLine | FabText] = list(self.fab)
-        for cid, component in self.design.components.items():
-            if not isinstance(component, cmp.ModuleComponent):
-                continue
-            module_layout = self.get_placement(cid)
-            module_position = module_layout.component
-            for item in component.parent.layout.flatten_fab():
-                layer = combine_layer(module_layout.layer, item.layer)
-                if isinstance(item, FabLine):
-                    flattened.append(
-                        FabLine(
-                            start=transform_position(item.start, module_position),
-                            end=transform_position(item.end, module_position),
-                            layer=layer,
-                        )
-                    )
-                elif isinstance(item, FabText):
-                    flattened.append(
-                        FabText(
-                            text=item.text,
-                            position=transform_position(item.position, module_position),
-                            height=item.height,
-                            width=item.width,
-                            thickness=item.thickness,
-                            layer=layer,
-                        )
-                    )
-                else:
-                    raise TypeError(f"Unsupported fab item: {type(item)}")
-        return flattened
+        return list(self.flattened().fab)
+
+
+def _transform_silk(
+    items: list[SilkLine], transform: ModuleTransform
+) -> list[SilkLine]:
+    starts = transform.apply_all(item.start for item in items)
+    ends = transform.apply_all(item.end for item in items)
+    return [
+        SilkLine(
+            start=start,
+            end=end,
+            layer=combine_layer(transform.layer, item.layer),
+        )
+        for item, start, end in zip(items, starts, ends)
+    ]
+
+
+def _transform_fab(
+    items: list[FabLine | FabText], transform: ModuleTransform
+) -> list[FabLine | FabText]:
+    flattened: list[FabLine | FabText] = []
+    for item in items:
+        layer = combine_layer(transform.layer, item.layer)
+        if isinstance(item, FabLine):
+            start, end = transform.apply_all((item.start, item.end))
+            flattened.append(FabLine(start=start, end=end, layer=layer))
+        elif isinstance(item, FabText):
+            (position,) = transform.apply_all((item.position,))
+            flattened.append(item._replace(position=position, layer=layer))
+        else:
+            raise TypeError(f"Unsupported fab item: {type(item)}")
+    return flattened
@@ -11,6 +11,7 @@ import earthground.standard_values as sv
 import earthground.straps as straps
 import earthground.thermal as thermal
 import earthground.contracts as contracts
+import earthground.drc as drc
 import earthground.sourcing as sourcing
 import earthground.signal_integrity as signal_integrity
 from earthground.analysis import DesignAnalysis
@@ -84,7 +85,9 @@ class Design:
         if not short_name:
             self.short_name = self.name
         self._net_scope = self.short_name
-        self.components: Dict[str, cmp.Component] = {}
+        self.components: Dict[str, cmp.Component] = layout_lib.TrackedDict(
+            self._invalidate_layout
+        )
         self.modules: List[Design] = []
         self._nets: Dict[str, cmp.Net] = {}
         self._pin_to_net: Dict[cmp.Pin, cmp.Net] = {}
@@ -803,6 +806,9 @@ class Design:
                     self.join_net(port_pin, net_name)
                     self.join_net(connection, net_name)
 
+    def _invalidate_layout(self) -> None:
+        self.layout.invalidate()
+
     def iter_designs(self) -> Iterator["Design"]:
         """Yield this design and every nested module depth-first."""
         yield self
@@ -865,6 +871,12 @@ class Design:
     def sourcing_report(self) -> sourcing.SourcingReport:
         return sourcing.check_design(self)
 
+    def placement_overlaps(self, clearance: float = 0.0):
+        return drc.find_placement_overlaps(self, clearance=clearance)
+
+    def connectivity_report(self) -> drc.ConnectivityReport:
+        return drc.check_connectivity(self)
+
     def validate(
         self,
         skip_footprint_check=False,
@@ -873,6 +885,8 @@ class Design:
         check_straps=False,
         check_contracts=False,
         check_sourcing=False,
+        check_placement_overlaps=False,
+        check_connectivity=False,
     ):
         errors = []
         errors.extend(signal_integrity.validate_design(self))
@@ -903,6 +917,10 @@ class Design:
             )
         if check_sourcing:
             errors.extend(str(check) for check in self.sourcing_report().blocking)
+        if check_placement_overlaps:
+            errors.extend(str(overlap) for overlap in self.placement_overlaps())
+        if check_connectivity:
+            errors.extend(str(item) for item in self.connectivity_report().blocking)
         if errors:
             header = f" {self.name.upper()} VALIDATION FAILED "
             log.error("")
@@ -6,6 +6,7 @@ YAML placement file as the user arranges footprints.
 Usage:
     earthground kicad place <script.py> [--output placements.yaml]
                                         [--poll-interval 1.0]
+                                        [--max-poll-interval 8.0]
 """
 
 import argparse
@@ -23,10 +24,14 @@ from collections.abc import Mapping
 
 import yaml
 
+import earthground.autoplace as autoplace
 import earthground.components as cmp
 import earthground.exporters.kicad as kicad_exporter
 import earthground.layout as layout_lib
 import earthground.schematic as sch_lib
+import earthground.wirelength as wirelength_lib
+from earthground.ipc.board_state import COPPER_SECTIONS, next_poll_delay
+from earthground.models.layout_models import LayoutFileModel
 
 
 @dataclasses.dataclass(frozen=True)
@@ -41,7 +46,9 @@ class PlaceWithKicad:
     script_path: pathlib.Path
     yaml_path: pathlib.Path | None = None
     poll_interval: float = 1.0
+    max_poll_interval: float = 8.0
     no_open: bool = False
+    auto_place: bool = False
     design: sch_lib.Design | None = dataclasses.field(default=None, init=False)
     descriptions: dict[str, str] = dataclasses.field(default_factory=dict, init=False)
     pcb_path: pathlib.Path | None = dataclasses.field(default=None, init=False)
@@ -357,6 +364,32 @@ class PlaceWithKicad:
             "rotation": round(cls.kicad_angle_to_layout_angle(pos.angle_deg), 1),
         }
 
+    @classmethod
+    def position_to_placement(cls, pos) -> layout_lib.Placement:
+        return layout_lib.Placement(
+            layout_lib.Position(
+                pos.x_mm, pos.y_mm, cls.kicad_angle_to_layout_angle(pos.angle_deg)
+            ),
+            layer=layout_lib.Layer[cls.layer_name(pos.layer)],
+        )
+
+    @staticmethod
+    def print_wirelength(
+        engine: wirelength_lib.WirelengthEngine,
+        delta: wirelength_lib.WirelengthDelta | None = None,
+    ) -> None:
+        if delta is None:
+            print(
+                f"  Wirelength: HPWL {engine.hpwl:.1f} mm, "
+                f"ratsnest {engine.mst:.1f} mm"
+            )
+        elif delta.nets:
+            print(
+                f"  Wirelength: HPWL {engine.hpwl:.1f} mm ({delta.hpwl:+.1f}), "
+                f"ratsnest {engine.mst:.1f} mm ({delta.mst:+.1f}) "
+                f"across {len(delta.nets)} net(s)"
+            )
+
     @staticmethod
     def normalize_yaml_document(data: dict) -> dict:
         structured_keys = {"schema_version", "placements", "tracks", "vias", "zones"}
@@ -438,16 +471,6 @@ class PlaceWithKicad:
             result["name"] = zone.name
         return result
 
-    @classmethod
-    def copper_to_yaml_sections(cls, snapshot) -> dict[str, list[dict]]:
-        tracks = [cls.track_to_yaml_entry(track) for track in snapshot.tracks]
-        vias = [cls.via_to_yaml_entry(via) for via in snapshot.vias]
-        zones = [cls.zone_to_yaml_entry(zone) for zone in snapshot.zones]
-        tracks.sort(key=lambda item: yaml.safe_dump(item, sort_keys=True))
-        vias.sort(key=lambda item: yaml.safe_dump(item, sort_keys=True))
-        zones.sort(key=lambda item: yaml.safe_dump(item, sort_keys=True))
-        return {"tracks": tracks, "vias": vias, "zones": zones}
-
     @staticmethod
     def write_yaml(yaml_path: pathlib.Path, data: dict):
         temporary_path = None
@@ -515,23 +538,6 @@ class PlaceWithKicad:
             or old_pos.layer != new_pos.layer
         )
 
-    @classmethod
-    def changed_refs(cls, old: dict, new: dict) -> list[str]:
-        changed = []
-        for refdes in new:
-            if refdes not in old or cls.position_changed(old[refdes], new[refdes]):
-                changed.append(refdes)
-        return changed
-
-    @classmethod
-    def positions_changed(cls, old: dict, new: dict) -> bool:
-        if set(old.keys()) != set(new.keys()):
-            return True
-        for refdes in old:
-            if cls.position_changed(old[refdes], new[refdes]):
-                return True
-        return False
-
     def load_design(self) -> sch_lib.Design:
         print(f"Loading design from {self.script_path}...")
         self.design = self.load_design_from_script(self.script_path)
@@ -543,6 +549,42 @@ class PlaceWithKicad:
         print(f"  Components: {len(self.descriptions)}")
         return self.design
 
+    def auto_place_unplaced(self) -> autoplace.AutoPlacementResult:
+        """Place every part missing from the design and the sidecar, then save."""
+        if self.design is None:
+            raise ValueError("design must be loaded before automatic placement")
+        yaml_data = self.normalize_yaml_document(self.read_yaml(self.yaml_path))
+        sidecar = LayoutFileModel.model_validate(yaml_data)
+        for refdes, entry in sidecar.placements.items():
+            if (
+                refdes in self.design.components
+                and refdes not in self.design.layout.placement
+            ):
+                self.design.layout.placement[refdes] = layout_lib.Placement(
+                    layout_lib.Position(entry.x, entry.y, entry.rotation),
+                    layer=layout_lib.Layer[entry.layer],
+                )
+
+        result = autoplace.auto_place(self.design)
+        placements = dict(yaml_data["placements"])
+        for refdes in sorted(result.placements):
+            position = result.placements[refdes].position
+            placements[refdes] = {
+                "description": self.descriptions.get(refdes, ""),
+                "layer": "TOP",
+                "x": round(position.x, 3),
+                "y": round(position.y, 3),
+                "rotation": round(position.angle, 1),
+            }
+        yaml_data["placements"] = placements
+        self.write_yaml(self.yaml_path, yaml_data)
+        print(
+            f"  Auto-placed {len(result.placements)} component(s); "
+            f"wirelength {result.initial_wirelength:.1f} -> "
+            f"{result.wirelength:.1f} mm"
+        )
+        return result
+
     def export_board(self) -> pathlib.Path:
         if self.design is None:
             raise ValueError("design must be loaded before exporting the board")
@@ -551,17 +593,64 @@ class PlaceWithKicad:
         self.pcb_path = pcb_dir / f"{self.design.name}.kicad_pcb"
         return self.pcb_path
 
+    @classmethod
+    def copper_entry(cls, section: str, item) -> tuple[str, dict]:
+        """A copper item's YAML entry and the key sorting it in its section."""
+        converters = {
+            "tracks": cls.track_to_yaml_entry,
+            "vias": cls.via_to_yaml_entry,
+            "zones": cls.zone_to_yaml_entry,
+        }
+        entry = converters[section](item)
+        return yaml.safe_dump(entry, sort_keys=True), entry
+
+    @classmethod
+    def update_copper_entries(
+        cls, entries: dict[str, dict], state, changes: dict[str, set]
+    ) -> set[str]:
+        """
+        Bring cached copper entries in line with ``state`` for the changed keys.
+
+        Returns the sections whose YAML content changed; an item re-digested by
+        KiCad but written identically does not count.
+        """
+        changed_sections = set()
+        for section in COPPER_SECTIONS:
+            cached = entries[section]
+            items = getattr(state, section)
+            for key in changes.get(section, ()):
+                old = cached.pop(key, None)
+                if key in items:
+                    cached[key] = cls.copper_entry(section, items[key].value)
+                if old != cached.get(key):
+                    changed_sections.add(section)
+        return changed_sections
+
+    @staticmethod
+    def copper_section(entries: dict) -> list[dict]:
+        return [entry for _, entry in sorted(entries.values(), key=lambda e: e[0])]
+
     def poll_loop(self, ipc):
+        """
+        Follow board edits in KiCad and write them to the layout YAML.
+
+        Each poll reads the board as per-item digests and only converts and
+        serialises items that changed since the previous poll. While nothing
+        changes, the wait between polls doubles up to ``max_poll_interval``.
+        """
         if self.design is None:
             raise ValueError("design must be loaded before polling")
 
-        last_snapshot = None
+        last_state = None
+        copper = {section: {} for section in COPPER_SECTIONS}
+        wirelength = wirelength_lib.WirelengthEngine(self.design)
         yaml_data = self.normalize_yaml_document(self.read_yaml(self.yaml_path))
         yaml_data["placements"] = self.prune_module_child_entries(
             yaml_data["placements"],
             module_child_refdes=self.module_child_refdes,
         )
         dirty = False
+        delay = self.poll_interval
         print(f"\nPolling KiCad for placement changes (every {self.poll_interval}s)...")
         print(f"YAML output: {self.yaml_path}")
         print("Press Ctrl-C to stop.\n")
@@ -569,7 +658,7 @@ class PlaceWithKicad:
         try:
             while True:
                 try:
-                    current = ipc.get_board_snapshot()
+                    current = ipc.get_board_state(last_state)
                 except Exception as exc:
                     print(f"  IPC error: {exc} — retrying...")
                     time.sleep(self.poll_interval)
@@ -579,77 +668,114 @@ class PlaceWithKicad:
                         pass
                     continue
 
-                current_positions = current.positions
-                current_copper = self.copper_to_yaml_sections(current)
-                if last_snapshot is None:
+                if last_state is None:
                     print(
-                        f"  Initial snapshot: {len(current_positions)} footprints, "
+                        f"  Initial snapshot: {len(current.footprints)} footprints, "
                         f"{len(current.tracks)} tracks, {len(current.zones)} zones"
                     )
-                    last_snapshot = current
+                    self.update_copper_entries(
+                        copper,
+                        current,
+                        {
+                            section: set(getattr(current, section))
+                            for section in COPPER_SECTIONS
+                        },
+                    )
+                    wirelength.update(
+                        {
+                            ref: self.position_to_placement(state.value)
+                            for ref, state in current.footprints.items()
+                        }
+                    )
+                    self.print_wirelength(wirelength)
+                    last_state = current
                     continue
 
-                last_positions = last_snapshot.positions
-                positions_changed = self.positions_changed(
-                    last_positions, current_positions
+                changes = current.changes(last_state)
+                if not changes:
+                    delay = next_poll_delay(
+                        delay, self.poll_interval, self.max_poll_interval
+                    )
+                    time.sleep(delay)
+                    continue
+                delay = self.poll_interval
+
+                moved = changes.get("footprints", set())
+                last_footprints = last_state.footprints
+                changed = [
+                    ref
+                    for ref, state in current.footprints.items()
+                    if ref in moved
+                    and (
+                        ref not in last_footprints
+                        or self.position_changed(
+                            last_footprints[ref].value, state.value
+                        )
+                    )
+                ]
+                positions_changed = bool(changed) or any(
+                    ref not in current.footprints for ref in moved
                 )
-                last_copper = self.copper_to_yaml_sections(last_snapshot)
-                copper_changed = {
-                    section
-                    for section in ("tracks", "vias", "zones")
-                    if current_copper[section] != last_copper[section]
-                }
 
-                if positions_changed or copper_changed:
-                    changed = self.changed_refs(last_positions, current_positions)
-
-                    if positions_changed:
-                        try:
-                            preferred_children_by_module = (
-                                self.preferred_children_by_module(
-                                    changed,
-                                    child_to_module=self.child_to_module,
-                                )
-                            )
-                            snapshot_data = self.positions_to_yaml_dict(
-                                current_positions,
-                                self.descriptions,
-                                design=self.design,
-                                module_specs=self.module_specs,
-                                module_child_refdes=self.module_child_refdes,
-                                preferred_children_by_module=preferred_children_by_module,
+                if positions_changed:
+                    current_positions = current.positions
+                    try:
+                        preferred_children_by_module = (
+                            self.preferred_children_by_module(
+                                changed,
+                                child_to_module=self.child_to_module,
                             )
-                        except ValueError as exc:
-                            print(f"  Placement validation failed: {exc}")
-                            time.sleep(self.poll_interval)
-                            continue
-                        changed_keys = self.changed_yaml_keys(
-                            changed,
-                            child_to_module=self.child_to_module,
-                        )
-                        yaml_data["placements"] = self.merge_yaml_changes(
-                            yaml_data["placements"], snapshot_data, changed_keys
                         )
-                        yaml_data["placements"] = self.prune_module_child_entries(
-                            yaml_data["placements"],
+                        snapshot_data = self.positions_to_yaml_dict(
+                            current_positions,
+                            self.descriptions,
+                            design=self.design,
+                            module_specs=self.module_specs,
                             module_child_refdes=self.module_child_refdes,
+                            preferred_children_by_module=preferred_children_by_module,
                         )
+                    except ValueError as exc:
+                        print(f"  Placement validation failed: {exc}")
+                        time.sleep(self.poll_interval)
+                        continue
+                    changed_keys = self.changed_yaml_keys(
+                        changed,
+                        child_to_module=self.child_to_module,
+                    )
+                    yaml_data["placements"] = self.merge_yaml_changes(
+                        yaml_data["placements"], snapshot_data, changed_keys
+                    )
+                    yaml_data["placements"] = self.prune_module_child_entries(
+                        yaml_data["placements"],
+                        module_child_refdes=self.module_child_refdes,
+                    )
 
-                        for ref in changed:
-                            p = current_positions[ref]
-                            print(
-                                f"  {ref}: ({p.x_mm:.2f}, {p.y_mm:.2f}) "
-                                f"{p.angle_deg:.0f}° {self.layer_name(p.layer)}"
-                            )
+                    for ref in changed:
+                        p = current_positions[ref]
+                        print(
+                            f"  {ref}: ({p.x_mm:.2f}, {p.y_mm:.2f}) "
+                            f"{p.angle_deg:.0f}° {self.layer_name(p.layer)}"
+                        )
+                    self.print_wirelength(
+                        wirelength,
+                        wirelength.update(
+                            {
+                                ref: self.position_to_placement(current_positions[ref])
+                                for ref in changed
+                            }
+                        ),
+                    )
 
-                    for section in sorted(copper_changed):
-                        yaml_data[section] = current_copper[section]
-                        print(f"  {section}: {len(current_copper[section])} item(s)")
+                copper_changed = self.update_copper_entries(copper, current, changes)
+                for section in sorted(copper_changed):
+                    yaml_data[section] = self.copper_section(copper[section])
+                    print(f"  {section}: {len(yaml_data[section])} item(s)")
 
+                if positions_changed or copper_changed:
                     self.write_yaml(self.yaml_path, yaml_data)
                     dirty = True
 
-                last_snapshot = current
+                last_state = current
 
                 time.sleep(self.poll_interval)
 
@@ -662,6 +788,8 @@ class PlaceWithKicad:
 
     def run(self):
         design = self.load_design()
+        if self.auto_place:
+            self.auto_place_unplaced()
         pcb_path = self.export_board()
 
         if not self.no_open:
@@ -695,13 +823,30 @@ def configure_place_parser(parser: argparse.ArgumentParser) -> None:
         "-p",
         type=float,
         default=1.0,
-        help="Seconds between board snapshots (default: 1.0).",
+        help="Seconds between board polls (default: 1.0).",
+    )
+    parser.add_argument(
+        "--max-poll-interval",
+        type=float,
+        default=8.0,
+        help=(
+            "Longest wait between polls while the board is unchanged; idle "
+            "waits double up to this (default: 8.0)."
+        ),
     )
     parser.add_argument(
         "--no-open",
         action="store_true",
         help="Do not open KiCad automatically (assume it is already running).",
     )
+    parser.add_argument(
+        "--auto-place",
+        action="store_true",
+        help=(
+            "Automatically place components that have no layout entry and "
+            "write them to the YAML file before opening KiCad."
+        ),
+    )
 
 
 def run_parsed_args(args) -> int:
@@ -711,7 +856,9 @@ def run_parsed_args(args) -> int:
             script_path=pathlib.Path(args.design_file),
             yaml_path=pathlib.Path(args.output) if args.output else None,
             poll_interval=args.poll_interval,
+            max_poll_interval=args.max_poll_interval,
             no_open=args.no_open,
+            auto_place=args.auto_place,
         ).run()
     except Exception as exc:
         print(f"earthground kicad place: error: {exc}", file=sys.stderr)
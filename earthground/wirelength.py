@@ -0,0 +1,196 @@
+"""Ratsnest and half-perimeter wirelength of placed nets."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Optional
+
+import earthground.layout as layout_lib
+from earthground.analysis import DesignAnalysis
+
+if TYPE_CHECKING:
+    import earthground.components as cmp
+    from earthground.schematic import Design
+
+
+# Nets spanning more components than this are left to planes.
+DEFAULT_MAX_NET_DEGREE = 64
+
+
+class NetWirelength(NamedTuple):
+    hpwl: float
+    mst: float
+
+
+class WirelengthDelta(NamedTuple):
+    hpwl: float
+    mst: float
+    nets: tuple[str, ...]
+
+
+def half_perimeter(xs: list[float], ys: list[float]) -> float:
+    return max(xs) - min(xs) + max(ys) - min(ys)
+
+
+def minimum_spanning_length(xs: list[float], ys: list[float]) -> float:
+    """Length of the Euclidean minimum spanning tree (Prim, O(n^2))."""
+    count = len(xs)
+    if count < 2:
+        return 0.0
+    best = [math.inf] * count
+    remaining = list(range(1, count))
+    current = 0
+    total = 0.0
+    while remaining:
+        cx, cy = xs[current], ys[current]
+        nearest_slot = 0
+        nearest = math.inf
+        for slot, index in enumerate(remaining):
+            distance = math.hypot(xs[index] - cx, ys[index] - cy)
+            if distance < best[index]:
+                best[index] = distance
+            if best[index] < nearest:
+                nearest = best[index]
+                nearest_slot = slot
+        current = remaining[nearest_slot]
+        remaining[nearest_slot] = remaining[-1]
+        remaining.pop()
+        total += nearest
+    return total
+
+
+def _pin_offsets(component: "cmp.Component") -> dict["cmp.Pin", list[tuple]]:
+    offsets: dict[cmp.Pin, list[tuple[float, float]]] = {}
+    if component.footprint is None:
+        return offsets
+    for number in component.footprint.pads:
+        pin = layout_lib.pad_pin(component, number)
+        if pin is not None:
+            center = component.footprint.get_pad_bbox(number).center()
+            offsets.setdefault(pin, []).append((center.x, center.y))
+    return offsets
+
+
+class WirelengthEngine:
+    """
+    Per-net half-perimeter wirelength and ratsnest (minimum spanning tree)
+    length over placed pad positions.
+
+    Nets come from :class:`DesignAnalysis`, pads from the flattened layout.
+    Moving a component recomputes only the nets it touches. Nets spanning more
+    than ``max_net_degree`` components are skipped: power and ground nets are
+    served by planes and would dominate both the totals and the update cost.
+    """
+
+    def __init__(
+        self,
+        design: "Design",
+        *,
+        max_net_degree: Optional[int] = DEFAULT_MAX_NET_DEGREE,
+    ):
+        placements = design.layout.flattened().placements
+        owners = {
+            item.component: refdes
+            for refdes, item in placements.items()
+            if not item.component.virtual
+        }
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        # refdes -> (terminal index, footprint-local x, y) for each connected pad
+        self._terminals: dict[str, list[tuple[int, float, float]]] = {}
+        self._component_nets: dict[str, set[str]] = {}
+        self._net_terminals: dict[str, list[int]] = {}
+        pin_offsets: dict[cmp.Component, dict] = {}
+
+        for net in DesignAnalysis(design).nets.values():
+            members = [
+                (owners[pin.parent], pin)
+                for pin in net.connections
+                if pin.parent in owners
+            ]
+            refdes_set = {refdes for refdes, _ in members}
+            if max_net_degree is not None and len(refdes_set) > max_net_degree:
+                continue
+            pads = []
+            for refdes, pin in members:
+                if pin.parent not in pin_offsets:
+                    pin_offsets[pin.parent] = _pin_offsets(pin.parent)
+                for x, y in pin_offsets[pin.parent].get(pin) or [(0.0, 0.0)]:
+                    pads.append((refdes, x, y))
+            if len(pads) < 2:
+                continue
+            terminals = []
+            for refdes, x, y in pads:
+                terminals.append(len(self.xs))
+                self._terminals.setdefault(refdes, []).append((len(self.xs), x, y))
+                self.xs.append(0.0)
+                self.ys.append(0.0)
+            self._net_terminals[net.name] = terminals
+            for refdes in refdes_set:
+                self._component_nets.setdefault(refdes, set()).add(net.name)
+
+        for refdes in self._terminals:
+            item = placements[refdes].layout
+            self._place(refdes, item.component, item.layer)
+        self.nets: dict[str, NetWirelength] = {
+            name: self._measure(name) for name in self._net_terminals
+        }
+
+    @property
+    def hpwl(self) -> float:
+        return math.fsum(metrics.hpwl for metrics in self.nets.values())
+
+    @property
+    def mst(self) -> float:
+        return math.fsum(metrics.mst for metrics in self.nets.values())
+
+    def _place(
+        self, refdes: str, position: layout_lib.Position, layer: layout_lib.Layer
+    ) -> None:
+        radians = math.radians(position.angle)
+        cos_a, sin_a = math.cos(radians), math.sin(radians)
+        mirror = -1.0 if layer == layout_lib.Layer.BOTTOM else 1.0
+        for index, x, y in self._terminals[refdes]:
+            x *= mirror
+            self.xs[index] = x * cos_a - y * sin_a + position.x
+            self.ys[index] = x * sin_a + y * cos_a + position.y
+
+    def _measure(self, name: str) -> NetWirelength:
+        terminals = self._net_terminals[name]
+        xs = [self.xs[index] for index in terminals]
+        ys = [self.ys[index] for index in terminals]
+        return NetWirelength(half_perimeter(xs, ys), minimum_spanning_length(xs, ys))
+
+    def update(self, placements: Mapping[str, layout_lib.Placement]) -> WirelengthDelta:
+        """Move components to new placements and return the wirelength change."""
+        touched: set[str] = set()
+        for refdes, placement in placements.items():
+            if refdes not in self._terminals:
+                continue
+            self._place(refdes, placement.position, placement.layer)
+            touched.update(self._component_nets.get(refdes, ()))
+        hpwl = mst = 0.0
+        changed = []
+        for name in sorted(touched):
+            old = self.nets[name]
+            new = self.nets[name] = self._measure(name)
+            if new != old:
+                hpwl += new.hpwl - old.hpwl
+                mst += new.mst - old.mst
+                changed.append(name)
+        return WirelengthDelta(hpwl, mst, tuple(changed))
+
+    def move(self, refdes: str, placement: layout_lib.Placement) -> WirelengthDelta:
+        return self.update({refdes: placement})
+
+    def compare(self, other: "WirelengthEngine") -> WirelengthDelta:
+        """Wirelength change from this layout to ``other`` over shared nets."""
+        hpwl = mst = 0.0
+        changed = []
+        for name in sorted(self.nets.keys() & other.nets.keys()):
+            old, new = self.nets[name], other.nets[name]
+            if new != old:
+                hpwl += new.hpwl - old.hpwl
+                mst += new.mst - old.mst
+                changed.append(name)
+        return WirelengthDelta(hpwl, mst, tuple(changed))
@@ -0,0 +1,45 @@
+from typing import Optional, Sequence
+
+import pytest
+
+import earthground.components as cmp
+import earthground.layout as layout_lib
+from earthground.schematic import Design
+
+
+@pytest.fixture
+def resistor_chain():
+    """
+    Return a builder for a design of resistors joined end to end.
+
+    ``values`` is a resistor count or a list of values. Each resistor's pin 2
+    joins the next one's pin 1 on the matching name from ``nets`` (``N0``,
+    ``N1``, ... by default); a shorter list leaves the rest unconnected.
+    Placed resistors sit on a row from ``origin``, ``pitch`` mm apart.
+    """
+
+    def build(
+        values: int | Sequence = 3,
+        *,
+        name: str = "CHAIN",
+        placed: bool = True,
+        origin: tuple[float, float] = (0, 0),
+        pitch: float = 5,
+        nets: Optional[Sequence[str]] = None,
+    ) -> Design:
+        if isinstance(values, int):
+            values = [100] * values
+        design = Design(name)
+        parts = [design.add_component(cmp.Resistor(value)) for value in values]
+        if nets is None:
+            nets = [f"N{index}" for index in range(len(parts) - 1)]
+        for first, second, net in zip(parts, parts[1:], nets):
+            design.connect([first.pins[2], second.pins[1]], net)
+        if placed:
+            for index in range(len(parts)):
+                design.layout.placement[f"R{index + 1}"] = layout_lib.Placement(
+                    layout_lib.Position(origin[0] + pitch * index, origin[1], 0)
+                )
+        return design
+
+    return build
@@ -0,0 +1,65 @@
+import itertools
+
+import yaml
+
+import earthground.layout as layout_lib
+from earthground.autoplace import auto_place, footprint_bbox
+from earthground.library.integrated_circuits.voltage_regulators.linear import lm317
+from earthground.tools.place_with_kicad import PlaceWithKicad
+
+
+def _board_boxes(design):
+    return {
+        refdes: layout_lib.transform_bbox(
+            footprint_bbox(design.components[refdes]),
+            placement.position,
+            placement.layer,
+        )
+        for refdes, placement in design.layout.placement.items()
+    }
+
+
+def test_auto_place_keeps_explicit_placements_and_avoids_overlaps(resistor_chain):
+    design = resistor_chain(40, placed=False)
+    fixed = layout_lib.Placement(layout_lib.Position(3, 1, 90))
+    design.layout.placement["R7"] = fixed
+
+    result = auto_place(design)
+
+    assert result.fixed == ("R7",)
+    assert "R7" not in result.placements
+    assert design.layout.placement["R7"] is fixed
+    assert set(design.layout.placement) == set(design.components)
+    boxes = _board_boxes(design)
+    for (first, a), (second, b) in itertools.combinations(boxes.items(), 2):
+        overlaps = a.x1 < b.x2 and b.x1 < a.x2 and a.y1 < b.y2 and b.y1 < a.y2
+        assert not overlaps, (first, second)
+    assert result.wirelength <= result.initial_wirelength
+
+
+def test_auto_place_treats_modules_as_rigid_blocks():
+    design = lm317.LM317AMDTX.generate_design(3.3)
+    design.layout.placement.clear()
+    design.add_module(lm317.LM317AMDTX.generate_design(3.3))
+
+    result = auto_place(design, apply=False)
+
+    assert "REG1" in result.placements
+    assert not any(refdes.startswith("REG1_") for refdes in result.placements)
+    assert design.layout.placement == {}
+
+
+def test_place_with_kicad_writes_auto_placements_to_sidecar(tmp_path, resistor_chain):
+    yaml_path = tmp_path / "board.yaml"
+    yaml_path.write_text("R1: {x: 0, y: 0, rotation: 0}\n")
+    tool = PlaceWithKicad(tmp_path / "board.py", yaml_path=yaml_path)
+    tool.design = resistor_chain(3, placed=False)
+    tool.descriptions = tool.build_description_map(tool.design)
+
+    result = tool.auto_place_unplaced()
+
+    document = yaml.safe_load(yaml_path.read_text())
+    assert result.fixed == ("R1",)
+    assert document["placements"]["R1"] == {"x": 0, "y": 0, "rotation": 0}
+    assert set(document["placements"]) == {"R1", "R2", "R3"}
+    assert document["placements"]["R2"]["layer"] == "TOP"
@@ -0,0 +1,186 @@
+import earthground.components as cmp
+import earthground.layout as layout_lib
+import pytest
+from earthground.drc import find_placement_overlaps
+from earthground.footprints.qfn import PackageSize, Qfn
+from earthground.importers.kicad import KicadFootprint
+from earthground.schematic import Design, SchematicValidationError
+
+
+def _design(positions):
+    design = Design("DRC")
+    for refdes, (x, y, layer) in positions.items():
+        design.add_component(cmp.Resistor(100))
+        design.layout.placement[refdes] = layout_lib.Placement(
+            layout_lib.Position(x, y, 0), layer=layer
+        )
+    return design
+
+
+def test_placement_overlaps_reports_same_side_pairs_only():
+    top, bottom = layout_lib.Layer.TOP, layout_lib.Layer.BOTTOM
+    design = _design(
+        {
+            "R1": (0, 0, top),
+            "R2": (0.5, 0, top),
+            "R3": (20, 0, top),
+            "R4": (0.5, 0, bottom),
+        }
+    )
+
+    overlaps = find_placement_overlaps(design)
+
+    assert [(item.first, item.second) for item in overlaps] == [("R1", "R2")]
+    assert overlaps[0].layer is top
+    assert "R1 and R2" in str(overlaps[0])
+
+
+def test_placement_overlaps_honours_clearance_and_validate_option():
+    design = _design(
+        {"R1": (0, 0, layout_lib.Layer.TOP), "R2": (0, 0, layout_lib.Layer.TOP)}
+    )
+    gap = layout_lib.courtyard_bbox(design.components["R1"]).width() + 0.2
+    design.layout.placement["R2"] = layout_lib.Placement(layout_lib.Position(gap, 0, 0))
+
+    assert find_placement_overlaps(design) == ()
+    assert len(find_placement_overlaps(design, clearance=0.5)) == 1
+
+    design.layout.placement["R2"] = layout_lib.Placement(layout_lib.Position(0, 0, 90))
+    design.validate()
+    with pytest.raises(SchematicValidationError) as error:
+        design.validate(check_placement_overlaps=True)
+    assert any("Footprints overlap" in item for item in error.value.errors)
+
+
+def _pad_center(design, refdes, number):
+    component = design.components[refdes]
+    placement = design.layout.placement[refdes]
+    return layout_lib.transform_bbox(
+        component.footprint.get_pad_bbox(number), placement.position, placement.layer
+    ).center()
+
+
+def _track(start, end, net_name, layer="F.Cu"):
+    return layout_lib.TrackSegment(
+        layout_lib.LayoutPoint(*start),
+        layout_lib.LayoutPoint(*end),
+        0.25,
+        layer,
+        net_name,
+    )
+
+
+def _routed_pair():
+    top = layout_lib.Layer.TOP
+    design = _design({"R1": (0, 0, top), "R2": (10, 0, top), "R3": (5, 5, top)})
+    r1, r2, r3 = (design.components[refdes] for refdes in ("R1", "R2", "R3"))
+    design.connect([r1.pins[2], r2.pins[1]], "SIG")
+    design.connect([r3.pins[1], r3.pins[2]], "OTHER")
+    return design
+
+
+def test_connectivity_reports_ratsnest_until_routed():
+    design = _routed_pair()
+    report = design.connectivity_report()
+    assert [(item.net_name, item.first, item.second) for item in report.unrouted] == [
+        ("OTHER", "R3.1", "R3.2"),
+        ("SIG", "R1.2", "R2.1"),
+    ]
+
+    start, end = _pad_center(design, "R1", 2), _pad_center(design, "R2", 1)
+    bend = (start.x + 2, start.y)
+    design.layout.tracks = [
+        _track(start, bend, "SIG"),
+        _track(bend, (bend[0], 3), "SIG", "B.Cu"),
+        _track((bend[0], 3), end, "SIG"),
+    ]
+    design.layout.vias = [
+        layout_lib.ViaConfig(layout_lib.Position(x, y, 0), "SIG", 0.6, 0.3)
+        for x, y in (bend, (bend[0], 3))
+    ]
+    report = design.connectivity_report()
+    assert [item.net_name for item in report.unrouted] == ["OTHER"]
+    assert report.shorts == ()
+
+    design.layout.vias = design.layout.vias[:1]
+    assert "SIG" in {item.net_name for item in design.connectivity_report().unrouted}
+
+
+def test_connectivity_reports_shorts_between_nets():
+    design = _routed_pair()
+    start, end = _pad_center(design, "R3", 1), _pad_center(design, "R3", 2)
+    design.layout.tracks = [
+        _track(start, end, "OTHER"),
+        _track((start.x + 0.5, -5), (start.x + 0.5, 10), "SIG"),
+    ]
+
+    report = design.connectivity_report()
+
+    assert [item.nets for item in report.shorts] == [("OTHER", "SIG")]
+    assert report.shorts[0].layer == "F.Cu"
+    with pytest.raises(SchematicValidationError) as error:
+        design.validate(check_connectivity=True)
+    assert any("Short between OTHER and SIG" in item for item in error.value.errors)
+
+
+class _Quad(cmp.Component):
+    def __init__(self):
+        super().__init__()
+        self.pins = cmp.PinContainer.from_count(24, self)
+        self.footprint = Qfn(24, PackageSize.S4_0MMx4_0MM, 0.5)
+
+
+@pytest.mark.parametrize("angle", [0, 45, 90, 135])
+def test_connectivity_checks_rotated_fine_pitch_pads_by_their_outline(angle):
+    design = Design("DRC")
+    quad = _Quad()
+    design.add_component(quad)
+    (refdes,) = design.components
+    design.layout.placement[refdes] = layout_lib.Placement(
+        layout_lib.Position(10, 10, angle)
+    )
+    design.connect([quad.pins[1]], "A")
+    design.connect([quad.pins[2]], "B")
+
+    # The pads are 0.25 mm wide at 0.5 mm pitch; turned 45 degrees their
+    # board-aligned boxes overlap although the copper stays 0.25 mm apart.
+    assert design.connectivity_report().shorts == ()
+
+    center = _pad_center(design, refdes, 1)
+    design.layout.vias = [
+        layout_lib.ViaConfig(layout_lib.Position(center.x, center.y, 0), "B", 0.2, 0.1)
+    ]
+    assert [item.nets for item in design.connectivity_report().shorts] == [("A", "B")]
+
+
+def test_connectivity_ignores_paste_only_pads_under_vias():
+    design = Design("DRC")
+    part = cmp.Component("U")
+    part.name = "Paste"
+    part.pins = cmp.PinContainer.from_dict({1: "P1", 2: "P2"}, part)
+    part.footprint = KicadFootprint(
+        "Test",
+        "Paste",
+        """
+        (footprint "Paste"
+          (version 20240108)
+          (generator "test")
+          (layer "F.Cu")
+          (pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Paste"))
+          (pad "2" smd rect (at 3 0) (size 1 1) (layers "F.Cu" "F.Paste"))
+        )
+        """.strip(),
+    )
+    design.add_component(part)
+    (refdes,) = design.components
+    design.layout.placement[refdes] = layout_lib.Placement(
+        layout_lib.Position(10, 10, 0)
+    )
+    design.connect([part.pins[1]], "A")
+    design.connect([part.pins[2]], "B")
+    design.layout.vias = [
+        layout_lib.ViaConfig(layout_lib.Position(x, 10, 0), "B", 0.6, 0.3)
+        for x in (10, 13)
+    ]
+
+    assert design.connectivity_report().shorts == ()
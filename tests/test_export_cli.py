@@ -230,3 +230,53 @@ def test_export_kicad_rejects_a_project_directory(tmp_path, capsys):
 
     assert main(["export", "kicad", str(project)]) == 2
     assert "Earthground design file not found" in capsys.readouterr().err
+
+
+def test_export_kicad_incremental_keeps_board_routing(tmp_path, capsys):
+    design_file = _create_design_file(
+        tmp_path,
+        module_name="incremental_board",
+        module_source="\n".join(
+            [
+                "from earthground.components import Resistor",
+                "from earthground.schematic import Design",
+                "",
+                "design = Design('Incremental Board')",
+                "design.add_component(Resistor('1k'))",
+                "",
+            ]
+        ),
+    )
+    output_path = export_kicad_project(design_file)
+    routed = '\t(segment (start 0 0) (end 1 0) (width 0.2) (layer "F.Cu"))\n'
+    text = output_path.read_text(encoding="utf-8")
+    output_path.write_text(text[: text.rindex(")")] + routed + ")\n")
+    capsys.readouterr()
+
+    assert main(["export", "kicad", "--incremental", str(design_file)]) == 0
+    assert "Updated 0 of 1 footprints" in capsys.readouterr().out
+    assert routed in output_path.read_text(encoding="utf-8")
+
+
+def test_export_kicad_renders_footprints_on_workers(tmp_path, capsys):
+    design_file = _create_design_file(
+        tmp_path,
+        module_name="worker_board",
+        module_source="\n".join(
+            [
+                "from earthground.components import Resistor",
+                "from earthground.schematic import Design",
+                "",
+                "design = Design('Worker Board')",
+                "design.add_component(Resistor('1k'))",
+                "design.add_component(Resistor('2k'))",
+                "",
+            ]
+        ),
+    )
+
+    assert main(["export", "kicad", "--workers", "2", str(design_file)]) == 0
+
+    output_path = design_file.parent / "generated_outputs" / "Worker Board.kicad_pcb"
+    assert "Wrote board file" in capsys.readouterr().out
+    assert output_path.read_text(encoding="utf-8").count("(footprint ") == 2
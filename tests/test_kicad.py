@@ -1,10 +1,14 @@
+import functools
+import re
+
 import pytest
-from pykicad import FootprintBuilder
+from pykicad import FootprintBuilder, PcbBuilder, read_from_string, write_to_string
 from pykicad.models.base import Point
 import pykicad.models.pcb as pcb
 
 import earthground.components as cmp
 import earthground.exporters.kicad as kicad
+import earthground.exporters.kicad_board_text as kicad_board_text
 import earthground.footprints.passives as pfp
 import earthground.layout as layout_lib
 from earthground.importers.kicad import KicadFootprint
@@ -391,3 +395,232 @@ def test_kicad_export_keeps_module_port_connected_resistors_on_parent_net():
     }
     assert pad_nets_by_reference["LS1_R1"][0] == "SIG_0"
     assert pad_nets_by_reference["LS1_R2"][0] == "SIG_0"
+
+
+def test_parallel_footprint_render_matches_serial_export(tmp_path, capsys):
+    def build(workers):
+        design = Design("TEST")
+        for index in range(6):
+            design.add_component(cmp.Resistor(f"{index + 1}k"))
+            design.layout.placement[f"R{index + 1}"] = layout_lib.Placement(
+                layout_lib.Position(5 * index, 2, 90 * index),
+                layer=layout_lib.Layer.BOTTOM if index % 2 else layout_lib.Layer.TOP,
+            )
+        imported = cmp.Component("U")
+        imported.name = "Imported"
+        imported.pins = cmp.PinContainer.from_dict({1: "P1"}, imported)
+        imported.footprint = KicadFootprint(
+            "Test",
+            "Imported",
+            """
+            (footprint "Imported"
+              (version 20240108)
+              (generator "test")
+              (layer "F.Cu")
+              (pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Cu"))
+            )
+            """.strip(),
+        )
+        design.add_component(imported)
+        resistors = list(design.components.values())
+        design.connect([resistors[0].pins[1], imported.pins[1]], "SIG")
+        design.connect([resistor.pins[2] for resistor in resistors[:6]], "GND")
+
+        folder = tmp_path / str(workers)
+        folder.mkdir()
+        kicad.KicadExporter(design, workers=workers).save(folder)
+        return (folder / "TEST.kicad_pcb").read_text(encoding="utf-8")
+
+    def normalized(text):
+        return re.sub(r"[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}", "", text)
+
+    serial = build(1)
+    parallel = build(2)
+
+    assert normalized(parallel) == normalized(serial)
+    board = read_from_string(parallel).model
+    assert [kicad.get_index(item) for item in board.footprint] == [
+        f"R{index}" for index in range(1, 7)
+    ] + ["U1"]
+    assert [pad.net.name for pad in board.footprint[-1].pads] == ["SIG"]
+
+
+@pytest.fixture
+def incremental_design(resistor_chain):
+    return functools.partial(resistor_chain, name="INCREMENTAL", nets=["SIG"])
+
+
+def _board_items(path):
+    board = kicad_board_text.split_board(path.read_text(encoding="utf-8"))
+    return {
+        kicad_board_text.footprint_reference(item) or item: item for item in board.items
+    }
+
+
+def test_incremental_save_regenerates_only_changed_footprints(
+    tmp_path, capsys, incremental_design
+):
+    kicad.KicadExporter(incremental_design(["1k", "2k", "3k"])).save(tmp_path)
+    path = tmp_path / "INCREMENTAL.kicad_pcb"
+    routed = (
+        '\t(segment (start 0 0) (end 5 0) (width 0.2) (layer "F.Cu") (net "SIG"))\n'
+    )
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text[: text.rindex(")")] + routed + ")\n", encoding="utf-8")
+    before = _board_items(path)
+
+    exporter = kicad.KicadExporter(incremental_design(["1k", "2k", "4.7k"]))
+    exporter.save(tmp_path, incremental=True)
+    after = _board_items(path)
+
+    assert "Updated 1 of 3 footprints" in capsys.readouterr().out
+    assert list(after) == list(before)
+    assert after["R1"] == before["R1"]
+    assert after["R2"] == before["R2"]
+    assert after["R3"] != before["R3"]
+    assert '"RES_4.7kΩ"' in after["R3"]
+    assert routed in after
+
+    unchanged = kicad.KicadExporter(incremental_design(["1k", "2k", "4.7k"]))
+    unchanged.save(tmp_path, incremental=True)
+    assert _board_items(path) == after
+
+
+def test_incremental_update_adds_and_removes_footprints(tmp_path, incremental_design):
+    kicad.KicadExporter(incremental_design(["1k", "2k", "3k"])).save(tmp_path)
+    path = tmp_path / "INCREMENTAL.kicad_pcb"
+
+    result = kicad.KicadExporter(incremental_design(["1k", "2k"])).update_board(path)
+    assert result.regenerated == ()
+    assert result.removed == ("R3",)
+    assert [
+        kicad_board_text.footprint_reference(item)
+        for item in kicad_board_text.split_board(path.read_text()).items
+        if kicad_board_text.item_tag(item) == "footprint"
+    ] == ["R1", "R2"]
+
+    result = kicad.KicadExporter(
+        incremental_design(["1k", "2k", "3k", "4k"])
+    ).update_board(path)
+    assert result.regenerated == ("R3", "R4")
+    assert read_from_string(path.read_text()).model.footprint[-1].name == "RES_4kΩ"
+
+
+def test_incremental_save_refuses_a_changed_outline(
+    tmp_path, capsys, incremental_design
+):
+    def design(width):
+        design = incremental_design(["1k", "2k"])
+        design.layout.outline = layout_lib.BoundingBox(x1=0, y1=0, x2=width, y2=20)
+        return design
+
+    path = tmp_path / "INCREMENTAL.kicad_pcb"
+    kicad.KicadExporter(design(30)).save(tmp_path)
+    kicad.KicadExporter(design(30)).save(tmp_path, incremental=True)
+    assert "Updated 0 of 2 footprints" in capsys.readouterr().out
+    before = path.read_text(encoding="utf-8")
+
+    with pytest.raises(ValueError, match="layout outline changed"):
+        kicad.KicadExporter(design(40)).save(tmp_path, incremental=True)
+    assert path.read_text(encoding="utf-8") == before
+
+    kicad.KicadExporter(design(40)).save(tmp_path, overwrite=True)
+    kicad.KicadExporter(design(40)).save(tmp_path, incremental=True)
+    board = read_from_string(path.read_text(encoding="utf-8")).model
+    assert [item.end.x for item in board.graphic_item] == [40]
+
+
+def test_streamed_board_text_matches_canonical_writer(
+    tmp_path, monkeypatch, incremental_design
+):
+    design = incremental_design(["1k", "2k", "3k"])
+    design.layout.tracks.extend(
+        layout_lib.TrackSegment(
+            start=layout_lib.LayoutPoint(index, 0),
+            end=layout_lib.LayoutPoint(index + 1, 0),
+            width=0.2,
+            layer="F.Cu",
+            net_name="SIG",
+        )
+        for index in range(5)
+    )
+    design.layout.zones.append(
+        layout_lib.Zone(
+            net_name="SIG",
+            layers=("B.Cu",),
+            outline=(
+                layout_lib.LayoutPoint(0, 0),
+                layout_lib.LayoutPoint(10, 0),
+                layout_lib.LayoutPoint(10, 10),
+            ),
+        )
+    )
+    exporter = kicad.KicadExporter(design)
+    exporter.convert_to_kicad(design)
+    exporter.draw_board_outline()
+    exporter.board.title_block = {"title": "Streamed"}
+    monkeypatch.setattr(
+        kicad_board_text,
+        "STREAMED_FIELDS",
+        {"footprint": 2, "graphic_item": 1, "track": 2, "zone": 1},
+    )
+
+    path = tmp_path / "streamed.kicad_pcb"
+    kicad_board_text.write_board(path, exporter.board)
+
+    assert path.read_text(encoding="utf-8") == write_to_string(exporter.board)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_export_resolves_nets_and_copper_layers_once(
+    tmp_path, monkeypatch, incremental_design
+):
+    path = tmp_path / "legacy.kicad_pcb"
+    path.write_text(
+        "(kicad_pcb\n"
+        "\t(version 20240108)\n"
+        '\t(generator "pcbnew")\n'
+        '\t(layers (0 "F.Cu" signal) (31 "B.Cu" signal))\n'
+        '\t(net 0 "")\n'
+        '\t(net 4 "GND")\n'
+        ")\n",
+        encoding="utf-8",
+    )
+    design = incremental_design(["1k", "2k"])
+    design.join_net(list(design.components.values())[1].pins[2], "GND")
+    design.layout.tracks.extend(
+        layout_lib.TrackSegment(
+            start=layout_lib.LayoutPoint(index, 0),
+            end=layout_lib.LayoutPoint(index + 1, 0),
+            width=0.2,
+            layer="F.Cu",
+            net_name="ROUTED" if index else "GND",
+        )
+        for index in range(3)
+    )
+    exporter = kicad.KicadExporter(design, pcb_path=path)
+    layer_lookups = []
+    copper_layers = PcbBuilder.copper_layers
+    monkeypatch.setattr(
+        PcbBuilder,
+        "copper_layers",
+        property(
+            lambda builder: layer_lookups.append(1) or copper_layers.fget(builder)
+        ),
+    )
+
+    def ensure_net(builder, name):
+        raise AssertionError(f"net {name} was resolved outside the export table")
+
+    monkeypatch.setattr(PcbBuilder, "ensure_net", ensure_net)
+    exporter.convert_to_kicad(design)
+
+    assert [(net.code, net.name) for net in exporter.board.net] == [
+        (0, ""),
+        (4, "GND"),
+        (5, "SIG"),
+        (6, "ROUTED"),
+    ]
+    assert [track.net for track in exporter.board.track] == [4, 6, 6]
+    assert exporter.board.footprint[1].pads[1].net == pcb.NetRef(code=4, name="GND")
+    assert len(layer_lookups) == 1
@@ -1,11 +1,17 @@
+import dataclasses
+import importlib
 import importlib.util
 import json
+import os
+import pickle
+import sys
 from pathlib import Path
 
 import pytest
 import yaml
 
 import earthground.kicad.catalog as catalog
+import earthground.kicad.footprint_index as footprint_index
 from earthground.cli import main as earthground_main
 from earthground.footprint_types import KicadFootprintRef
 from earthground.importers.kicad import KicadImporter
@@ -22,6 +28,12 @@ def _make_library(root: Path, library: str, footprints: list[str]) -> Path:
     return library_path
 
 
+@pytest.fixture(autouse=True)
+def _user_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("EARTHGROUND_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user-cache"))
+
+
 def _write_config(
     project: Path,
     footprint_root: Path,
@@ -162,19 +174,25 @@ def test_initialize_force_preserves_non_kicad_config(tmp_path, monkeypatch):
     assert document["kicad"]["footprint_root"] == str(root)
 
 
-def test_scan_footprints_uses_root_precedence_and_sorted_output(tmp_path):
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_footprints_uses_root_precedence_and_sorted_output(tmp_path, workers):
     custom = tmp_path / "custom"
     standard = tmp_path / "standard"
     _make_library(custom, "Library", ["Shared", "Custom"])
     _make_library(standard, "Library", ["Shared", "Standard"])
+    _make_library(standard, "Another", ["Part"])
+    (standard / "Library.pretty" / "notes.txt").write_text("", encoding="utf-8")
+    (standard / "Stray.pretty").with_suffix(".zip").write_text("", encoding="utf-8")
 
-    entries = catalog.scan_footprints([custom, standard])
+    entries = catalog.scan_footprints([custom, standard], workers=workers)
 
     assert [entry.canonical_name for entry in entries] == [
+        "Another:Part",
         "Library:Custom",
         "Library:Shared",
         "Library:Standard",
     ]
+    assert entries[2].path == custom / "Library.pretty" / "Shared.kicad_mod"
 
 
 def test_render_catalog_normalizes_identifiers_and_preserves_values(tmp_path):
@@ -271,10 +289,66 @@ def test_environment_generation_writes_autocomplete_exports(tmp_path):
     catalog.generate_catalog(context)
 
     exports = (package / "_generated_exports.pyi").read_text(encoding="utf-8")
-    assert "from ._generated import Package_QFN as Package_QFN" in exports
+    assert "from ._libraries.package_qfn import Package_QFN as Package_QFN" in exports
     assert catalog.catalog_is_fresh(context)
 
 
+def test_environment_catalog_imports_only_referenced_libraries(tmp_path, monkeypatch):
+    root = tmp_path / "footprints"
+    _make_library(root, "Package_QFN", ["QFN-16"])
+    _make_library(root, "Resistor_SMD", ["R_0603"])
+    package = tmp_path / "lazy_catalog"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    entries = catalog.scan_footprints([root])
+    installation = catalog.KicadInstallation(None, root, "10.0")
+    context = catalog.CatalogContext(
+        project=catalog.get_project_paths(tmp_path),
+        config=catalog.KicadConfig(),
+        installation=installation,
+        roots=(root,),
+        output=catalog.environment_catalog_path(package),
+        environment_output=True,
+        entries=entries,
+        fingerprint=catalog.calculate_fingerprint(installation, [root], entries),
+    )
+    catalog.generate_catalog(context)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in list(sys.modules):
+        if name.startswith("lazy_catalog"):
+            monkeypatch.delitem(sys.modules, name)
+
+    index = importlib.import_module("lazy_catalog._generated")
+
+    assert index.__all__ == ["Package_QFN", "Resistor_SMD"]
+    assert "lazy_catalog._libraries.package_qfn" not in sys.modules
+    member = index.Package_QFN.QFN_16
+    assert member.footprint_name == "QFN-16"
+    assert "lazy_catalog._libraries.package_qfn" in sys.modules
+    assert "lazy_catalog._libraries.resistor_smd" not in sys.modules
+    assert pickle.loads(pickle.dumps(member)) is member
+    with pytest.raises(AttributeError):
+        index.Missing_Library
+
+    _make_library(root, "Diode_SMD", ["D_0603"])
+    (package / "_libraries" / "resistor_smd.py").unlink()
+    rescanned = catalog.scan_footprints([root])
+    catalog.generate_catalog(
+        dataclasses.replace(
+            context,
+            entries=tuple(
+                entry for entry in rescanned if entry.library != "Package_QFN"
+            ),
+            fingerprint="changed",
+        )
+    )
+    assert sorted(path.name for path in (package / "_libraries").glob("*.py")) == [
+        "__init__.py",
+        "diode_smd.py",
+        "resistor_smd.py",
+    ]
+
+
 def test_ensure_environment_catalog_initializes_project(tmp_path, monkeypatch):
     project = tmp_path / "board"
     project.mkdir()
@@ -296,6 +370,105 @@ def test_ensure_environment_catalog_initializes_project(tmp_path, monkeypatch):
     assert (project / ".earthground" / "kicad-catalog.json").is_file()
 
 
+def test_detection_is_memoized_per_executable_stat(tmp_path, monkeypatch):
+    project_root = tmp_path / "board"
+    root = tmp_path / "footprints"
+    _make_library(root, "Library", ["Footprint"])
+    _write_config(project_root, root)
+    project = catalog.get_project_paths(project_root)
+    executable = tmp_path / "kicad-cli"
+    executable.write_text("", encoding="utf-8")
+    versions = []
+    monkeypatch.setattr(
+        catalog,
+        "get_kicad_version",
+        lambda path: versions.append(path) or "10.0",
+    )
+    monkeypatch.setattr(catalog, "_INSTALLATIONS", {})
+
+    def detect():
+        return catalog.detect_kicad_installation(
+            executable=executable, footprint_root=root, project=project
+        )
+
+    assert detect().version == "10.0"
+    assert detect().version == "10.0"
+    assert len(versions) == 1
+
+    # A new process only has the record in the project metadata.
+    monkeypatch.setattr(catalog, "_INSTALLATIONS", {})
+    assert detect() == catalog.KicadInstallation(executable, root, "10.0")
+    assert len(versions) == 1
+    stored = json.loads(
+        (project_root / ".earthground" / "kicad-installations.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    assert len(stored["installations"]) == 1
+
+    executable.write_text("upgraded", encoding="utf-8")
+    detect()
+    assert len(versions) == 2
+    stored = json.loads(
+        (project_root / ".earthground" / "kicad-installations.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    assert len(stored["installations"]) == 1
+
+
+def test_ensure_environment_catalog_skips_rescan_until_stamps_change(
+    tmp_path, monkeypatch
+):
+    project = tmp_path / "board"
+    root = tmp_path / "footprints"
+    library = _make_library(root, "Package_QFN", ["QFN-16"])
+    executable = tmp_path / "kicad-cli"
+    executable.write_text("", encoding="utf-8")
+    _write_config(project, root)
+    config = project / ".earthground" / "config.yaml"
+    config.write_text(
+        config.read_text(encoding="utf-8").replace(
+            "executable: null", f"executable: {executable}"
+        ),
+        encoding="utf-8",
+    )
+    package = tmp_path / "kicad_package"
+    monkeypatch.setenv("EARTHGROUND_PROJECT_ROOT", str(project))
+    versions = []
+    monkeypatch.setattr(
+        catalog,
+        "get_kicad_version",
+        lambda path: versions.append(path) or "10.0",
+    )
+
+    assert catalog.ensure_environment_catalog(package) is not None
+    assert len(versions) == 1
+    scans = []
+    real_scan = catalog.scan_footprints
+    monkeypatch.setattr(
+        catalog,
+        "scan_footprints",
+        lambda roots: scans.append(roots) or real_scan(roots),
+    )
+
+    assert catalog.ensure_environment_catalog(package) is None
+    assert scans == [] and len(versions) == 1
+
+    (library / "QFN-20.kicad_mod").write_text('(footprint "QFN-20")')
+    os.utime(library, ns=(1, 1))
+    context = catalog.ensure_environment_catalog(package)
+    assert context is not None and len(scans) == 1
+    library_module = package / "_libraries" / "package_qfn.py"
+    assert "QFN_20" in library_module.read_text(encoding="utf-8")
+    assert catalog.ensure_environment_catalog(package) is None
+
+    executable.write_text("upgraded", encoding="utf-8")
+    assert catalog.ensure_environment_catalog(package) is not None
+    # Same version and directories: the shared cache supplies the scan.
+    assert len(scans) == 1 and len(versions) == 2
+
+
 def test_importer_accepts_generated_enum_and_legacy_strings(tmp_path, monkeypatch):
     project = tmp_path / "board"
     root = tmp_path / "footprints"
@@ -314,6 +487,56 @@ def test_importer_accepts_generated_enum_and_legacy_strings(tmp_path, monkeypatc
     assert enum_footprint.name == "Test-Footprint"
 
 
+def test_new_project_reuses_shared_scan_and_rendering(tmp_path, monkeypatch):
+    root = tmp_path / "footprints"
+    _make_library(root, "Package_QFN", ["QFN-16", "QFN-20"])
+    first, second = tmp_path / "first", tmp_path / "second"
+    _write_config(first, root)
+    _write_config(second, root)
+    scans = []
+    real_scan = catalog.scan_footprints
+    monkeypatch.setattr(
+        catalog,
+        "scan_footprints",
+        lambda roots: scans.append(roots) or real_scan(roots),
+    )
+    renders = []
+    real_render = catalog.render_library_catalog
+    monkeypatch.setattr(
+        catalog,
+        "render_library_catalog",
+        lambda context: renders.append(context) or real_render(context),
+    )
+
+    contexts = []
+    for project in (first, second):
+        context = catalog.resolve_context(
+            package_directory=project / "venv" / "kicad", project_root=project
+        )
+        assert catalog.generate_catalog(context)
+        contexts.append(context)
+
+    assert len(scans) == 1 and len(renders) == 1
+    assert not contexts[0].shared_scan and contexts[1].shared_scan
+    assert contexts[1].entries == contexts[0].entries
+    assert (
+        contexts[1].entries[0].path == root / "Package_QFN.pretty" / "QFN-16.kicad_mod"
+    )
+    assert (second / "venv" / "kicad" / "_generated.py").read_text(
+        encoding="utf-8"
+    ) == (first / "venv" / "kicad" / "_generated.py").read_text(encoding="utf-8")
+    assert (second / ".earthground" / "kicad-catalog.json").is_file()
+    shared = tmp_path / "user-cache" / "earthground" / "catalogs"
+    assert (shared / contexts[0].fingerprint / "entries.json").is_file()
+
+    _make_library(root, "Package_SO", ["SOIC-8"])
+    context = catalog.resolve_context(
+        package_directory=second / "venv" / "kicad", project_root=second
+    )
+    assert not context.shared_scan and len(scans) == 2
+    assert context.fingerprint != contexts[0].fingerprint
+
+
 def test_importer_can_use_only_an_explicit_custom_root(tmp_path, monkeypatch):
     project = tmp_path / "board"
     project.mkdir()
@@ -339,6 +562,7 @@ def test_cli_generate_and_status(tmp_path, capsys):
 
     stdout = capsys.readouterr().out
     assert "Footprints: 1" in stdout
+    assert "Footprint scan: " in stdout
     assert "Catalog status: current" in stdout
 
 
@@ -475,6 +699,102 @@ def test_hierarchical_cli_get_lists_all_libraries_and_footprints(tmp_path, capsy
     }
 
 
+def test_footprint_index_reads_only_changed_files(tmp_path, monkeypatch):
+    root = tmp_path / "footprints"
+    library = _make_library(root, "Package_TO_SOT_SMD", ["SOT-23", "SOT-23-6"])
+    (library / "SOT-23-6.kicad_mod").write_text(
+        '(footprint "SOT-23-6" (descr "SOT, 6 Pin, 0.95 pitch") '
+        '(tags "SOT TO_SOT_SMD") (pad "1" smd rect) (pad "2" smd rect) '
+        '(pad "2" smd rect) (pad "" np_thru_hole circle))',
+        encoding="utf-8",
+    )
+    index = footprint_index.FootprintIndex(tmp_path / "index.sqlite3")
+    reads = []
+    real_summary = footprint_index.summarize_footprint
+    monkeypatch.setattr(
+        footprint_index,
+        "summarize_footprint",
+        lambda path: reads.append(path.name) or real_summary(path),
+    )
+
+    assert index.refresh(catalog.scan_footprints([root])) == 2
+    assert index.refresh(catalog.scan_footprints([root])) == 0
+    sot = index.footprints("Package_TO_SOT_SMD")[1]
+    assert sot.description == "SOT, 6 Pin, 0.95 pitch"
+    assert sot.tags == "SOT TO_SOT_SMD"
+    assert sot.pad_count == 2
+
+    (library / "SOT-23.kicad_mod").write_text(
+        '(footprint "SOT-23" (descr "SOT, 3 Pin"))', encoding="utf-8"
+    )
+    os.utime(library / "SOT-23.kicad_mod", ns=(1, 1))
+    (library / "SOT-23-6.kicad_mod").unlink()
+    index.close()
+    reopened = footprint_index.FootprintIndex(tmp_path / "index.sqlite3")
+
+    assert reopened.refresh(catalog.scan_footprints([root])) == 1
+    assert sorted(reads) == [
+        "SOT-23-6.kicad_mod",
+        "SOT-23.kicad_mod",
+        "SOT-23.kicad_mod",
+    ]
+    assert [(item.name, item.description) for item in reopened.footprints()] == [
+        ("SOT-23", "SOT, 3 Pin")
+    ]
+
+
+def test_footprint_search_ranks_words_trigrams_and_filters(tmp_path, capsys):
+    project = tmp_path / "board"
+    root = tmp_path / "footprints"
+    sot = _make_library(root, "Package_TO_SOT_SMD", ["SOT-23", "SOT-23-6"])
+    qfn = _make_library(root, "Package_DFN_QFN", ["QFN-16-1EP_3x3mm"])
+    (sot / "SOT-23-6.kicad_mod").write_text(
+        '(footprint "SOT-23-6" (descr "SOT, 6 Pin, 0.95 pitch") '
+        '(tags "SOT TO_SOT_SMD") '
+        + " ".join(f'(pad "{number}" smd rect)' for number in range(1, 7))
+        + ")",
+        encoding="utf-8",
+    )
+    (qfn / "QFN-16-1EP_3x3mm.kicad_mod").write_text(
+        '(footprint "QFN-16-1EP_3x3mm" (descr "QFN, 16 Pin") (tags "QFN NoLead"))',
+        encoding="utf-8",
+    )
+    _write_config(project, root)
+    index = footprint_index.FootprintIndex(tmp_path / "index.sqlite3")
+    index.refresh(catalog.scan_footprints([root]))
+
+    matches = index.search("SOT-23-6 with 0.95 pitch")
+    assert [match.footprint.name for match in matches] == ["SOT-23-6", "SOT-23"]
+    assert matches[0].score > matches[1].score
+    assert [match.footprint.name for match in index.search("qfn16")] == [
+        "QFN-16-1EP_3x3mm"
+    ]
+    assert [match.footprint.name for match in index.search("SOT", pad_count=0)] == [
+        "SOT-23"
+    ]
+    assert index.search("SOT", library="Package_DFN_QFN") == []
+
+    result = earthground_main(
+        [
+            "kicad",
+            "catalog",
+            "search",
+            "--project-root",
+            str(project),
+            "--json",
+            "--pads",
+            "6",
+            "sot",
+        ]
+    )
+
+    assert result == 0
+    found = json.loads(capsys.readouterr().out)
+    assert [(item["reference"], item["pad_count"]) for item in found] == [
+        ("Package_TO_SOT_SMD:SOT-23-6", 6)
+    ]
+
+
 def test_hierarchical_cli_get_can_list_one_library(tmp_path, capsys):
     project = tmp_path / "board"
     root = tmp_path / "footprints"
@@ -524,3 +844,99 @@ def test_hierarchical_cli_get_accepts_separate_names(tmp_path, capsys):
     output = capsys.readouterr().out
     assert "Reference: Library:Footprint" in output
     assert "Description: (none provided)" in output
+
+
+def test_importer_reuses_parsed_footprints_until_file_changes(tmp_path, monkeypatch):
+    project = tmp_path / "board"
+    project.mkdir()
+    root = tmp_path / "footprints"
+    library = _make_library(root, "Custom", ["Cached"])
+    monkeypatch.setenv("EARTHGROUND_PROJECT_ROOT", str(project))
+    monkeypatch.setattr(catalog, "detect_kicad_installation", lambda **kwargs: None)
+    importer = KicadImporter([root])
+
+    first = importer.import_footprint("Custom", "Cached")
+    second = KicadImporter([root]).import_footprint("Custom", "Cached")
+
+    assert first is not second
+    assert first.footprint is second.footprint
+    assert first.pads is not second.pads
+
+    path = library / "Cached.kicad_mod"
+    path.write_text('(footprint "Cached" (descr "edited"))', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    edited = importer.import_footprint("Custom", "Cached")
+    assert edited.footprint is not first.footprint
+    assert "edited" in edited.sexp
+
+
+def test_importer_loads_footprints_from_persistent_cache(tmp_path, monkeypatch):
+    import earthground.importers.kicad as kicad_importer
+
+    project = tmp_path / "board"
+    project.mkdir()
+    root = tmp_path / "footprints"
+    library = _make_library(root, "Custom", ["Stored"])
+    monkeypatch.setenv("EARTHGROUND_PROJECT_ROOT", str(project))
+    monkeypatch.setenv("EARTHGROUND_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(catalog, "detect_kicad_installation", lambda **kwargs: None)
+
+    parsed = KicadImporter([root]).import_footprint("Custom", "Stored")
+    assert (tmp_path / "cache" / "footprint-cache.sqlite3").is_file()
+
+    def fail(text):
+        raise AssertionError("footprint was parsed again")
+
+    kicad_importer.clear_footprint_cache()
+    monkeypatch.setattr(kicad_importer, "read_from_string", fail)
+    restored = KicadImporter([root]).import_footprint("Custom", "Stored")
+    assert restored.footprint == parsed.footprint
+    assert restored.sexp == parsed.sexp
+
+    path = library / "Stored.kicad_mod"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    kicad_importer.clear_footprint_cache()
+    assert KicadImporter([root]).import_footprint("Custom", "Stored").sexp
+
+    path.write_text('(footprint "Stored" (descr "edited"))', encoding="utf-8")
+    kicad_importer.clear_footprint_cache()
+    with pytest.raises(AssertionError, match="parsed again"):
+        KicadImporter([root]).import_footprint("Custom", "Stored")
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_import_many_resolves_by_precedence_and_warms_cache(
+    tmp_path, monkeypatch, processes
+):
+    import earthground.importers.kicad as kicad_importer
+
+    project = tmp_path / "board"
+    project.mkdir()
+    first_root = tmp_path / "first"
+    second_root = tmp_path / "second"
+    _make_library(first_root, "Shared", ["Both"])
+    _make_library(second_root, "Shared", ["Both", "Second"])
+    monkeypatch.setenv("EARTHGROUND_PROJECT_ROOT", str(project))
+    monkeypatch.setenv("EARTHGROUND_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(catalog, "detect_kicad_installation", lambda **kwargs: None)
+    kicad_importer.clear_footprint_cache()
+
+    class Refs(KicadFootprintRef):
+        Second = ("Shared", "Second")
+
+    importer = KicadImporter([first_root, second_root])
+    footprints = importer.import_many(
+        [("Shared", "Both"), Refs.Second, ("Shared", "Both")], processes=processes
+    )
+
+    assert list(footprints) == [("Shared", "Both"), Refs.Second]
+    assert footprints[Refs.Second].name == "Second"
+    both = importer.import_footprint("Shared", "Both")
+    assert both.footprint is footprints[("Shared", "Both")].footprint
+    assert importer.get_footprint_path("Shared", "Both").parent.parent == first_root
+
+    with pytest.raises(FileNotFoundError, match="'Shared:Missing'"):
+        importer.import_many([("Shared", "Missing")])
@@ -233,3 +233,15 @@ def test_rotated_imported_footprint_composes_all_pad_angles(angle):
         (0.5, 0.5),
         (2.75, 6.2),
     ]
+
+
+def test_kicad_footprint_courtyard_bbox_uses_crtyd_graphics():
+    courtyard = SOIC_8.removesuffix(")") + (
+        "  (fp_rect (start -3.7 -2.7) (end 3.7 2.7)\n"
+        '    (stroke (width 0.05) (type solid)) (layer "F.CrtYd"))\n)'
+    )
+    footprint = KicadFootprint("Test", "SOIC-8", courtyard)
+
+    assert footprint.get_courtyard_bbox() == ft.BoundingBox(-3.7, -2.7, 3.7, 2.7)
+    bare = KicadFootprint("Test", "SOIC-8", SOIC_8)
+    assert bare.get_courtyard_bbox() == bare.get_bbox()
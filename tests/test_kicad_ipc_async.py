@@ -0,0 +1,215 @@
+import asyncio
+import threading
+
+import pynng
+import pytest
+from kipy.errors import ConnectionError as KicadConnectionError
+from kipy.proto.board import board_types_pb2 as board
+from kipy.proto.common import ApiRequest, ApiResponse, ApiStatusCode
+from kipy.proto.common.commands import editor_commands_pb2 as editor
+from kipy.proto.common.types.base_types_pb2 import DocumentType
+from kipy.proto.common.types.enums_pb2 import KiCadObjectType
+
+import earthground.schematic as sch_lib
+from earthground.ipc.kicad_ipc import BatchUpdate, FootprintPosition
+from earthground.ipc.kicad_ipc_async import AsyncKicadIpc
+
+OBJECT_TYPES = {
+    board.FootprintInstance: KiCadObjectType.KOT_PCB_FOOTPRINT,
+    board.Track: KiCadObjectType.KOT_PCB_TRACE,
+    board.Via: KiCadObjectType.KOT_PCB_VIA,
+    board.Zone: KiCadObjectType.KOT_PCB_ZONE,
+}
+
+
+class StandInKicad:
+    """Answers the KiCad API requests KicadIpc makes, over a local socket."""
+
+    def __init__(self, address):
+        self.items = {}
+        self.commands = []
+        self.lock = threading.Lock()
+        self.release_updates = threading.Event()
+        self.release_updates.set()
+        self._socket = pynng.Rep0(listen=address, recv_timeout=50)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def add_footprint(self, item_id, refdes, x_mm, y_mm):
+        fp = board.FootprintInstance()
+        fp.id.value = item_id
+        fp.reference_field.text.text.text = refdes
+        fp.position.x_nm = round(x_mm * 1e6)
+        fp.position.y_nm = round(y_mm * 1e6)
+        fp.layer = board.BoardLayer.BL_F_Cu
+        with self.lock:
+            self.items[item_id] = fp
+
+    def position(self, item_id):
+        with self.lock:
+            position = self.items[item_id].position
+            return position.x_nm / 1e6, position.y_nm / 1e6
+
+    def _serve(self):
+        while True:
+            try:
+                data = self._socket.recv()
+            except pynng.Timeout:
+                continue
+            except pynng.Closed:
+                return
+            request = ApiRequest()
+            request.ParseFromString(data)
+            name = request.message.TypeName().rsplit(".", 1)[-1]
+            command = getattr(editor, name)()
+            request.message.Unpack(command)
+            if name == "UpdateItems":
+                self.release_updates.wait()
+            with self.lock:
+                self.commands.append(name)
+                response = getattr(self, f"_{name}")(command)
+            reply = ApiResponse()
+            reply.status.status = ApiStatusCode.AS_OK
+            reply.message.Pack(response)
+            self._socket.send(reply.SerializeToString())
+
+    def _GetOpenDocuments(self, command):
+        response = editor.GetOpenDocumentsResponse()
+        response.documents.add().type = DocumentType.DOCTYPE_PCB
+        return response
+
+    def _GetItems(self, command):
+        response = editor.GetItemsResponse()
+        for item in self.items.values():
+            if OBJECT_TYPES[type(item)] in command.types:
+                response.items.add().Pack(item)
+        return response
+
+    def _UpdateItems(self, command):
+        response = editor.UpdateItemsResponse()
+        for packed in command.items:
+            item = board.FootprintInstance()
+            packed.Unpack(item)
+            self.items[item.id.value] = item
+            response.updated_items.add().item.Pack(item)
+        return response
+
+    def _BeginCommit(self, command):
+        response = editor.BeginCommitResponse()
+        response.id.value = "commit"
+        return response
+
+    def _EndCommit(self, command):
+        return editor.EndCommitResponse()
+
+    def close(self):
+        self.release_updates.set()
+        self._socket.close()
+        self._thread.join()
+
+
+@pytest.fixture
+def kicad(tmp_path):
+    server = StandInKicad(f"ipc://{tmp_path}/api.sock")
+    server.add_footprint("fp-r1", "R1", 1, 2)
+    server.add_footprint("fp-r2", "R2", 3, 4)
+    yield server
+    server.close()
+
+
+def _connect(tmp_path):
+    return AsyncKicadIpc.connect(
+        sch_lib.Design("ASYNC"), socket_path=f"ipc://{tmp_path}/api.sock"
+    )
+
+
+def test_async_client_reads_moves_and_batches(kicad, tmp_path):
+    async def session():
+        async with await _connect(tmp_path) as ipc:
+            positions = await ipc.get_all_positions()
+            await ipc.move("R1", 10, 20)
+            update = await ipc.move_delta("R2", 1, 1)
+            kicad.commands.clear()
+            async with ipc.batch("Spread"):
+                await ipc.move("R1", 30, 0)
+                await ipc.push_positions({"R2": FootprintPosition(40, 0)})
+            snapshot = await ipc.get_board_snapshot()
+            return positions, update, snapshot, ipc.ipc.history
+
+    positions, update, snapshot, history = asyncio.run(session())
+
+    assert positions["R1"] == FootprintPosition(1, 2)
+    assert update.new == FootprintPosition(4, 5)
+    assert kicad.commands[:4] == [
+        "GetItems",
+        "BeginCommit",
+        "UpdateItems",
+        "EndCommit",
+    ]
+    assert kicad.position("fp-r1") == (30, 0)
+    assert snapshot.positions["R2"] == FootprintPosition(40, 0)
+    assert isinstance(history[-1], BatchUpdate) and history[-1].message == "Spread"
+
+
+def test_change_stream_yields_edits_until_cancelled(kicad, tmp_path):
+    async def session():
+        async with await _connect(tmp_path) as ipc:
+            events = asyncio.Queue()
+
+            async def follow():
+                async for change in ipc.changes(interval=0.01, max_interval=0.02):
+                    await events.put(change)
+
+            task = asyncio.create_task(follow())
+            first = await asyncio.wait_for(events.get(), 5)
+            kicad.add_footprint("fp-r1", "R1", 7, 8)
+            second = await asyncio.wait_for(events.get(), 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            reads = kicad.commands.count("GetItems")
+            await asyncio.sleep(0.1)
+            return first, second, reads
+
+    first, second, reads = asyncio.run(session())
+
+    assert first.previous is None
+    assert first.changes == {"footprints": {"R1", "R2"}}
+    assert second.changes == {"footprints": {"R1"}}
+    assert second.state.positions["R1"] == FootprintPosition(7, 8)
+    assert kicad.commands.count("GetItems") == reads
+
+
+def test_cancelled_call_waiting_for_the_worker_is_withdrawn(kicad, tmp_path):
+    async def session():
+        async with await _connect(tmp_path) as ipc:
+            await ipc.get_all_positions()
+            kicad.release_updates.clear()
+            sent = asyncio.create_task(ipc.move("R1", 10, 10))
+            queued = asyncio.create_task(ipc.move("R2", 20, 20))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            await asyncio.sleep(0.01)
+            kicad.release_updates.set()
+            await sent
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            return await ipc.get_all_positions()
+
+    positions = asyncio.run(session())
+
+    assert positions["R1"] == FootprintPosition(10, 10)
+    assert positions["R2"] == FootprintPosition(3, 4)
+
+
+def test_connect_raises_after_last_retry(tmp_path):
+    async def session():
+        await AsyncKicadIpc.connect(
+            sch_lib.Design("ASYNC"),
+            socket_path=f"ipc://{tmp_path}/missing.sock",
+            retries=2,
+            delay=0,
+        )
+
+    with pytest.raises(KicadConnectionError):
+        asyncio.run(session())
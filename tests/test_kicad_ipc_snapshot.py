@@ -1,16 +1,202 @@
 from types import SimpleNamespace
 
+import pytest
+
+import kipy.board_types as board_types
 from kipy.proto.board.board_types_pb2 import BoardLayer
-from kipy.geometry import Vector2
+from kipy.geometry import Angle, Vector2
 
 import earthground.layout as layout_lib
-from earthground.ipc.kicad_ipc import KicadIpc
+import earthground.schematic as sch_lib
+from earthground.ipc.kicad_ipc import BatchUpdate, FootprintPosition, KicadIpc
 
 
 def _net(name):
     return SimpleNamespace(name=name)
 
 
+def _footprint(refdes, x, y):
+    return SimpleNamespace(
+        reference_field=SimpleNamespace(text=SimpleNamespace(value=refdes)),
+        position=Vector2.from_xy_mm(x, y),
+        orientation=Angle.from_degrees(0),
+        layer=BoardLayer.Value("BL_F_Cu"),
+    )
+
+
+class FakeBoard:
+    def __init__(self, footprints):
+        self.footprints = footprints
+        self.tracks = []
+        self.fetches = 0
+        self.updates = []
+
+    def get_footprints(self):
+        self.fetches += 1
+        return list(self.footprints)
+
+    def get_tracks(self):
+        return list(self.tracks)
+
+    def get_vias(self):
+        return []
+
+    def get_zones(self):
+        return []
+
+    def update_items(self, items):
+        self.updates.append([item.reference_field.text.value for item in items])
+        return list(items)
+
+    def begin_commit(self):
+        self.updates.append("begin")
+        return object()
+
+    def push_commit(self, commit, message=""):
+        self.updates.append(("push", message))
+
+    def drop_commit(self, commit):
+        self.updates.append("drop")
+
+
+def _ipc(board):
+    kicad = SimpleNamespace(get_board=lambda: board)
+    ipc = KicadIpc.__new__(KicadIpc)
+    ipc.design = sch_lib.Design("IPC")
+    ipc._kicad = kicad
+    ipc._board = board
+    ipc._refdes_to_component = {}
+    ipc._history = []
+    ipc._footprints = None
+    ipc._batch = None
+    return ipc
+
+
+def test_ipc_bulk_push_is_served_from_one_footprint_fetch():
+    board = FakeBoard([_footprint(f"R{index}", index, 0) for index in range(50)])
+    ipc = _ipc(board)
+
+    ipc.push_positions(
+        {f"R{index}": FootprintPosition(index, 10) for index in range(50)}
+    )
+
+    assert board.fetches == 1
+    assert board.updates == [[f"R{index}" for index in range(50)]]
+    assert ipc.get_position("R49").y_mm == 10
+
+
+def test_ipc_moves_start_from_the_current_board():
+    board = FakeBoard([_footprint("R1", 0, 0)])
+    ipc = _ipc(board)
+    assert ipc.get_position("R1").layer == "F.Cu"
+
+    edited = _footprint("R1", 3, 0)
+    edited.layer = BoardLayer.Value("BL_B_Cu")
+    board.footprints = [edited]
+    update = ipc.move_delta("R1", 1, 0, 90)
+
+    assert (update.old.x_mm, update.new.x_mm, update.new.angle_deg) == (3, 4, 90)
+    assert update.new.layer == "B.Cu"
+    assert ipc.get_position("R1").layer == "B.Cu"
+
+
+def test_ipc_batch_sends_one_commit_and_one_history_entry():
+    board = FakeBoard([_footprint(f"R{index}", 0, 0) for index in range(3)])
+    ipc = _ipc(board)
+    component = SimpleNamespace(parameters={})
+    ipc._refdes_to_component["R0"] = component
+
+    with ipc.batch("Arrange"):
+        for index in range(3):
+            ipc.move(f"R{index}", index, 1)
+        ipc.move_delta("R0", 2, 0, 90)
+        with ipc.batch():
+            ipc.push_positions({"R2": FootprintPosition(9, 9)})
+        assert board.updates == [] and component.parameters == {}
+        assert board.fetches == 1
+
+    assert board.updates == ["begin", ["R0", "R1", "R2"], ("push", "Arrange")]
+    assert component.parameters["_position"]["x_mm"] == 2
+    (entry,) = ipc.history
+    assert isinstance(entry, BatchUpdate) and len(entry.updates) == 5
+    assert ipc.get_position("R2").x_mm == 9
+
+
+def test_ipc_batch_of_pushed_positions_records_one_history_entry():
+    board = FakeBoard([_footprint(f"R{index}", index, 0) for index in range(2)])
+    ipc = _ipc(board)
+
+    with ipc.batch("Push"):
+        ipc.push_positions(
+            {"R0": FootprintPosition(5, 5), "R1": FootprintPosition(6, 6)}
+        )
+
+    assert board.updates == ["begin", ["R0", "R1"], ("push", "Push")]
+    (entry,) = ipc.history
+    assert entry.message == "Push"
+    assert [(item.refdes, item.old.x_mm, item.new.x_mm) for item in entry.updates] == [
+        ("R0", 0, 5),
+        ("R1", 1, 6),
+    ]
+
+
+def test_ipc_batch_sends_nothing_when_the_block_raises():
+    board = FakeBoard([_footprint("R1", 0, 0)])
+    ipc = _ipc(board)
+
+    with pytest.raises(RuntimeError), ipc.batch():
+        ipc.move("R1", 5, 5)
+        raise RuntimeError("stop")
+
+    assert board.updates == [] and ipc.history == []
+    assert ipc._footprints is None
+
+
+def _kicad_track(identifier, x):
+    track = board_types.Track()
+    track.proto.id.value = identifier
+    track.start = Vector2.from_xy_mm(x, 0)
+    track.end = Vector2.from_xy_mm(x, 5)
+    track.width = 250_000
+    track.layer = BoardLayer.Value("BL_F_Cu")
+    net = board_types.Net()
+    net.name = "GND"
+    track.net = net
+    return track
+
+
+def test_ipc_board_state_converts_only_changed_items(monkeypatch):
+    footprint = board_types.FootprintInstance()
+    footprint.reference_field.text.value = "R1"
+    footprint.position = Vector2.from_xy_mm(1, 2)
+    board = FakeBoard([footprint])
+    board.tracks = [_kicad_track("a", 0), _kicad_track("b", 1)]
+    ipc = _ipc(board)
+    converted = []
+    real_track = KicadIpc._track.__func__
+    monkeypatch.setattr(
+        KicadIpc,
+        "_track",
+        classmethod(
+            lambda cls, item: converted.append(item.id.value) or real_track(cls, item)
+        ),
+    )
+
+    first = ipc.get_board_state()
+    assert first.positions["R1"].x_mm == 1
+    assert ipc.get_board_state(first).changes(first) == {}
+
+    board.tracks[1] = _kicad_track("b", 7)
+    board.tracks.append(_kicad_track("c", 2))
+    footprint.position = Vector2.from_xy_mm(4, 2)
+    second = ipc.get_board_state(first)
+
+    assert converted == ["a", "b", "b", "c"]
+    assert second.changes(first) == {"footprints": {"R1"}, "tracks": {"b", "c"}}
+    assert second.tracks["a"] is first.tracks["a"]
+    assert second.tracks["b"].value.start.x == 7
+
+
 def test_ipc_converts_straight_and_arc_tracks_to_layout_geometry():
     segment = SimpleNamespace(
         start=Vector2.from_xy_mm(1, 2),
@@ -0,0 +1,89 @@
+import re
+
+import pytest
+from pykicad import read_from_string
+from pykicad.models.base import Point
+
+import earthground.exporters.kicad as kicad
+import earthground.layout as layout_lib
+from earthground.exporters.kicad_panel import KicadPanelExporter, panel_grid
+
+UUID = re.compile(r"[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}")
+
+
+@pytest.fixture
+def panel_design(resistor_chain):
+    def build():
+        design = resistor_chain(["1k", "2k"], name="PANEL", origin=(2, 3), nets=["SIG"])
+        design.layout.tracks.append(
+            layout_lib.TrackSegment(
+                start=layout_lib.LayoutPoint(1, 2),
+                end=layout_lib.LayoutPoint(3, 2),
+                width=0.25,
+                layer="F.Cu",
+                net_name="SIG",
+            )
+        )
+        return design
+
+    return build
+
+
+def _panel_board(exporter):
+    return read_from_string("".join(exporter.iter_panel_text())).model
+
+
+def test_single_unprefixed_copy_matches_design_export(tmp_path, capsys, panel_design):
+    kicad.KicadExporter(panel_design()).save(tmp_path)
+    panel = KicadPanelExporter(
+        panel_design(), [layout_lib.Position(0, 0, 0)], refdes_prefix=""
+    ).save(tmp_path)
+
+    assert "with 1 copies" in capsys.readouterr().out
+    expected = (tmp_path / "PANEL.kicad_pcb").read_text(encoding="utf-8")
+    assert UUID.sub("", panel.read_text(encoding="utf-8")) == UUID.sub("", expected)
+
+
+def test_panel_copies_prefix_refdes_and_nets_and_move_items(panel_design):
+    exporter = KicadPanelExporter(panel_design(), panel_grid(2, 1, 20, 0))
+    board = _panel_board(exporter)
+
+    references = [footprint.property[0].value for footprint in board.footprint]
+    assert references == ["P1_R1", "P1_R2", "P2_R1", "P2_R2"]
+    assert [(fp.at.x, fp.at.y) for fp in board.footprint] == [
+        (2, 3),
+        (7, 3),
+        (22, 3),
+        (27, 3),
+    ]
+    pad_nets = {pad.net.name for fp in board.footprint for pad in fp.pads if pad.net}
+    assert pad_nets == {"P1_SIG", "P2_SIG"}
+    assert [(track.start, track.net) for track in board.track] == [
+        (Point(x=1, y=2), "P1_SIG"),
+        (Point(x=21, y=2), "P2_SIG"),
+    ]
+    assert len(board.graphic_item) == 2
+    identifiers = UUID.findall("".join(exporter.iter_panel_text()))
+    assert len(identifiers) == len(set(identifiers))
+
+
+def test_rotated_copy_turns_footprints_pads_and_tracks(panel_design):
+    exporter = KicadPanelExporter(
+        panel_design(), [layout_lib.Position(0, 0, 0), layout_lib.Position(50, 0, 90)]
+    )
+    board = _panel_board(exporter)
+
+    base, turned = board.footprint[0], board.footprint[2]
+    assert turned.at.x == pytest.approx(50 - base.at.y)
+    assert turned.at.y == pytest.approx(base.at.x)
+    assert turned.at.angle == pytest.approx(base.at.angle - 90)
+    assert [pad.at.angle for pad in turned.pads] == pytest.approx(
+        [pad.at.angle - 90 for pad in base.pads]
+    )
+    assert board.track[1].start.x == pytest.approx(48)
+    assert board.track[1].start.y == pytest.approx(1)
+
+
+def test_panel_rejects_off_axis_rotation(panel_design):
+    with pytest.raises(ValueError, match="multiple of 90"):
+        KicadPanelExporter(panel_design(), [layout_lib.Position(0, 0, 45)])
@@ -1,7 +1,11 @@
+import dataclasses
+import json
+
 import pytest
 
 import earthground.components as cmp
 import earthground.layout as layout_lib
+from earthground.footprints.qfn import PackageSize, Qfn
 from earthground.library.integrated_circuits.voltage_regulators.linear import lm317
 from earthground.schematic import Design
 from earthground.models.layout_models import LayoutPlacementMap
@@ -213,3 +217,144 @@ def test_get_placement_keeps_left_reference_on_left_when_rotated_180():
     assert placement.id.x > 0
     assert placement.id.y == 0
     assert placement.id.angle == 180.0
+
+
+def _nested_design():
+    child = Design("Child", "CH")
+    child.add_component(cmp.Resistor(100))
+    child.layout.placement["R1"] = layout_lib.Placement(
+        layout_lib.Position(2, 1, 90), id=layout_lib.Orientation.TOP
+    )
+    child.layout.silk.append(
+        layout_lib.SilkLine(layout_lib.Position(0, 0, 0), layout_lib.Position(1, 0, 0))
+    )
+    parent = Design("Parent")
+    parent.add_module(child)
+    parent.layout.placement["CH1"] = layout_lib.Placement(
+        layout_lib.Position(10, 20, 90), layer=layout_lib.Layer.BOTTOM
+    )
+    return parent, child
+
+
+def test_flattened_layout_composes_module_transforms():
+    parent, _ = _nested_design()
+
+    flattened = parent.layout.flatten_with_provenance()
+
+    resistor = flattened["CH1_R1"].layout
+    assert resistor.component.x == pytest.approx(9)
+    assert resistor.component.y == pytest.approx(22)
+    assert resistor.component.angle == 180
+    assert resistor.layer == layout_lib.Layer.BOTTOM
+    assert resistor.id == layout_lib.rotate_position(
+        parent.modules[0].layout.get_placement("R1").id, 90
+    )
+    (silk,) = parent.layout.flatten_silk()
+    assert (silk.start.x, silk.start.y) == (10, 20)
+    assert silk.end.x == pytest.approx(10)
+    assert silk.end.y == pytest.approx(21)
+    assert silk.layer == layout_lib.Layer.BOTTOM
+
+
+def test_flattened_layout_is_cached_until_its_inputs_change():
+    parent, child = _nested_design()
+
+    first = parent.layout.flattened()
+    assert parent.layout.flattened() is first
+
+    child.layout.placement["R1"] = layout_lib.Placement(layout_lib.Position(0, 0, 0))
+    second = parent.layout.flattened()
+    assert second is not first
+    assert second.placements["CH1_R1"].layout.component.x == 10
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parent.layout.placement["CH1"].position = layout_lib.Position(0, 0, 0)
+    parent.layout.placement["CH1"] = dataclasses.replace(
+        parent.layout.placement["CH1"], position=layout_lib.Position(0, 0, 0)
+    )
+    third = parent.layout.flattened()
+    assert third.placements["CH1_R1"].layout.component.x == 0
+
+    child.layout.silk[0] = layout_lib.SilkLine(
+        layout_lib.Position(0, 0, 0), layout_lib.Position(2, 0, 0)
+    )
+    (silk,) = parent.layout.flattened().silk
+    assert (silk.end.x, silk.end.y) == (2, 0)
+
+
+def test_flattened_fallbacks_follow_footprint_reassignment():
+    design = Design("TEST")
+    first = design.add_component(cmp.Resistor(100))
+    design.add_component(cmp.Resistor(100))
+
+    passive = first.footprint
+    before = design.layout.flattened().placements["R2"].layout.component.x
+    first.footprint = Qfn(24, PackageSize.S4_0MMx4_0MM, 0.5)
+    after = design.layout.flattened().placements["R2"].layout.component.x
+
+    assert after - before == pytest.approx(
+        first.footprint.get_bbox().width() - passive.get_bbox().width()
+    )
+
+
+def test_flatten_with_provenance_warns_on_cached_fallbacks(caplog):
+    design = Design("TEST")
+    design.add_component(cmp.Resistor(100))
+    design.layout.flattened()
+
+    with caplog.at_level("WARNING"):
+        flattened = design.layout.flatten_with_provenance()
+
+    assert flattened["R1"].provenance is layout_lib.PlacementProvenance.FALLBACK
+    assert "Component R1 is floating in TEST" in caplog.text
+
+
+def test_layout_cache_mirror_skips_validation_until_yaml_changes(tmp_path, monkeypatch):
+    design = Design("TEST")
+    design.add_component(cmp.Resistor(100))
+    yaml_path = tmp_path / "layout.yaml"
+    yaml_path.write_text("""
+schema_version: 1
+placements:
+  R1: {x: 1, y: 2, rotation: 90, layer: bottom}
+tracks:
+  - type: arc
+    net: GND
+    layer: b.cu
+    width: 0.15
+    start: {x: 3, y: 4}
+    mid: {x: 4, y: 5}
+    end: {x: 5, y: 4}
+vias: []
+""".lstrip())
+
+    design.layout.load_layout_from_yaml(yaml_path, use_cache=True)
+    expected_tracks = list(design.layout.tracks)
+    assert layout_lib.layout_cache_path(yaml_path).is_file()
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("unchanged sidecar should load from the mirror")
+
+    monkeypatch.setattr(layout_lib.LayoutFileModel, "model_validate", fail_validation)
+    reloaded = Design("TEST")
+    reloaded.add_component(cmp.Resistor(100))
+    reloaded.layout.load_layout_from_yaml(yaml_path, use_cache=True)
+    assert reloaded.layout.placement == design.layout.placement
+    assert reloaded.layout.placement["R1"].layer == layout_lib.Layer.BOTTOM
+    assert reloaded.layout.tracks == expected_tracks
+    assert reloaded.layout.vias == []
+    assert reloaded.layout.zones == []
+
+    monkeypatch.undo()
+    yaml_path.write_text("R1: {x: 7, y: 8, rotation: 0}\n")
+    reloaded.layout.load_layout_from_yaml(yaml_path, use_cache=True)
+    assert reloaded.layout.placement["R1"].position == layout_lib.Position(7, 8, 0)
+    assert reloaded.layout.tracks == expected_tracks
+
+    cache_path = layout_lib.layout_cache_path(yaml_path)
+    cached = json.loads(cache_path.read_text())
+    cached["layout"]["placements"]["R1"][3] = "SIDEWAYS"
+    cache_path.write_text(json.dumps(cached))
+    reloaded.layout.load_layout_from_yaml(yaml_path, use_cache=True)
+    assert reloaded.layout.placement["R1"].layer == layout_lib.Layer.TOP
+    assert json.loads(cache_path.read_text())["layout"]["placements"]["R1"][3] == "TOP"
@@ -2,13 +2,33 @@ from types import SimpleNamespace
 
 import yaml
 
+import earthground.components as cmp
 import earthground.layout as layout_lib
+import earthground.tools.place_with_kicad as place_with_kicad
 from earthground.cli import main as cli_main
+from earthground.ipc.board_state import COPPER_SECTIONS, BoardState, ItemState
 from earthground.schematic import Design
 from earthground.library.integrated_circuits.voltage_regulators.linear import lm317
 from earthground.tools.place_with_kicad import PlaceWithKicad
 
 
+def _board_state(snapshot) -> BoardState:
+    """State of an already converted snapshot, keying copper by content."""
+
+    def by_content(items):
+        return {repr(item): ItemState(repr(item), item) for item in items}
+
+    return BoardState(
+        footprints={
+            refdes: ItemState((pos.x_mm, pos.y_mm, pos.angle_deg, pos.layer), pos)
+            for refdes, pos in snapshot.positions.items()
+        },
+        tracks=by_content(snapshot.tracks),
+        vias=by_content(snapshot.vias),
+        zones=by_content(snapshot.zones),
+    )
+
+
 def test_merge_yaml_changes_updates_only_changed_entries():
     existing = {
         "R1": {"x": 1.0, "y": 2.0, "layer": "TOP", "rotation": 0.0},
@@ -36,20 +56,6 @@ def test_position_changed_uses_same_thresholds_as_polling():
     assert PlaceWithKicad.position_changed(old, changed) is True
 
 
-def test_changed_refs_reuses_position_changed_logic():
-    old = {
-        "R1": SimpleNamespace(x_mm=1.0, y_mm=2.0, angle_deg=0.0, layer="F.Cu"),
-        "C1": SimpleNamespace(x_mm=3.0, y_mm=4.0, angle_deg=0.0, layer="F.Cu"),
-    }
-    new = {
-        "R1": SimpleNamespace(x_mm=1.0, y_mm=2.0, angle_deg=0.0, layer="F.Cu"),
-        "C1": SimpleNamespace(x_mm=3.0, y_mm=4.1, angle_deg=0.0, layer="F.Cu"),
-        "U1": SimpleNamespace(x_mm=5.0, y_mm=6.0, angle_deg=0.0, layer="F.Cu"),
-    }
-
-    assert PlaceWithKicad.changed_refs(old, new) == ["C1", "U1"]
-
-
 def test_position_to_yaml_entry_converts_kicad_angle_to_layout_angle():
     pos = SimpleNamespace(x_mm=1.0, y_mm=2.0, angle_deg=-90.0, layer="F.Cu")
 
@@ -190,6 +196,7 @@ def test_normalize_yaml_document_migrates_legacy_placements():
 
 def test_copper_snapshot_serialization_is_deterministic():
     snapshot = SimpleNamespace(
+        positions={},
         tracks=(
             layout_lib.TrackSegment(
                 start=layout_lib.LayoutPoint(5, 4),
@@ -214,7 +221,17 @@ def test_copper_snapshot_serialization_is_deterministic():
         ),
     )
 
-    sections = PlaceWithKicad.copper_to_yaml_sections(snapshot)
+    state = _board_state(snapshot)
+    entries = {section: {} for section in COPPER_SECTIONS}
+    PlaceWithKicad.update_copper_entries(
+        entries,
+        state,
+        {section: set(getattr(state, section)) for section in COPPER_SECTIONS},
+    )
+    sections = {
+        section: PlaceWithKicad.copper_section(entries[section])
+        for section in COPPER_SECTIONS
+    }
 
     assert sections["tracks"][0]["start"] == {"x": 3, "y": 2}
     assert sections["tracks"][0]["end"] == {"x": 5, "y": 4}
@@ -241,9 +258,9 @@ def test_poll_loop_persists_deletion_of_last_track(tmp_path):
     )
 
     class FakeIpc:
-        def get_board_snapshot(self):
+        def get_board_state(self, previous=None):
             try:
-                return next(snapshots)
+                return _board_state(next(snapshots))
             except StopIteration:
                 raise KeyboardInterrupt
 
@@ -321,3 +338,114 @@ def test_earthground_kicad_place_reports_runtime_errors(tmp_path, monkeypatch, c
         capsys.readouterr().err
         == "earthground kicad place: error: KiCad is unavailable\n"
     )
+
+
+def test_poll_loop_reports_live_wirelength_delta(tmp_path, capsys):
+    design = Design("TEST")
+    first = design.add_component(cmp.Resistor(100))
+    second = design.add_component(cmp.Resistor(100))
+    design.connect([first.pins[2], second.pins[1]], "SIG")
+
+    def position(x):
+        return SimpleNamespace(x_mm=x, y_mm=0.0, angle_deg=0.0, layer="F.Cu")
+
+    snapshots = iter(
+        [
+            SimpleNamespace(
+                positions={"R1": position(0), "R2": position(5)},
+                tracks=(),
+                vias=(),
+                zones=(),
+            ),
+            SimpleNamespace(
+                positions={"R1": position(0), "R2": position(8)},
+                tracks=(),
+                vias=(),
+                zones=(),
+            ),
+        ]
+    )
+
+    class FakeIpc:
+        def get_board_state(self, previous=None):
+            try:
+                return _board_state(next(snapshots))
+            except StopIteration:
+                raise KeyboardInterrupt
+
+    yaml_path = tmp_path / "layout.yaml"
+    yaml_path.write_text("schema_version: 1\nplacements: {}\n")
+    tool = PlaceWithKicad(
+        script_path=tmp_path / "design.py",
+        yaml_path=yaml_path,
+        poll_interval=0,
+    )
+    tool.design = design
+
+    tool.poll_loop(FakeIpc())
+
+    output = capsys.readouterr().out
+    assert "(+3.0), ratsnest" in output
+    assert "across 1 net(s)" in output
+
+
+def test_poll_loop_backs_off_while_idle_and_converts_only_changed_items(
+    tmp_path, monkeypatch
+):
+    track = layout_lib.TrackSegment(
+        start=layout_lib.LayoutPoint(1, 2),
+        end=layout_lib.LayoutPoint(3, 4),
+        width=0.25,
+        layer="F.Cu",
+        net_name="GND",
+    )
+
+    def snapshot(x):
+        position = SimpleNamespace(x_mm=x, y_mm=2.0, angle_deg=0.0, layer="F.Cu")
+        return SimpleNamespace(
+            positions={"R1": position}, tracks=(track,), vias=(), zones=()
+        )
+
+    states = iter(_board_state(snapshot(x)) for x in (1.0, 1.0, 1.0, 4.0, 4.0))
+
+    class FakeIpc:
+        def get_board_state(self, previous=None):
+            try:
+                return next(states)
+            except StopIteration:
+                raise KeyboardInterrupt
+
+    sleeps, conversions, writes = [], [], []
+    monkeypatch.setattr(place_with_kicad.time, "sleep", sleeps.append)
+    real_track_entry = PlaceWithKicad.track_to_yaml_entry
+    monkeypatch.setattr(
+        PlaceWithKicad,
+        "track_to_yaml_entry",
+        classmethod(
+            lambda cls, item: conversions.append(item) or real_track_entry(item)
+        ),
+    )
+    real_write = PlaceWithKicad.write_yaml
+    monkeypatch.setattr(
+        PlaceWithKicad,
+        "write_yaml",
+        staticmethod(lambda path, data: writes.append(path) or real_write(path, data)),
+    )
+    yaml_path = tmp_path / "layout.yaml"
+    yaml_path.write_text("schema_version: 1\nplacements: {}\n")
+    tool = PlaceWithKicad(
+        script_path=tmp_path / "design.py",
+        yaml_path=yaml_path,
+        poll_interval=1,
+        max_poll_interval=4,
+    )
+    tool.design = Design("TEST")
+
+    tool.poll_loop(FakeIpc())
+
+    assert sleeps == [2, 4, 1, 2]
+    assert len(conversions) == 1
+    assert len(writes) == 2
+    written = yaml.safe_load(yaml_path.read_text())
+    assert written["placements"]["R1"]["x"] == 4.0
+    assert "tracks" not in written
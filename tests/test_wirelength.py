@@ -0,0 +1,54 @@
+import math
+
+import pytest
+
+import earthground.layout as layout_lib
+from earthground.wirelength import WirelengthEngine, minimum_spanning_length
+
+
+def test_minimum_spanning_length_matches_known_tree():
+    assert minimum_spanning_length([0, 3, 3, 10], [0, 0, 4, 0]) == pytest.approx(
+        3 + 4 + 7
+    )
+    assert minimum_spanning_length([1], [1]) == 0
+
+
+def test_engine_measures_pad_to_pad_lengths(resistor_chain):
+    design = resistor_chain(3)
+    engine = WirelengthEngine(design)
+    pads = design.components["R1"].footprint.pads
+    pitch = abs(pads[2].location[0] - pads[1].location[0])
+
+    assert set(engine.nets) == {"N0", "N1"}
+    assert engine.nets["N0"].mst == pytest.approx(5 - pitch)
+    assert engine.nets["N0"].hpwl == pytest.approx(5 - pitch)
+    assert engine.hpwl == pytest.approx(2 * (5 - pitch))
+
+
+def test_engine_move_updates_only_touched_nets_incrementally(resistor_chain):
+    design = resistor_chain(4)
+    engine = WirelengthEngine(design)
+    before = engine.mst
+    moved = layout_lib.Placement(layout_lib.Position(5, 3, 90))
+
+    delta = engine.move("R2", moved)
+
+    assert delta.nets == ("N0", "N1")
+    assert engine.mst == pytest.approx(before + delta.mst)
+    design.layout.placement["R2"] = moved
+    fresh = WirelengthEngine(design)
+    for name, metrics in fresh.nets.items():
+        assert engine.nets[name].hpwl == pytest.approx(metrics.hpwl)
+        assert engine.nets[name].mst == pytest.approx(metrics.mst)
+    compared = WirelengthEngine(resistor_chain(4)).compare(fresh)
+    assert compared.mst == pytest.approx(delta.mst)
+    assert math.isclose(compared.hpwl, delta.hpwl, abs_tol=1e-9)
+
+
+def test_engine_skips_nets_above_degree_limit(resistor_chain):
+    design = resistor_chain(3)
+    for component in design.components.values():
+        design.join_net(component.pins[1], design.ground)
+
+    assert "GND" in WirelengthEngine(design).nets
+    assert "GND" not in WirelengthEngine(design, max_net_degree=2).nets